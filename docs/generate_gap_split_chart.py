@@ -6,90 +6,26 @@ Daily resolution rendering, monthly purchases (1st of each month).
 Plans purchased on the 1st expire exactly 1 year later (also the 1st),
 so the scheduler always catches expirations on the same run.
 
+The simulation itself lives in lambda/shared/plan_lifecycle.py. This is an
+idealized illustration; lambda/shared/backtest.py replays recorded spend
+through the real target + split strategies.
+
 Usage:
     python docs/generate_gap_split_chart.py
 """
 
+import sys
+from pathlib import Path
+
 import matplotlib.pyplot as plt
-from dataclasses import dataclass
-
-DAYS_PER_YEAR = 365
-
-# Day-of-year for the 1st of each month (non-leap year)
-MONTH_STARTS = [0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334]
-
-
-@dataclass
-class Plan:
-    coverage_pct: float
-    start_day: int
-    end_day: int
-
-
-def _monthly_purchase_days(total_years: int) -> list[int]:
-    """Generate purchase days: 1st of each month for N years."""
-    days = []
-    for year in range(total_years + 1):
-        for month_start in MONTH_STARTS:
-            day = year * DAYS_PER_YEAR + month_start
-            if day <= total_years * DAYS_PER_YEAR:
-                days.append(day)
-    return sorted(set(days))
-
-
-def build_plan_history(
-    divider: float,
-    term_years: int,
-    total_years: int,
-    min_purchase_pct: float = 1.0,
-    renewal_window_days: int = 7,
-) -> tuple[list[float], list[float], list[Plan]]:
-    """Simulate gap_split at daily resolution with monthly purchases on the 1st.
-
-    Plans expire exactly term_years later, which also falls on the 1st —
-    so the scheduler catches expirations on the same run (no gap).
-    """
-    target = 100.0
-    term_days = term_years * DAYS_PER_YEAR
-    total_days = total_years * DAYS_PER_YEAR
-    purchase_days = set(_monthly_purchase_days(total_years))
-
-    padding_days = 30
-    all_plans: list[Plan] = []
-    time_points: list[float] = []
-    coverages: list[float] = []
-    active_plans: list[Plan] = []
-
-    for day in range(-padding_days, total_days + padding_days + 1):
-        # Expire plans
-        active_plans = [p for p in active_plans if p.end_day > day]
-        current = sum(p.coverage_pct for p in active_plans)
-
-        # Record coverage
-        time_points.append(day / DAYS_PER_YEAR)
-        coverages.append(current)
-
-        # Purchase on scheduler run days (1st of each month)
-        if day in purchase_days:
-            # Scheduler treats plans expiring within renewal_window as already gone
-            effective = sum(
-                p.coverage_pct for p in active_plans
-                if p.end_day > day + renewal_window_days
-            )
-            gap = target - effective
-            if gap > 0.001:
-                divided = gap / divider
-                purchase = max(divided, min_purchase_pct)
-                if gap < min_purchase_pct:
-                    purchase = gap
-                plan = Plan(purchase, day, day + term_days)
-                active_plans.append(plan)
-                all_plans.append(plan)
-
-                # Update coverage after purchase
-                coverages[-1] = sum(p.coverage_pct for p in active_plans)
-
-    return time_points, coverages, all_plans
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lambda"))
+
+from shared.plan_lifecycle import (
+    DAYS_PER_YEAR,
+    monthly_purchase_days,
+    simulate_gap_split_lifecycle,
+)
 
 
 def generate_chart(output_path: str = "docs/images/gap-split-lifecycle.png") -> None:
@@ -100,9 +36,13 @@ def generate_chart(output_path: str = "docs/images/gap-split-lifecycle.png") ->
     # min_purchase = 1/12 of total — at most 12 plans per 1-year term
     min_purchase_pct = 100.0 / 12
 
-    time_points, coverages, all_plans = build_plan_history(
-        divider, term_years, total_years, min_purchase_pct
+    lifecycle = simulate_gap_split_lifecycle(
+        monthly_purchase_days(total_years),
+        term_days=term_years * DAYS_PER_YEAR,
+        divider=divider,
+        min_purchase_pct=min_purchase_pct,
     )
+    all_plans = lifecycle.plans
 
     _fig, (ax, ax2, ax3) = plt.subplots(
         3, 1, figsize=(12, 6.5), height_ratios=[3, 1, 1], sharex=True,
@@ -114,6 +54,12 @@ def generate_chart(output_path: str = "docs/images/gap-split-lifecycle.png") ->
     padding = 30
     sample_days = list(range(-padding, total_years * DAYS_PER_YEAR + padding + 1, sample_step))
     sample_years = [d / DAYS_PER_YEAR for d in sample_days]
+    series = lifecycle.sample(sample_days)
+
+    # Total coverage at daily resolution
+    days = range(-padding, total_years * DAYS_PER_YEAR + padding + 1)
+    time_points = [d / DAYS_PER_YEAR for d in days]
+    coverages = [lifecycle.coverage_at(d) for d in days]
 
     unique_plans = sorted(
         {(p.start_day, p.coverage_pct): p for p in all_plans}.values(),
@@ -159,12 +105,8 @@ def generate_chart(output_path: str = "docs/images/gap-split-lifecycle.png") ->
     )
 
     # === Middle: largest plan (%) + active plan count ===
-    max_plan_pcts = []
-    active_counts = []
-    for d in sample_days:
-        active = [p for p in all_plans if p.start_day <= d < p.end_day]
-        max_plan_pcts.append(max(p.coverage_pct for p in active) if active else 0.0)
-        active_counts.append(len(active))
+    max_plan_pcts = series["largest_plan"]
+    active_counts = series["active_plans"]
 
     ax2.fill_between(sample_years, max_plan_pcts, alpha=0.3, color="#c0392b")
     ax2.plot(sample_years, max_plan_pcts, color="#c0392b", linewidth=1.2, label="Largest plan")
@@ -186,14 +128,7 @@ def generate_chart(output_path: str = "docs/images/gap-split-lifecycle.png") ->
     ax2.legend(lines1 + lines2, labels1 + labels2, loc="right", fontsize=7, framealpha=0.9)
 
     # === Bottom: days until next plan expires ===
-    days_to_next_expiry = []
-    for d in sample_days:
-        active = [p for p in all_plans if p.start_day <= d < p.end_day]
-        if active:
-            next_expiry = min(p.end_day for p in active)
-            days_to_next_expiry.append(next_expiry - d)
-        else:
-            days_to_next_expiry.append(0)
+    days_to_next_expiry = series["days_to_next_expiry"]
 
     ax3.fill_between(sample_years, days_to_next_expiry, alpha=0.3, color="#27ae60")
     ax3.plot(sample_years, days_to_next_expiry, color="#27ae60", linewidth=1.2, label="Days to next expiry")
@@ -122,6 +122,25 @@ resource "aws_iam_role_policy" "scheduler_savingsplans" {
   })
 }
 
+resource "aws_iam_role_policy" "scheduler_coverage_cache" {
+  count = local.lambda_scheduler_enabled && local.coverage_cache ? 1 : 0
+
+  name = "coverage-cache"
+  role = aws_iam_role.scheduler[0].id
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [{
+      Effect = "Allow"
+      Action = [
+        "s3:GetObject",
+        "s3:PutObject"
+      ]
+      Resource = "${aws_s3_bucket.reports.arn}/coverage-cache/*"
+    }]
+  })
+}
+
 resource "aws_iam_role_policy" "scheduler_assume_role" {
   count = local.lambda_scheduler_enabled && local.lambda_scheduler_assume_role_arn != null ? 1 : 0
 
@@ -262,6 +281,25 @@ resource "aws_iam_role_policy" "purchaser_savingsplans" {
   })
 }
 
+resource "aws_iam_role_policy" "purchaser_coverage_cache" {
+  count = local.lambda_purchaser_enabled && local.coverage_cache ? 1 : 0
+
+  name = "coverage-cache"
+  role = aws_iam_role.purchaser[0].id
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [{
+      Effect = "Allow"
+      Action = [
+        "s3:GetObject",
+        "s3:PutObject"
+      ]
+      Resource = "${aws_s3_bucket.reports.arn}/coverage-cache/*"
+    }]
+  })
+}
+
 resource "aws_iam_role_policy" "purchaser_assume_role" {
   count = local.lambda_purchaser_enabled && local.lambda_purchaser_assume_role_arn != null ? 1 : 0
 
@@ -15,6 +15,7 @@ resource "aws_lambda_function" "scheduler" {
   # Performance configuration
   memory_size = local.lambda_scheduler_memory_size
   timeout     = local.lambda_scheduler_timeout
+  layers      = local.lambda_scheduler_layers
 
   # Deploy actual Lambda code from lambda/scheduler directory
   filename         = data.archive_file.scheduler.output_path
@@ -52,6 +53,7 @@ resource "aws_lambda_function" "purchaser" {
   # Performance configuration
   memory_size = local.lambda_purchaser_memory_size
   timeout     = local.lambda_purchaser_timeout
+  layers      = local.lambda_purchaser_layers
 
   # Deploy actual Lambda code from lambda/purchaser directory
   filename         = data.archive_file.purchaser.output_path
@@ -88,6 +90,7 @@ resource "aws_lambda_function" "reporter" {
   # Performance configuration
   memory_size = local.lambda_reporter_memory_size
   timeout     = local.lambda_reporter_timeout
+  layers      = local.lambda_reporter_layers
 
   # Deploy actual Lambda code from lambda/reporter directory
   filename         = data.archive_file.reporter.output_path
@@ -9,6 +9,7 @@ Usage:
     python lambda/local_runner.py scheduler
     python lambda/local_runner.py purchaser
     python lambda/local_runner.py reporter [--format html|json]
+    python lambda/local_runner.py sweep [--days N] [--workers N] [--output PATH]
 
 Environment:
     Set environment variables in .env.local file or via command line.
@@ -26,11 +27,16 @@ Example:
 
     # Generate HTML report locally
     python lambda/local_runner.py reporter --format html
+
+    # Backtest strategy parameters on the stored hourly history
+    python lambda/local_runner.py sweep --days 180
 """
 
 import argparse
+import json
 import os
 import sys
+from datetime import UTC, datetime
 from pathlib import Path
 
 
@@ -207,6 +213,53 @@ def run_reporter(args):
         raise
 
 
+def run_sweep(args):
+    """Backtest a strategy parameter grid on the local hourly history."""
+    print("\n" + "=" * 60)
+    print("Running strategy parameter sweep in LOCAL mode")
+    print("=" * 60 + "\n")
+
+    from scheduler.config import load_configuration
+
+    from shared.hourly_history import HourlyHistoryStore
+    from shared.parameter_sweep import run_parameter_sweep, spend_from_history
+    from shared.storage_adapter import StorageAdapter
+
+    config = load_configuration()
+    spend_by_type, start = spend_from_history(
+        HourlyHistoryStore(StorageAdapter()), config, days=args.days
+    )
+    if not spend_by_type:
+        print("No hourly history found in the local data directory")
+        print("Run the scheduler with COVERAGE_CACHE_BUCKET set to collect it first")
+        return None
+
+    hours = len(next(iter(spend_by_type.values())))
+    print(f"History: {hours} hours from {start.isoformat()} ({', '.join(spend_by_type)})\n")
+
+    sweep = run_parameter_sweep(spend_by_type, config, workers=args.workers, start=start)
+
+    output = args.output
+    if output is None:
+        sweeps_dir = Path(os.environ["LOCAL_DATA_DIR"]) / "sweeps"
+        sweeps_dir.mkdir(parents=True, exist_ok=True)
+        output = sweeps_dir / f"sweep-{datetime.now(UTC):%Y%m%d-%H%M%S}.json"
+    Path(output).write_text(json.dumps(sweep, indent=2))
+
+    print("\n" + "=" * 60)
+    print(f"Sweep completed: {sweep['evaluated']} backtests")
+    print("=" * 60)
+    print("\nPareto front (net savings vs. peak unused commitment):")
+    for row in sweep["pareto_front"]:
+        params = ", ".join(f"{name}={value}" for name, value in row["params"].items())
+        print(
+            f"  ${row['net_savings']:>12,.2f} saved, "
+            f"${row['peak_unused_commitment']:>8,.2f}/h peak unused  {params}"
+        )
+    print(f"\nSweep written to: {output}")
+    return sweep
+
+
 def main():
     """Main entry point for local runner."""
     parser = argparse.ArgumentParser(
@@ -217,8 +270,8 @@ def main():
 
     parser.add_argument(
         "lambda_name",
-        choices=["scheduler", "purchaser", "reporter"],
-        help="Name of the Lambda function to run",
+        choices=["scheduler", "purchaser", "reporter", "sweep"],
+        help="Name of the Lambda function to run (sweep: strategy parameter backtests)",
     )
 
     parser.add_argument(
@@ -227,6 +280,23 @@ def main():
         help="Report format for reporter Lambda (default: html)",
     )
 
+    parser.add_argument(
+        "--days",
+        type=int,
+        help="Days of hourly history the sweep replays (default: all stored)",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Processes for the sweep (default: CPU count)",
+    )
+
+    parser.add_argument(
+        "--output",
+        help="Sweep JSON path (default: LOCAL_DATA_DIR/sweeps/sweep-<timestamp>.json)",
+    )
+
     args = parser.parse_args()
 
     # Display environment info
@@ -248,6 +318,8 @@ def main():
         run_purchaser(args)
     elif args.lambda_name == "reporter":
         run_reporter(args)
+    elif args.lambda_name == "sweep":
+        run_sweep(args)
     else:
         print(f"Unknown Lambda: {args.lambda_name}")
         sys.exit(1)
@@ -1,8 +1,9 @@
 """Coverage calculation for the Purchaser Lambda.
 
-Fetches hourly coverage from Cost Explorer, discovers plans that are about to
-expire, and treats expiring plans' coverage as 0 so the purchaser queues a
-replacement.
+Fetches hourly coverage from Cost Explorer and removes the share of each SP
+type's commitment that expires within renewal_window_days (from the plan
+inventory's expiry ladder), so the purchaser sees the coverage that will remain
+and queues replacements for exactly the expiring dollars.
 """
 
 from __future__ import annotations
@@ -13,12 +14,15 @@ from typing import TYPE_CHECKING, Any
 
 from botocore.exceptions import ClientError
 
-from shared import constants
+from shared.constants import AWS_TYPE_TO_KEY
+from shared.plan_inventory import get_plan_inventory
+from shared.spending_analyzer import paginate_coverage
 
 
 if TYPE_CHECKING:
     from mypy_boto3_ce.client import CostExplorerClient
-    from mypy_boto3_savingsplans.client import SavingsPlansClient
+
+    from shared.plan_ladder import PlanLadder
 
 
 logger = logging.getLogger(__name__)
@@ -36,25 +40,30 @@ _DATABASE_SERVICES = ("rds", "relational database", "dynamodb", "database migrat
 
 
 def get_current_coverage(clients: dict[str, Any], config: dict[str, Any]) -> dict[str, float]:
-    """Current coverage % per SP type, zeroed out for any type with expiring plans."""
+    """Current coverage % per SP type, excluding commitment that is about to expire."""
     logger.info("Calculating current coverage")
 
-    today = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+    now = datetime.now(UTC)
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
     start_time = today - timedelta(hours=config["lookback_hours"])
 
     try:
         raw_coverage = _get_ce_coverage(clients["ce"], start_time, today)
-        expiring_plans = _get_expiring_plans(clients["savingsplans"], config)
-        adjusted = _zero_out_expiring(raw_coverage, expiring_plans)
+        ladder = get_plan_inventory(clients["savingsplans"]).ladder
     except ClientError as e:
         logger.error(f"Failed to calculate coverage: {e!s}")
         raise
 
+    renewal_window_days = config["renewal_window_days"]
+    logger.info(f"Excluding Savings Plans commitment expiring within {renewal_window_days} days")
+    adjusted = _exclude_expiring(
+        raw_coverage, ladder, now, now + timedelta(days=renewal_window_days)
+    )
+
     logger.info(
         f"Coverage calculated: Compute={adjusted['compute']:.2f}%, "
         f"Database={adjusted['database']:.2f}%, SageMaker={adjusted['sagemaker']:.2f}%"
     )
-    logger.info(f"Expiring plans excluded: {len(expiring_plans)} plans")
     return adjusted
 
 
@@ -64,27 +73,26 @@ def _get_ce_coverage(
     """Raw coverage % per SP type from Cost Explorer, grouped by service."""
     logger.info(f"Getting coverage from Cost Explorer for {start_time.date()} to {end_time.date()}")
 
-    response = ce_client.get_savings_plans_coverage(
-        TimePeriod={
+    params = {
+        "TimePeriod": {
             "Start": start_time.strftime("%Y-%m-%dT%H:%M:%SZ"),
             "End": end_time.strftime("%Y-%m-%dT%H:%M:%SZ"),
         },
-        Granularity="HOURLY",
-        GroupBy=[{"Type": "DIMENSION", "Key": "SERVICE"}],
-    )
+        "Granularity": "HOURLY",
+        "GroupBy": [{"Type": "DIMENSION", "Key": "SERVICE"}],
+    }
 
-    # AWS flattens per-service-per-hour entries; iterate back-to-front to
-    # capture the latest point for each service.
+    # AWS flattens per-service-per-hour entries in chronological order across
+    # pages; later points overwrite earlier ones, leaving the latest per service.
     service_latest: dict[str, dict[str, float]] = {}
-    for item in reversed(response.get("SavingsPlansCoverages", [])):
-        service_name = item.get("Attributes", {}).get("SERVICE", "").lower()
-        if service_name in service_latest:
-            continue
-        coverage = item.get("Coverage", {})
-        service_latest[service_name] = {
-            "covered": float(coverage.get("SpendCoveredBySavingsPlans", 0)),
-            "on_demand": float(coverage.get("OnDemandCost", 0)),
-        }
+    for page in paginate_coverage(ce_client, params, context="purchaser_current_coverage"):
+        for item in page:
+            service_name = item.get("Attributes", {}).get("SERVICE", "").lower()
+            coverage = item.get("Coverage", {})
+            service_latest[service_name] = {
+                "covered": float(coverage.get("SpendCoveredBySavingsPlans", 0)),
+                "on_demand": float(coverage.get("OnDemandCost", 0)),
+            }
 
     sp_spend = {k: {"covered": 0.0, "on_demand": 0.0} for k in ("compute", "database", "sagemaker")}
     for service_name, spend in service_latest.items():
@@ -117,45 +125,23 @@ def _classify_service(service_name: str) -> str | None:
     return None
 
 
-def _get_expiring_plans(
-    savingsplans_client: SavingsPlansClient, config: dict[str, Any]
-) -> list[dict[str, Any]]:
-    """Active plans whose end date falls within renewal_window_days."""
-    renewal_window_days = config["renewal_window_days"]
-    logger.info(f"Getting Savings Plans expiring within {renewal_window_days} days")
-
-    response = savingsplans_client.describe_savings_plans(states=["active"])
-    threshold = datetime.now(UTC) + timedelta(days=renewal_window_days)
-
-    expiring = []
-    for plan in response.get("savingsPlans", []):
-        end_time = datetime.fromisoformat(plan["end"].replace("Z", "+00:00"))
-        if end_time <= threshold:
-            expiring.append(
-                {
-                    "savingsPlanId": plan["savingsPlanId"],
-                    "savingsPlanType": plan["savingsPlanType"],
-                    "commitment": float(plan["commitment"]),
-                    "end": plan["end"],
-                }
-            )
-
-    logger.info(f"Found {len(expiring)} plans expiring within {renewal_window_days} days")
-    return expiring
-
-
-def _zero_out_expiring(
-    raw_coverage: dict[str, float], expiring_plans: list[dict[str, Any]]
+def _exclude_expiring(
+    raw_coverage: dict[str, float],
+    ladder: PlanLadder,
+    now: datetime,
+    horizon: datetime,
 ) -> dict[str, float]:
-    """Treat coverage of any SP type with an expiring plan as 0 to force renewal."""
+    """Scale each type's coverage by the share of its commitment still active at horizon."""
     adjusted = raw_coverage.copy()
-    type_mapping = {
-        constants.SP_FILTER_COMPUTE: ("compute", "Compute"),
-        constants.SP_FILTER_DATABASE: ("database", "Database"),
-        constants.SP_FILTER_SAGEMAKER: ("sagemaker", "SageMaker"),
-    }
-    for plan_type, (key, label) in type_mapping.items():
-        if any(p["savingsPlanType"] == plan_type for p in expiring_plans):
-            logger.info(f"{label} Savings Plans expiring - setting coverage to 0% to force renewal")
-            adjusted[key] = 0.0
+    for plan_type, key in AWS_TYPE_TO_KEY.items():
+        active = ladder.commitment_at(now, plan_type)
+        expiring = ladder.expiring_commitment(now, horizon, plan_type)
+        if active <= 0 or expiring <= 0:
+            continue
+        remaining_share = max(0.0, 1 - expiring / active)
+        adjusted[key] = raw_coverage[key] * remaining_share
+        logger.info(
+            f"{key} SP - ${expiring:.5f}/h of ${active:.5f}/h commitment expiring: "
+            f"coverage {raw_coverage[key]:.2f}% -> {adjusted[key]:.2f}%"
+        )
     return adjusted
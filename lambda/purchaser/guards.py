@@ -71,7 +71,7 @@ def apply_spike_guard(
     from shared.spending_analyzer import SpendingAnalyzer
     from shared.usage_decline_check import run_purchasing_spike_guard
 
-    analyzer = SpendingAnalyzer(clients["savingsplans"], clients["ce"])
+    analyzer = SpendingAnalyzer.from_clients(clients, config)
     guard_results = run_purchasing_spike_guard(analyzer, scheduling_avgs, config)
 
     flagged_types = {t for t, r in guard_results.items() if r["flagged"]}
@@ -23,6 +23,7 @@ from guards import apply_purchase_cooldown, apply_spike_guard
 from purchase_execution import process_purchase_messages, send_summary_email
 
 from shared import handler_utils
+from shared.ce_gateway import get_meter_summary
 from shared.queue_adapter import QueueAdapter
 
 
@@ -99,6 +100,7 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
                     "message": "Purchaser completed successfully",
                     "purchases_executed": results["successful_count"],
                     "purchases_skipped": results["skipped_count"],
+                    "ce_usage": get_meter_summary(),
                 }
             ),
         }
@@ -138,5 +140,7 @@ def _receive_messages(
 def _ok(message: str, *, executed: int) -> dict[str, Any]:
     return {
         "statusCode": 200,
-        "body": json.dumps({"message": message, "purchases_executed": executed}),
+        "body": json.dumps(
+            {"message": message, "purchases_executed": executed, "ce_usage": get_meter_summary()}
+        ),
     }
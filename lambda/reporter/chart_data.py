@@ -9,11 +9,15 @@ from typing import Any
 from report_data import get_type_metrics_for_report
 
 from shared import sp_calculations
-from shared.optimal_coverage import calculate_optimal_coverage
+from shared.optimal_coverage import calculate_optimal_coverage, calculate_strategy_sweep
+from shared.quantile_sketch import QuantileSketch
 
 
 logger = logging.getLogger(__name__)
 
+# Fixed compaction seed: cost statistics must not change between renders
+STATS_SKETCH_SEED = 0
+
 
 def _build_timeseries_maps(coverage_data: dict[str, Any]) -> tuple[dict, set]:
     """Flatten per-type timeseries into {sp_type: {ts: {covered, ondemand, total}}}."""
@@ -54,19 +58,22 @@ def _format_timestamp_label(ts: str, num_timestamps: int) -> str:
 
 
 def _calculate_cost_statistics(total_costs: list[float]) -> dict[str, float]:
-    """min/max/p50/p75/p90/p95 for non-zero costs; empty if all zero."""
-    nonzero = [c for c in total_costs if c > 0]
-    if not nonzero:
+    """min/max/p50/p75/p90/p95 for non-zero costs; empty if all zero.
+
+    Percentiles come from a QuantileSketch (exact up to DEFAULT_K hours); it is
+    seeded, so the same costs always render the same figures.
+    """
+    sketch = QuantileSketch.from_values((c for c in total_costs if c > 0), seed=STATS_SKETCH_SEED)
+    if not sketch.count:
         return {}
-    sorted_costs = sorted(nonzero)
-    n = len(sorted_costs)
+    p50, p75, p90, p95 = sketch.quantiles((0.50, 0.75, 0.90, 0.95))
     return {
-        "min": round(sorted_costs[0], 2),
-        "max": round(sorted_costs[-1], 2),
-        "p50": round(sorted_costs[int(n * 0.50)], 2),
-        "p75": round(sorted_costs[int(n * 0.75)], 2),
-        "p90": round(sorted_costs[int(n * 0.90)], 2),
-        "p95": round(sorted_costs[int(n * 0.95)], 2),
+        "min": round(sketch.min, 2),
+        "max": round(sketch.max, 2),
+        "p50": round(p50, 2),
+        "p75": round(p75, 2),
+        "p90": round(p90, 2),
+        "p95": round(p95, 2),
     }
 
 
@@ -191,6 +198,43 @@ def _calculate_optimal_coverage(
     return optimal_results
 
 
+def calculate_sensitivity_sweeps(
+    coverage_data: dict[str, Any], savings_data: dict[str, Any], config: dict[str, Any]
+) -> dict[str, Any]:
+    """Strategy levels per enabled SP type across a grid of savings percentages.
+
+    Uses the same non-zero hourly totals as the dynamic target strategy, and
+    marks the discount the scheduler would use (observed rate, else configured).
+    """
+    breakdown_by_type = savings_data["actual_savings"].get("breakdown_by_type", {})
+    type_mapping = {"compute": "Compute", "database": "Database", "sagemaker": "SageMaker"}
+    prudent_pct = config.get("prudent_percentage", 85.0)
+
+    sweeps: dict[str, Any] = {}
+    for sp_type in ("compute", "database", "sagemaker"):
+        if not config.get(f"enable_{sp_type}_sp"):
+            continue
+        hourly_costs = [
+            item["total"]
+            for item in coverage_data.get(sp_type, {}).get("timeseries", [])
+            if item.get("total", 0.0) > 0
+        ]
+        if not hourly_costs:
+            continue
+        observed_pct = breakdown_by_type.get(type_mapping[sp_type], {}).get(
+            "savings_percentage", 0.0
+        )
+        current_pct = observed_pct if observed_pct > 0 else config.get("savings_percentage", 30.0)
+        try:
+            rows = calculate_strategy_sweep(hourly_costs, prudent_pct=prudent_pct)
+        except ValueError as e:
+            logger.warning(f"Failed to calculate sensitivity sweep for {sp_type}: {e}")
+            continue
+        sweeps[sp_type] = {"rows": rows, "savings_percentage_used": current_pct}
+
+    return sweeps
+
+
 def prepare_chart_and_preview_json(
     coverage_data: dict[str, Any],
     savings_data: dict[str, Any],
@@ -24,6 +24,7 @@ import report_generator
 import scheduler_preview
 from config import CONFIG_SCHEMA
 
+from shared.ce_gateway import get_meter_summary
 from shared.handler_utils import (
     get_enabled_plan_types,
     initialize_clients,
@@ -78,7 +79,7 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         clear_responses()
 
     # Collect coverage data using SpendingAnalyzer
-    analyzer = SpendingAnalyzer(clients["savingsplans"], clients["ce"])
+    analyzer = SpendingAnalyzer.from_clients(clients, config)
     coverage_data = analyzer.analyze_current_spending(config)
     coverage_data.pop("_unknown_services", None)
 
@@ -111,9 +112,14 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     # Run spike guard (detect usage spikes)
     guard_results = None
     if config["spike_guard_enabled"]:
+        from shared.rolling_averages import RollingAverages
         from shared.usage_decline_check import run_scheduling_spike_guard
 
-        _, guard_results = run_scheduling_spike_guard(analyzer, config)
+        # Reuse the daily series fetched above instead of querying each window again
+        daily_series = RollingAverages.from_daily_spending(
+            daily_coverage_data, daily_config["lookback_days"]
+        )
+        _, guard_results = run_scheduling_spike_guard(analyzer, config, daily_series)
 
     # Check for low utilization and alert if needed
     notifications_module.check_and_alert_low_utilization(clients["sns"], config, savings_data)
@@ -177,6 +183,9 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
             "aws_api_responses": get_responses(),
         }
 
+    # Cost Explorer usage so far (all CE calls happen before report generation)
+    ce_usage = get_meter_summary()
+
     # Generate report
     report_content = report_generator.generate_report(
         coverage_data,
@@ -187,6 +196,7 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         preview_data,
         daily_coverage_data,
         guard_results,
+        ce_usage=ce_usage,
     )
     logger.info(
         f"Report generated ({len(report_content)} bytes, format: {config['report_format']})"
@@ -226,6 +236,7 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
                 "message": "Reporter completed successfully",
                 "s3_object_key": s3_object_key,
                 "active_plans": savings_data.get("plans_count", 0),
+                "ce_usage": ce_usage,
             }
         ),
     }
@@ -10,10 +10,11 @@ import json
 import logging
 from typing import Any
 
-from chart_data import prepare_chart_and_preview_json
+from chart_data import calculate_sensitivity_sweeps, prepare_chart_and_preview_json
 from html_sections import (
     build_plans_breakdown_section_html,
     build_raw_data_section_html,
+    build_sensitivity_heatmap_html,
     render_sp_type_tab_button,
     render_sp_type_tab_content,
     render_spike_guard_warning_banner,
@@ -34,6 +35,8 @@ def generate_html_report(
     preview_data: dict[str, Any] | None = None,
     daily_coverage_data: dict[str, Any] | None = None,
     guard_results: dict[str, dict[str, Any]] | None = None,
+    *,
+    ce_usage: dict[str, Any] | None = None,
 ) -> str:
     """
     Generate HTML report with coverage trends and savings metrics.
@@ -45,6 +48,7 @@ def generate_html_report(
         raw_data: Optional raw AWS API responses to include in the report
         daily_coverage_data: Optional daily granularity coverage data for trend chart
         guard_results: Optional spike guard results
+        ce_usage: Optional Cost Explorer usage meter (shared.ce_gateway.get_meter_summary)
 
     Returns:
         str: HTML report content
@@ -66,6 +70,7 @@ def generate_html_report(
     average_utilization = data["average_utilization"]
     utilization_class = data["utilization_class"]
     breakdown_by_type = data["breakdown_by_type"]
+    sensitivity_sweeps = calculate_sensitivity_sweeps(coverage_data, savings_data, config)
 
     enabled_types = [
         name
@@ -845,6 +850,7 @@ def generate_html_report(
 
             {render_sp_type_tab_content("sagemaker", config, single_type, preview_data)}
         </div>
+{build_sensitivity_heatmap_html(sensitivity_sweeps)}
 
         <div class="section">
             <h2>Existing Savings Plans</h2>
@@ -865,7 +871,7 @@ def generate_html_report(
     )
 
     monthly_savings = net_savings_hourly * 24 * 30
-    html += build_raw_data_section_html(raw_data, report_timestamp, monthly_savings)
+    html += build_raw_data_section_html(raw_data, report_timestamp, monthly_savings, ce_usage)
 
     (
         chart_data,
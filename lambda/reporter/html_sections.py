@@ -6,6 +6,7 @@ from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from shared import sp_calculations
+from shared.plan_ladder import PlanLadder
 
 
 _TABLE_CLOSE = """
@@ -22,6 +23,8 @@ def build_strategy_tooltip(strategy_key: str, config: dict[str, Any]) -> str:
 
     if target == "dynamic":
         target_line = f"Target: dynamic (risk_level: {config['dynamic_risk_level']})"
+    elif target == "budget":
+        target_line = f"Target: budget (${config['budget_commitment']:.5f}/h per run)"
     else:
         target_line = "Target: aws"
 
@@ -111,6 +114,50 @@ def _render_purchase_row(
                 """
 
 
+_RISK_LABELS = {
+    "prudent": "Prudent",
+    "min_hourly": "Min-Hourly",
+    "optimal": "Optimal",
+    "maximum": "Maximum",
+}
+
+
+def _render_risk_table(risk: dict[str, dict[str, float]] | None) -> str:
+    """Bootstrap net-savings distribution and loss odds per dynamic level."""
+    if not risk:
+        return ""
+
+    rows = ""
+    for name, result in risk.items():
+        loss = result["probability_of_loss"]
+        loss_color = "#28a745" if loss < 0.05 else "#ff9900" if loss < 0.25 else "#dc3545"
+        rows += f"""
+                    <tr>
+                        <td><strong>{_RISK_LABELS.get(name, name)}</strong></td>
+                        <td class="metric">${result["coverage_hourly"]:.4f}/hr</td>
+                        <td class="metric">${result["expected_savings"]:.4f}/hr</td>
+                        <td class="metric">${result["savings_p5"]:.4f} &ndash; ${result["savings_p95"]:.4f}</td>
+                        <td class="metric">{result["expected_utilization"]:.1%}</td>
+                        <td class="metric" style="color: {loss_color}; font-weight: bold;">{loss:.1%}</td>
+                    </tr>
+        """
+
+    return f"""
+            <h4 style="color: #232f3e; margin: 20px 0 10px;" title="Weekly blocks of the lookback resampled into simulated usage paths">Commitment Risk (Monte Carlo)</h4>
+            <table style="width: 100%;">
+                <thead>
+                    <tr>
+                        <th>Coverage Level</th>
+                        <th>Coverage</th>
+                        <th>Expected Net Savings</th>
+                        <th>Net Savings p5 &ndash; p95</th>
+                        <th>Expected Utilization</th>
+                        <th>P(Net Loss)</th>
+                    </tr>
+                </thead>
+                <tbody>{rows}{_TABLE_CLOSE}"""
+
+
 def render_sp_type_scheduler_preview(
     sp_type: str, preview_data: dict[str, Any] | None, config: dict[str, Any]
 ) -> str:
@@ -175,9 +222,10 @@ def render_sp_type_scheduler_preview(
                 strategy_key, strategy_display, is_configured, tooltip, purchase
             )
 
-    html += """
+    html += f"""
                 </tbody>
             </table>
+            {_render_risk_table(preview_data.get("risk", {}).get(sp_type))}
         </div>
     """
 
@@ -283,9 +331,12 @@ def build_breakdown_table_html(
 
 
 def build_raw_data_section_html(
-    raw_data: dict[str, Any] | None, report_timestamp: str, monthly_savings: float = 0.0
+    raw_data: dict[str, Any] | None,
+    report_timestamp: str,
+    monthly_savings: float = 0.0,
+    ce_usage: dict[str, Any] | None = None,
 ) -> str:
-    """Collapsible raw AWS data panel + footer with optional coffee nudge."""
+    """Collapsible raw AWS data panel + footer with optional coffee nudge and CE usage."""
     html = """
         </div>
 """
@@ -338,11 +389,23 @@ def build_raw_data_section_html(
             </div>
 """
 
+    ce_usage_html = ""
+    if ce_usage is not None:
+        throttled = ce_usage.get("ce_throttled_requests", 0)
+        throttled_html = f", {throttled} throttled" if throttled else ""
+        memoized = ce_usage.get("ce_memoized_calls", 0)
+        if memoized:
+            throttled_html += f", {memoized} reused"
+        ce_usage_html = (
+            f" | Cost Explorer: {ce_usage.get('ce_api_calls', 0)} API calls{throttled_html} "
+            f"(~${ce_usage.get('ce_estimated_cost_usd', 0.0):.2f})"
+        )
+
     html += f"""
         <div class="footer">
 {coffee_html}
             <p style="margin-top: 20px;">
-                Generated: {report_timestamp} | <a href="https://github.com/etiennechabert/terraform-aws-sp-autopilot" target="_blank" style="color: #2196f3; text-decoration: none;">terraform-aws-sp-autopilot</a> <span style="opacity: 0.6;">| Open source | Apache 2.0</span>
+                Generated: {report_timestamp}{ce_usage_html} | <a href="https://github.com/etiennechabert/terraform-aws-sp-autopilot" target="_blank" style="color: #2196f3; text-decoration: none;">terraform-aws-sp-autopilot</a> <span style="opacity: 0.6;">| Open source | Apache 2.0</span>
             </p>
         </div>
     </div>
@@ -496,6 +559,7 @@ def build_plans_breakdown_section_html(
     plans_by_type: dict[str, list[dict[str, Any]]] = {}
     for plan in plans:
         plans_by_type.setdefault(plan.get("plan_type", "Unknown"), []).append(plan)
+    ladder = PlanLadder.from_plan_details(plans)
 
     na_tooltip = "This SP type is not enabled in your configuration, so metrics are not collected"
 
@@ -528,13 +592,13 @@ def build_plans_breakdown_section_html(
         plan_type_display = _plan_type_display_name(plan_type)
 
         type_plans = plans_by_type.get(plan_type, [])
-        next_expiry_cell = _render_next_expiry_cell(type_plans, now)
-        next_expiry_days = _next_expiry_days(type_plans, now)
+        next_expiry_cell = _render_next_expiry_cell(ladder, now, plan_type)
+        next_expiry_days = _next_expiry_days(ladder, now, plan_type)
         if next_expiry_days is not None and (
             soonest_overall_days is None or next_expiry_days < soonest_overall_days
         ):
             soonest_overall_days = next_expiry_days
-            soonest_overall_date = _next_expiry_end(type_plans)
+            soonest_overall_date = _next_expiry_end(ladder, plan_type)
 
         type_details_id = f"type-plans-{type_idx}"
 
@@ -689,38 +753,28 @@ def _build_type_plans_subtable(
 """
 
 
-def _next_expiry_days(type_plans: list[dict[str, Any]], now: datetime) -> int | None:
-    """Days until the soonest-ending plan in the given list, or None if no parseable dates."""
-    soonest: int | None = None
-    for plan in type_plans:
-        end_date = plan.get("end_date", "") or ""
-        try:
-            if "T" in end_date:
-                end_parsed = datetime.fromisoformat(end_date.replace("Z", "+00:00"))
-            else:
-                end_parsed = datetime.strptime(end_date, "%Y-%m-%d").replace(tzinfo=UTC)
-        except (ValueError, TypeError):
-            continue
-        days = (end_parsed - now).days
-        if soonest is None or days < soonest:
-            soonest = days
-    return soonest
+def _next_expiry_days(
+    ladder: PlanLadder, now: datetime, plan_type: str | None = None
+) -> int | None:
+    """Days until the soonest-ending plan (of plan_type), or None if no parseable dates."""
+    soonest = ladder.next_expiring(plan_type)
+    return (soonest[0] - now).days if soonest else None
 
 
-def _next_expiry_end(type_plans: list[dict[str, Any]]) -> str:
+def _next_expiry_end(ladder: PlanLadder, plan_type: str | None = None) -> str:
     """End date of the soonest-expiring plan (used for tooltip)."""
-    if not type_plans:
-        return ""
-    sorted_plans = sorted(type_plans, key=lambda p: p.get("end_date", "9999-12-31"))
-    return sorted_plans[0].get("end_date", "") or ""
+    soonest = ladder.next_expiring(plan_type)
+    return (soonest[1].get("end_date", "") or "") if soonest else ""
 
 
-def _render_next_expiry_cell(type_plans: list[dict[str, Any]], now: datetime) -> str:
+def _render_next_expiry_cell(
+    ladder: PlanLadder, now: datetime, plan_type: str | None = None
+) -> str:
     """Render the Next Expiry cell for a type row: days + color when <90 days out."""
-    days = _next_expiry_days(type_plans, now)
+    days = _next_expiry_days(ladder, now, plan_type)
     if days is None:
         return '<span style="color: #6c757d;">N/A</span>'
-    end_date = _next_expiry_end(type_plans)
+    end_date = _next_expiry_end(ladder, plan_type)
     return _format_days_cell(days, end_date)
 
 
@@ -977,3 +1031,85 @@ def render_sp_type_tab_content(
                 </div>
                 {render_sp_type_scheduler_preview(sp_type, preview_data, config or {})}
             </div>'''
+
+
+_SENSITIVITY_LEVELS = (
+    ("prudent", "Prudent"),
+    ("min_hourly", "Min-Hourly"),
+    ("optimal", "Optimal"),
+    ("maximum", "Maximum"),
+)
+
+
+def _heatmap_color(pct_of_min: float, max_pct_of_min: float) -> str:
+    """White at min-hourly (or below), deepening orange toward the table maximum."""
+    if max_pct_of_min <= 100 or pct_of_min <= 100:
+        return "#ffffff"
+    intensity = min(1.0, (pct_of_min - 100) / (max_pct_of_min - 100))
+    # Blend #ffffff -> #ff9900
+    green = round(255 - intensity * (255 - 153))
+    blue = round(255 - intensity * 255)
+    return f"#ff{green:02x}{blue:02x}"
+
+
+def _render_sensitivity_table(sp_type: str, sweep: dict[str, Any]) -> str:
+    rows = sweep["rows"]
+    min_hourly = rows[0]["min_hourly"]
+    current_pct = sweep["savings_percentage_used"]
+    closest_pct = min(
+        (row["savings_percentage"] for row in rows), key=lambda pct: abs(pct - current_pct)
+    )
+
+    def pct_of_min(value: float) -> float:
+        return value / min_hourly * 100 if min_hourly > 0 else 0.0
+
+    max_pct = max(pct_of_min(row["maximum"]) for row in rows)
+
+    body = ""
+    for row in rows:
+        is_current = row["savings_percentage"] == closest_pct
+        label_style = ' style="font-weight: bold;"' if is_current else ""
+        marker = " &#9664;" if is_current else ""
+        cells = ""
+        for key, _ in _SENSITIVITY_LEVELS:
+            pct = pct_of_min(row[key])
+            cells += (
+                f'<td style="background: {_heatmap_color(pct, max_pct)};">'
+                f"${row[key]:.4f}/h<br><small>{pct:.0f}%</small></td>"
+            )
+        body += (
+            f"                    <tr><td{label_style}>{row['savings_percentage']:.0f}%{marker}</td>"
+            f"{cells}</tr>\n"
+        )
+
+    headers = "".join(f"<th>{label}</th>" for _, label in _SENSITIVITY_LEVELS)
+    return f"""
+            <h3 style="color: #232f3e; margin: 20px 0 10px 0;">{sp_type.capitalize()}</h3>
+            <table style="width: 100%; text-align: center;">
+                <thead>
+                    <tr><th>Discount</th>{headers}</tr>
+                </thead>
+                <tbody>
+{body}{_TABLE_CLOSE}"""
+
+
+def build_sensitivity_heatmap_html(sweeps: dict[str, Any] | None) -> str:
+    """Section showing how each dynamic risk level moves with the assumed discount."""
+    if not sweeps:
+        return ""
+
+    tables = "".join(
+        _render_sensitivity_table(sp_type, sweeps[sp_type])
+        for sp_type in ("compute", "database", "sagemaker")
+        if sp_type in sweeps
+    )
+    return f"""
+        <div class="section">
+            <h2>Discount Sensitivity</h2>
+            <p style="color: #6c757d; font-size: 0.9em; margin-top: 0;">
+                Hourly coverage each dynamic risk level would target if Savings Plans
+                discounted usage by the given percentage, with % of min-hourly below.
+                &#9664; marks the discount closest to the rate the scheduler uses today.
+            </p>
+{tables}        </div>
+"""
@@ -55,6 +55,8 @@ def generate_report(
     preview_data: dict[str, Any] | None = None,
     daily_coverage_data: dict[str, Any] | None = None,
     guard_results: dict[str, dict[str, Any]] | None = None,
+    *,
+    ce_usage: dict[str, Any] | None = None,
 ) -> str:
     """Dispatch to the HTML/JSON/CSV generator."""
     if report_format == "json":
@@ -70,6 +72,7 @@ def generate_report(
             preview_data,
             daily_coverage_data,
             guard_results,
+            ce_usage=ce_usage,
         )
     raise ValueError(f"Invalid report format: {report_format}")
 
@@ -2,7 +2,9 @@
 Scheduler Preview - Simulates scheduler purchase decisions for reporting.
 
 Shows what different target+split strategy combinations would purchase
-if they ran right now, allowing comparison between strategies.
+if they ran right now, allowing comparison between strategies. Savings rates,
+expiring-plan exclusion and per-type spend figures are prepared once
+(PurchaseContext) and every combination is evaluated against them.
 """
 
 import logging
@@ -10,6 +12,8 @@ from typing import Any
 
 from shared import sp_calculations
 from shared.constants import AWS_TYPE_TO_KEY
+from shared.risk_simulation import lookback_seed, simulate_spending_risk
+from shared.sp_types import SP_TYPES
 
 
 logger = logging.getLogger(__name__)
@@ -28,6 +32,9 @@ STRATEGY_LABELS = {
     "static+fixed_step": "Static + Fixed Step",
     "static+gap_split": "Static + Gap Split",
     "static+one_shot": "Static + One Shot",
+    "budget+fixed_step": "Budget + Fixed Step",
+    "budget+gap_split": "Budget + Gap Split",
+    "budget+one_shot": "Budget + One Shot",
     "aws+one_shot": "AWS Reco + One Shot",
 }
 
@@ -71,7 +78,11 @@ def calculate_scheduler_preview(
 
     Returns preview data with all combinations' recommendations.
     """
-    from shared.purchase_calculator import calculate_purchase_need
+    from shared.purchase_calculator import (
+        SHORT_CIRCUIT_TARGETS,
+        PurchaseContext,
+        calculate_purchase_need,
+    )
 
     config = _inject_actual_savings_rates(config, savings_data)
 
@@ -93,14 +104,21 @@ def calculate_scheduler_preview(
 
     try:
         all_strategies = {}
+        context = None
+        min_hourly_by_type = _min_hourly_by_type(coverage_data)
 
         for combo in combos:
             strategy_key = f"{combo['target']}+{combo['split']}"
             try:
-                preview_config = _build_preview_config(config, combo["target"], combo["split"])
-                purchases = calculate_purchase_need(preview_config, clients, coverage_data)
+                if combo["target"] in SHORT_CIRCUIT_TARGETS:
+                    preview_config = _build_preview_config(config, combo["target"], combo["split"])
+                    purchases = calculate_purchase_need(preview_config, clients, coverage_data)
+                else:
+                    if context is None:
+                        context = PurchaseContext.build(config, clients, coverage_data)
+                    purchases = context.evaluate(combo["target"], combo["split"])
                 enriched = _enrich_purchases(
-                    purchases, coverage_data, savings_data, combo["target"]
+                    purchases, coverage_data, savings_data, combo["target"], min_hourly_by_type
                 )
 
                 all_strategies[strategy_key] = {
@@ -118,10 +136,16 @@ def calculate_scheduler_preview(
                     "error": str(e),
                 }
 
+        enabled_keys = [t["key"] for t in SP_TYPES if config.get(t["enabled_config"])]
+        risk = simulate_spending_risk(
+            coverage_data, config, enabled_keys, seed=lookback_seed(coverage_data)
+        )
+
         return {
             "configured_strategy": configured_key,
             "strategy_order": [f"{c['target']}+{c['split']}" for c in combos],
             "strategies": all_strategies,
+            "risk": risk,
             "error": None,
         }
 
@@ -134,11 +158,23 @@ def calculate_scheduler_preview(
         }
 
 
+def _min_hourly_by_type(coverage_data: dict[str, Any]) -> dict[str, float]:
+    """Lowest non-zero hourly spend per SP type (0.0 without any)."""
+    min_hourly = {}
+    for key, sp_data in coverage_data.items():
+        if not isinstance(sp_data, dict):
+            continue
+        total_costs = [item["total"] for item in sp_data.get("timeseries", []) if item["total"] > 0]
+        min_hourly[key] = min(total_costs) if total_costs else 0.0
+    return min_hourly
+
+
 def _enrich_purchases(
     purchase_plans: list[dict[str, Any]],
     coverage_data: dict[str, Any],
     savings_data: dict[str, Any] | None,
     target_type: str,
+    min_hourly_by_type: dict[str, float],
 ) -> list[dict[str, Any]]:
     breakdown_by_type = (
         savings_data["actual_savings"].get("breakdown_by_type", {}) if savings_data else {}
@@ -152,9 +188,7 @@ def _enrich_purchases(
 
         hourly_commitment = plan["hourly_commitment"]
 
-        timeseries = sp_data.get("timeseries", [])
-        total_costs = [item["total"] for item in timeseries if item["total"] > 0]
-        min_hourly = min(total_costs) if total_costs else 0.0
+        min_hourly = min_hourly_by_type.get(sp_type, 0.0)
 
         aws_type_name = {
             "compute": "Compute",
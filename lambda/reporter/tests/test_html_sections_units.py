@@ -23,9 +23,13 @@ from html_sections import (
     _render_next_expiry_cell,
     _render_plan_card_metrics,
     _render_plan_details,
+    _render_risk_table,
     build_plans_breakdown_section_html,
+    build_sensitivity_heatmap_html,
 )
 
+from shared.plan_ladder import PlanLadder
+
 
 _NOW = datetime(2026, 4, 1, tzinfo=UTC)
 _THREE_MONTHS = datetime(2026, 7, 1, tzinfo=UTC)
@@ -115,21 +119,23 @@ class TestNextExpiryHelpers:
             _plan(end_date="2026-06-01T00:00:00Z"),
             _plan(end_date="2028-01-01T00:00:00Z"),
         ]
-        assert _next_expiry_days(plans, _NOW) == 61  # 2026-04-01 → 2026-06-01 = 61 calendar days
+        assert (
+            _next_expiry_days(PlanLadder.from_plan_details(plans), _NOW) == 61
+        )  # 2026-04-01 → 2026-06-01 = 61 calendar days
 
     def test_next_expiry_days_handles_unknown_dates(self):
         plans = [
             _plan(end_date=""),
             _plan(end_date="Unknown"),
         ]
-        assert _next_expiry_days(plans, _NOW) is None
+        assert _next_expiry_days(PlanLadder.from_plan_details(plans), _NOW) is None
 
     def test_next_expiry_days_empty_list(self):
-        assert _next_expiry_days([], _NOW) is None
+        assert _next_expiry_days(PlanLadder.from_plan_details([]), _NOW) is None
 
     def test_next_expiry_days_accepts_date_only_format(self):
         plans = [_plan(end_date="2026-05-01")]
-        days = _next_expiry_days(plans, _NOW)
+        days = _next_expiry_days(PlanLadder.from_plan_details(plans), _NOW)
         assert days is not None
         assert days > 0
 
@@ -138,17 +144,28 @@ class TestNextExpiryHelpers:
             _plan(end_date="2027-01-01T00:00:00Z"),
             _plan(end_date="2026-06-01T00:00:00Z"),
         ]
-        assert _next_expiry_end(plans) == "2026-06-01T00:00:00Z"
+        assert _next_expiry_end(PlanLadder.from_plan_details(plans)) == "2026-06-01T00:00:00Z"
 
     def test_next_expiry_end_empty(self):
-        assert _next_expiry_end([]) == ""
+        assert _next_expiry_end(PlanLadder.from_plan_details([])) == ""
+
+    def test_next_expiry_per_plan_type(self):
+        ladder = PlanLadder.from_plan_details(
+            [
+                _plan(end_date="2026-06-01T00:00:00Z"),
+                _plan(plan_type="SageMaker", end_date="2026-05-01T00:00:00Z"),
+            ]
+        )
+        assert _next_expiry_days(ladder, _NOW, "Compute") == 61
+        assert _next_expiry_end(ladder, "SageMaker") == "2026-05-01T00:00:00Z"
+        assert _next_expiry_days(ladder, _NOW, "Database") is None
 
     def test_render_next_expiry_cell_none_for_empty(self):
-        assert "N/A" in _render_next_expiry_cell([], _NOW)
+        assert "N/A" in _render_next_expiry_cell(PlanLadder.from_plan_details([]), _NOW)
 
     def test_render_next_expiry_cell_renders_days(self):
         plans = [_plan(end_date="2026-06-01T00:00:00Z")]
-        html = _render_next_expiry_cell(plans, _NOW)
+        html = _render_next_expiry_cell(PlanLadder.from_plan_details(plans), _NOW)
         assert "days" in html
         assert "2026-06-01" in html  # tooltip embeds the end date
 
@@ -309,3 +326,68 @@ class TestBuildPlansBreakdownSection:
         }
         html = build_plans_breakdown_section_html(breakdown, [], 2, 0.0, 19.31, 0.0)
         assert "N/A" in html
+
+
+class TestSensitivityHeatmap:
+    def _sweep(self, current_pct=27.0):
+        return {
+            "rows": [
+                {
+                    "savings_percentage": pct,
+                    "prudent": 8.5,
+                    "min_hourly": 10.0,
+                    "optimal": 10.0 + pct / 10,
+                    "maximum": 10.0 + pct / 5,
+                }
+                for pct in (20, 25, 30)
+            ],
+            "savings_percentage_used": current_pct,
+        }
+
+    def test_empty_sweeps_render_nothing(self):
+        assert build_sensitivity_heatmap_html({}) == ""
+        assert build_sensitivity_heatmap_html(None) == ""
+
+    def test_renders_levels_and_marks_current_discount(self):
+        html = build_sensitivity_heatmap_html({"compute": self._sweep()})
+
+        assert "Discount Sensitivity" in html
+        assert "$16.0000/h" in html  # maximum at 30%
+        assert "160%" in html
+        assert "25% &#9664;" in html
+        assert html.count("&#9664;") == 2  # legend + one marked row
+
+    def test_highest_level_is_darkest(self):
+        html = build_sensitivity_heatmap_html({"compute": self._sweep()})
+
+        assert "background: #ff9900;" in html
+        assert "background: #ffffff;" in html
+
+
+class TestRiskTable:
+    def _result(self, coverage, loss):
+        return {
+            "coverage_hourly": coverage,
+            "expected_savings": 2.5,
+            "savings_p5": -0.25,
+            "savings_p50": 2.5,
+            "savings_p95": 3.0,
+            "probability_of_loss": loss,
+            "expected_utilization": 0.97,
+        }
+
+    def test_no_risk_renders_nothing(self):
+        assert _render_risk_table(None) == ""
+        assert _render_risk_table({}) == ""
+
+    def test_renders_distribution_and_loss_odds(self):
+        html = _render_risk_table(
+            {"min_hourly": self._result(8.0, 0.0), "maximum": self._result(12.0, 0.4)}
+        )
+
+        assert "Commitment Risk" in html
+        assert "Min-Hourly" in html
+        assert "$-0.2500 &ndash; $3.0000" in html
+        assert "97.0%" in html
+        assert 'color: #28a745; font-weight: bold;">0.0%' in html
+        assert 'color: #dc3545; font-weight: bold;">40.0%' in html
@@ -1,6 +1,7 @@
 """Unit tests for report_generator internal functions."""
 
 import os
+import random
 import sys
 from datetime import UTC, datetime
 
@@ -12,6 +13,7 @@ os.environ.setdefault("SNS_TOPIC_ARN", "arn:aws:sns:us-east-1:123456789012:test-
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from chart_data import _calculate_cost_statistics
 from report_generator import (
     _build_breakdown_table_html,
     _get_type_metrics_for_report,
@@ -413,3 +415,15 @@ class TestUsageGuardWarningBanner:
         html = _render_spike_guard_warning_banner(results, config)
         assert "COMPUTE" in html
         assert "DATABASE" in html
+
+
+class TestCalculateCostStatistics:
+    def test_long_lookback_statistics_are_stable(self):
+        rng = random.Random(0)
+        costs = [rng.uniform(1.0, 100.0) for _ in range(30 * 24)]
+
+        stats = _calculate_cost_statistics(costs)
+
+        assert _calculate_cost_statistics(costs) == stats
+        assert stats["min"] == round(min(costs), 2)
+        assert stats["max"] == round(max(costs), 2)
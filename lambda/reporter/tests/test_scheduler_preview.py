@@ -293,3 +293,81 @@ def test_coverage_is_min_hourly_based(sample_config, mock_clients, aws_mock_buil
     assert db_purchase["current_coverage"] + db_purchase["purchase_percent"] == pytest.approx(
         db_purchase["projected_coverage"], abs=0.01
     )
+
+
+def test_preview_includes_commitment_risk(
+    sample_config, mock_clients, sample_coverage_data, aws_mock_builder
+):
+    """Enabled types with usage get a bootstrap risk entry per dynamic level."""
+    mock_clients[
+        "ce"
+    ].get_savings_plans_purchase_recommendation.return_value = aws_mock_builder.recommendation(
+        sp_type="compute", hourly_commitment=50.0
+    )
+
+    result = scheduler_preview.calculate_scheduler_preview(
+        sample_config, mock_clients, sample_coverage_data
+    )
+
+    risk = result["risk"]
+    assert list(risk) == ["compute"]
+    assert list(risk["compute"]) == ["prudent", "min_hourly", "optimal", "maximum"]
+    assert risk["compute"]["min_hourly"]["coverage_hourly"] == pytest.approx(950.0)
+    assert risk["compute"]["prudent"]["probability_of_loss"] == 0.0
+
+
+def test_preview_prepares_spend_once_for_all_combinations(
+    sample_config, mock_clients, sample_coverage_data, aws_mock_builder
+):
+    """Savings rates are looked up once, not per combination, and results match."""
+    from shared.purchase_calculator import calculate_purchase_need
+
+    config = {**sample_config, "split_strategy_type": "one_shot", "dynamic_risk_level": "maximum"}
+    mock_clients["ce"].get_savings_plans_utilization.return_value = {
+        "SavingsPlansUtilizationsByTime": []
+    }
+    mock_clients[
+        "ce"
+    ].get_savings_plans_purchase_recommendation.return_value = aws_mock_builder.recommendation(
+        sp_type="compute", hourly_commitment=50.0
+    )
+
+    result = scheduler_preview.calculate_scheduler_preview(
+        config, mock_clients, sample_coverage_data
+    )
+
+    assert result["strategy_order"] == [
+        "dynamic+one_shot",
+        "dynamic+fixed_step",
+        "dynamic+gap_split",
+        "aws+one_shot",
+    ]
+    assert mock_clients["ce"].get_savings_plans_utilization.call_count == 1
+    for split in ("one_shot", "fixed_step", "gap_split"):
+        combo_config = {**config, "split_strategy_type": split}
+        expected = calculate_purchase_need(combo_config, mock_clients, sample_coverage_data)
+        purchases = result["strategies"][f"dynamic+{split}"]["purchases"]
+        assert [p["hourly_commitment"] for p in purchases] == [
+            p["hourly_commitment"] for p in expected
+        ]
+        assert purchases
+
+
+def test_preview_risk_is_reproducible(
+    sample_config, mock_clients, sample_coverage_data, aws_mock_builder
+):
+    """Rendering the same lookback twice reports the same risk figures."""
+    mock_clients[
+        "ce"
+    ].get_savings_plans_purchase_recommendation.return_value = aws_mock_builder.recommendation(
+        sp_type="compute", hourly_commitment=50.0
+    )
+
+    first = scheduler_preview.calculate_scheduler_preview(
+        sample_config, mock_clients, sample_coverage_data
+    )
+    second = scheduler_preview.calculate_scheduler_preview(
+        sample_config, mock_clients, sample_coverage_data
+    )
+
+    assert first["risk"] == second["risk"]
@@ -77,6 +77,28 @@ def _format_plans_block(
     return lines
 
 
+def _format_risk_block(
+    risk: dict[str, dict[str, dict[str, float]]] | None,
+) -> list[str]:
+    if not risk:
+        return []
+    lines = [
+        "Commitment Risk (bootstrap of the lookback, net savings in $/hour):",
+        "-" * 50,
+    ]
+    for sp_type, candidates in risk.items():
+        lines.append(f"  {sp_type.upper()} Savings Plan:")
+        for name, result in candidates.items():
+            lines.append(
+                f"    {name:<11} ${result['coverage_hourly']:.4f}/h covered  "
+                f"expected ${result['expected_savings']:.4f}/h "
+                f"(p5 ${result['savings_p5']:.4f}, p95 ${result['savings_p95']:.4f})  "
+                f"P(loss) {result['probability_of_loss']:.1%}"
+            )
+        lines.append("")
+    return lines
+
+
 def _format_unknown_services_warning(
     unknown_services: list[str] | None,
 ) -> list[str]:
@@ -172,6 +194,8 @@ def send_scheduled_email(
     purchase_plans: list[dict[str, Any]],
     coverage: dict[str, float] | None,
     unknown_services: list[str] | None = None,
+    *,
+    risk: dict[str, dict[str, dict[str, float]]] | None = None,
 ) -> None:
     logger.info("Sending scheduled purchases email")
     _format_and_send(
@@ -189,6 +213,7 @@ def send_scheduled_email(
         ],
         plans_heading="Scheduled Purchase Plans:",
         footer_lines=[
+            *_format_risk_block(risk),
             "CANCELLATION INSTRUCTIONS:",
             "To cancel these purchases before they execute:",
             "1. Purge the SQS queue to remove all pending purchase intents",
@@ -25,6 +25,7 @@ import queue_manager as queue_module
 from config import CONFIG_SCHEMA
 
 from shared import purchase_calculator as purchase_module
+from shared.ce_gateway import get_meter_summary
 from shared.config_validation import validate_scheduler_config
 from shared.handler_utils import (
     initialize_clients,
@@ -32,6 +33,7 @@ from shared.handler_utils import (
     load_config_from_env,
     send_error_notification,
 )
+from shared.risk_simulation import lookback_seed, simulate_spending_risk
 from shared.spending_analyzer import SpendingAnalyzer
 
 
@@ -95,6 +97,7 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
                     {
                         "message": "Skipped — all enabled types within cooldown window",
                         "purchases_planned": 0,
+                        "ce_usage": get_meter_summary(),
                     }
                 ),
             }
@@ -102,7 +105,7 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     queue_module.purge_queue(clients["sqs"], config["queue_url"])
 
     # Run spike guard (detect usage spikes before purchase calculation)
-    analyzer = SpendingAnalyzer(clients["savingsplans"], clients["ce"])
+    analyzer = SpendingAnalyzer.from_clients(clients, config)
     short_term_averages = None
     guard_results = None
     if config["spike_guard_enabled"]:
@@ -168,12 +171,26 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         short_term_averages,
         savingsplans_client=clients["savingsplans"],
     )
+    # Odds that each candidate coverage level ends up underused (types being purchased)
+    plan_rates = {
+        f"{p['sp_type']}_savings_percentage": p["estimated_savings_percentage"]
+        for p in purchase_plans
+        if p.get("estimated_savings_percentage")
+    }
+    risk = simulate_spending_risk(
+        spending_data,
+        {**config, **plan_rates},
+        sorted({p["sp_type"] for p in purchase_plans}),
+        seed=lookback_seed(spending_data),
+    )
+
     email_module.send_scheduled_email(
         clients["sns"],
         config,
         purchase_plans,
         coverage,
         unknown_services if unknown_services else None,
+        risk=risk,
     )
 
     if cooldown_blocked_plans:
@@ -192,6 +209,7 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
                 "purchases_planned": len(purchase_plans),
                 "purchases_blocked_by_cooldown": len(cooldown_blocked_plans),
                 "purchases_blocked_by_spike_guard": len(blocked_plans),
+                "ce_usage": get_meter_summary(),
             }
         ),
     }
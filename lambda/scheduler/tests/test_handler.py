@@ -296,6 +296,8 @@ def test_handler_fixed_strategy(mock_env_vars, mock_clients, aws_mock_builder, m
 
     email_call = mock_clients["sns"].publish.call_args[1]
     assert "Current Coverage" in email_call["Message"]
+    assert "Commitment Risk" in email_call["Message"]
+    assert "P(loss)" in email_call["Message"]
 
 
 def test_handler_compute_sp_enabled(mock_env_vars, mock_clients, aws_mock_builder):
@@ -94,3 +94,46 @@ class TestSchedulerConfigStrategies:
             "split_strategy_type": "one_shot",
         }
         validate_scheduler_config(config)
+
+
+class TestBudgetValidation:
+    def test_budget_target_accepted(self):
+        config = {**BASE_CONFIG, "target_strategy_type": "budget", "budget_commitment": 2.5}
+        _validate_strategies(config)
+
+    def test_budget_target_requires_positive_commitment(self):
+        config = {**BASE_CONFIG, "target_strategy_type": "budget", "budget_commitment": 0.0}
+        with pytest.raises(ValueError, match="budget_commitment"):
+            _validate_strategies(config)
+
+
+class TestForecastValidation:
+    def test_forecast_risk_level_accepted(self):
+        config = {**BASE_CONFIG, "dynamic_risk_level": "forecast", "forecast_days": 14}
+        _validate_strategies(config)
+
+    def test_forecast_days_out_of_range_rejected(self):
+        config = {**BASE_CONFIG, "dynamic_risk_level": "forecast", "forecast_days": 0}
+        with pytest.raises(ValueError, match="forecast_days"):
+            _validate_strategies(config)
+
+
+class TestCoverageFetchValidation:
+    def test_valid_shard_and_budget(self):
+        config = {**BASE_CONFIG, "coverage_shard_days": 0, "ce_requests_per_second": 5.0}
+        validate_scheduler_config(config)
+
+    def test_negative_shard_days_rejected(self):
+        config = {**BASE_CONFIG, "coverage_shard_days": -1}
+        with pytest.raises(ValueError, match="coverage_shard_days"):
+            validate_scheduler_config(config)
+
+    def test_zero_request_budget_rejected(self):
+        config = {**BASE_CONFIG, "ce_requests_per_second": 0}
+        with pytest.raises(ValueError, match="ce_requests_per_second"):
+            validate_scheduler_config(config)
+
+    def test_unknown_fetch_mode_rejected(self):
+        config = {**BASE_CONFIG, "coverage_fetch_mode": "bulk"}
+        with pytest.raises(ValueError, match="coverage_fetch_mode"):
+            validate_scheduler_config(config)
@@ -548,3 +548,153 @@ def test_static_already_at_target():
     result = purchase_calculator.calculate_purchase_need(config, clients)
 
     assert len(result) == 0
+
+
+# ============================================================================
+# Budget Target Tests (joint allocation across types)
+# ============================================================================
+
+
+def test_budget_one_shot_spends_at_most_budget():
+    """Budget target with one_shot: purchases across types sum to the cap."""
+    from unittest.mock import Mock
+
+    config = {
+        "enable_compute_sp": True,
+        "enable_database_sp": True,
+        "enable_sagemaker_sp": False,
+        "target_strategy_type": "budget",
+        "split_strategy_type": "one_shot",
+        "budget_commitment": 12.0,
+        "savings_percentage": 30.0,
+        "compute_savings_percentage": 30.0,
+        "database_savings_percentage": 30.0,
+        "lookback_hours": 24,
+        "min_commitment_per_plan": 0.001,
+        "compute_sp_payment_option": "ALL_UPFRONT",
+        "compute_sp_term": "THREE_YEAR",
+        "database_sp_payment_option": "NO_UPFRONT",
+    }
+
+    def _type_data(costs):
+        avg = sum(costs) / len(costs)
+        return {
+            "timeseries": [{"total": c} for c in costs],
+            "summary": {
+                "avg_coverage_total": 0.0,
+                "avg_hourly_total": avg,
+                "avg_hourly_covered": 0.0,
+            },
+        }
+
+    spending_data = {
+        "compute": _type_data([10.0] * 24),
+        "database": _type_data([20.0] * 24),
+    }
+
+    result = purchase_calculator.calculate_purchase_need(
+        config, {"ce": Mock(), "savingsplans": Mock()}, spending_data
+    )
+
+    by_type = {plan["sp_type"]: plan["hourly_commitment"] for plan in result}
+    assert sum(by_type.values()) == pytest.approx(12.0)
+    assert all(plan["strategy"] == "budget+one_shot" for plan in result)
+
+
+# ============================================================================
+# Expiring plans (plan ladder)
+# ============================================================================
+
+
+def test_expiring_commitment_is_excluded_from_current_coverage(fixed_gap_split_config):
+    """A $1.4/h plan ending inside the renewal window no longer counts as coverage."""
+    from datetime import UTC, datetime, timedelta
+    from unittest.mock import Mock
+
+    now = datetime.now(UTC)
+    sp_client = Mock()
+    sp_client.describe_savings_plans.return_value = {
+        "savingsPlans": [
+            {
+                "savingsPlanType": "Compute",
+                "commitment": "1.4",
+                "start": (now - timedelta(days=300)).isoformat(),
+                "end": (now + timedelta(days=3)).isoformat(),
+            }
+        ]
+    }
+    config = {**fixed_gap_split_config, "renewal_window_days": 7}
+    spending_data = {
+        "compute": {
+            "summary": {
+                "avg_coverage_total": 50.0,
+                "avg_hourly_total": 10.0,
+                "avg_hourly_covered": 5.0,
+            }
+        }
+    }
+
+    result = purchase_calculator.calculate_purchase_need(
+        config, {"ce": Mock(), "savingsplans": sp_client}, spending_data
+    )
+
+    # $1.4/h at 30% covers $2/h: coverage 50% -> 30%, gap=60, divider=2 -> 30%
+    assert result[0]["details"]["coverage"]["current"] == pytest.approx(30.0)
+    assert result[0]["purchase_percent"] == pytest.approx(30.0)
+    assert spending_data["compute"]["summary"]["avg_hourly_covered"] == 5.0
+
+
+# ============================================================================
+# Shared evaluation context (several combinations, one preparation)
+# ============================================================================
+
+
+def test_purchase_context_matches_per_combination_pipeline():
+    """Every combination evaluated on one context equals its own full pipeline run."""
+    from unittest.mock import Mock
+
+    config = {
+        "enable_compute_sp": True,
+        "enable_database_sp": True,
+        "enable_sagemaker_sp": False,
+        "target_strategy_type": "dynamic",
+        "split_strategy_type": "gap_split",
+        "dynamic_risk_level": "optimal",
+        "budget_commitment": 5.0,
+        "gap_split_divider": 2.0,
+        "fixed_step_percent": 10.0,
+        "max_purchase_percent": 50.0,
+        "min_purchase_percent": 1.0,
+        "min_commitment_per_plan": 0.001,
+        "savings_percentage": 30.0,
+        "lookback_hours": 48,
+        "compute_sp_payment_option": "ALL_UPFRONT",
+        "compute_sp_term": "THREE_YEAR",
+        "database_sp_payment_option": "NO_UPFRONT",
+    }
+    spending_data = {
+        key: {
+            "timeseries": [{"total": base + (hour % 24) * step} for hour in range(48)],
+            "summary": {
+                "avg_coverage_total": 20.0,
+                "avg_hourly_total": base + 11.5 * step,
+                "avg_hourly_covered": (base + 11.5 * step) * 0.2,
+            },
+        }
+        for key, base, step in (("compute", 10.0, 1.0), ("database", 4.0, 0.5))
+    }
+    ce = Mock()
+    ce.get_savings_plans_utilization.return_value = {"SavingsPlansUtilizationsByTime": []}
+    clients = {"ce": ce, "savingsplans": Mock()}
+
+    context = purchase_calculator.PurchaseContext.build(config, clients, spending_data)
+    assert ce.get_savings_plans_utilization.call_count == 2
+
+    for target in ("dynamic", "budget"):
+        for split in ("one_shot", "fixed_step", "gap_split"):
+            combo_config = {**config, "target_strategy_type": target, "split_strategy_type": split}
+            expected = purchase_calculator.calculate_purchase_need(
+                combo_config, clients, spending_data
+            )
+            assert expected
+            assert context.evaluate(target, split) == expected
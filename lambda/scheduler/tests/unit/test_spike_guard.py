@@ -1,5 +1,7 @@
+from datetime import UTC, datetime
 from unittest.mock import Mock, patch
 
+from shared.rolling_averages import RollingAverages
 from shared.usage_decline_check import (
     check_usage_drop,
     check_usage_spike,
@@ -96,12 +98,12 @@ def test_check_usage_spike_multiple_types():
     assert result["database"]["flagged"] is False
 
 
-@patch("shared.usage_decline_check.fetch_averages")
+@patch("shared.usage_decline_check.fetch_window_averages")
 def test_run_scheduling_spike_guard(mock_fetch):
-    mock_fetch.side_effect = [
-        {"compute": 1.0},  # long-term
-        {"compute": 1.3},  # short-term (30% spike)
-    ]
+    mock_fetch.return_value = {
+        90: {"compute": 1.0},  # long-term
+        14: {"compute": 1.3},  # short-term (30% spike)
+    }
     config = {
         "spike_guard_long_lookback_days": 90,
         "spike_guard_short_lookback_days": 14,
@@ -112,12 +114,12 @@ def test_run_scheduling_spike_guard(mock_fetch):
     assert short_avgs == {"compute": 1.3}
 
 
-@patch("shared.usage_decline_check.fetch_averages")
+@patch("shared.usage_decline_check.fetch_window_averages")
 def test_run_scheduling_spike_guard_no_spike(mock_fetch):
-    mock_fetch.side_effect = [
-        {"compute": 1.0},
-        {"compute": 1.05},
-    ]
+    mock_fetch.return_value = {
+        90: {"compute": 1.0},
+        14: {"compute": 1.05},
+    }
     config = {
         "spike_guard_long_lookback_days": 90,
         "spike_guard_short_lookback_days": 14,
@@ -147,3 +149,34 @@ def test_run_purchasing_spike_guard_no_drop(mock_fetch):
     }
     results = run_purchasing_spike_guard(Mock(), scheduling_avgs={"compute": 1.0}, config=config)
     assert results["compute"]["flagged"] is False
+
+
+def test_run_scheduling_spike_guard_fetches_daily_series_once():
+    analyzer = Mock()
+    analyzer.analyze_daily_spending.return_value = {
+        "compute": {"timeseries": [], "summary": {}},
+    }
+    config = {
+        "spike_guard_long_lookback_days": 90,
+        "spike_guard_short_lookback_days": 14,
+        "spike_guard_threshold_percent": 20,
+    }
+
+    run_scheduling_spike_guard(analyzer, config)
+
+    analyzer.analyze_daily_spending.assert_called_once()
+    assert analyzer.analyze_daily_spending.call_args.args[0]["lookback_days"] == 90
+
+
+def test_run_scheduling_spike_guard_reuses_long_enough_series():
+    analyzer = Mock()
+    series = RollingAverages({"compute": {"timeseries": []}}, 365, datetime(2026, 3, 1, tzinfo=UTC))
+    config = {
+        "spike_guard_long_lookback_days": 90,
+        "spike_guard_short_lookback_days": 14,
+        "spike_guard_threshold_percent": 20,
+    }
+
+    run_scheduling_spike_guard(analyzer, config, series)
+
+    analyzer.analyze_daily_spending.assert_not_called()
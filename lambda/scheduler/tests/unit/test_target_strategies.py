@@ -1,7 +1,11 @@
+import random
+
 import pytest
 
+from shared.optimal_coverage import CostProfile
 from shared.target_strategies import resolve_target
 from shared.target_strategies.aws_target import resolve_aws
+from shared.target_strategies.budget_target import allocate_budget, resolve_budget
 from shared.target_strategies.dynamic_target import resolve_dynamic
 
 
@@ -137,3 +141,140 @@ class TestDynamicTarget:
         config = {"dynamic_risk_level": "prudent", "savings_percentage": 30.0}
         result = resolve_dynamic(config, spending, sp_type_key="compute")
         assert result == pytest.approx(85.0)
+
+    def test_forecast_follows_recent_growth(self):
+        """Usage that doubled over the lookback: the forecast targets above the history."""
+        week = [20.0 if h % 24 >= 8 else 10.0 for h in range(168)]
+        spending = self._spending_data(week * 2 + [cost * 2 for cost in week] * 2)
+
+        historical = resolve_dynamic(
+            {"dynamic_risk_level": "optimal", "savings_percentage": 30.0}, spending, "compute"
+        )
+        forecast = resolve_dynamic(
+            {"dynamic_risk_level": "forecast", "savings_percentage": 30.0}, spending, "compute"
+        )
+
+        assert forecast > historical
+
+    def test_forecast_of_steady_usage_matches_optimal(self):
+        spending = self._spending_data([100.0] * 72)
+        config = {"dynamic_risk_level": "forecast", "savings_percentage": 30.0}
+
+        result = resolve_dynamic(config, spending, sp_type_key="compute")
+
+        assert result == pytest.approx(100.0)
+
+
+# ============================================================================
+# budget_target tests
+# ============================================================================
+
+
+def _combined_savings(curves, allocation):
+    total = 0.0
+    for key, (costs, savings_pct, level) in curves.items():
+        discount_factor = 1 - savings_pct / 100
+        profile = CostProfile(costs)
+        new_level = level + allocation[key] / discount_factor
+        total += profile.net_savings(new_level, discount_factor) - profile.net_savings(
+            level, discount_factor
+        )
+    return total
+
+
+class TestBudgetAllocation:
+    def _curves(self, seed):
+        rng = random.Random(seed)
+        return {
+            "compute": ([rng.uniform(40, 120) for _ in range(168)], 30.0, 20.0),
+            "database": ([rng.uniform(5, 60) for _ in range(168)], 45.0, 0.0),
+        }
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_beats_every_split_of_the_budget(self, seed):
+        curves = self._curves(seed)
+        budget = 25.0
+
+        allocation = allocate_budget(curves, budget)
+        best = _combined_savings(curves, allocation)
+
+        assert sum(allocation.values()) <= budget + 1e-9
+        for step in range(101):
+            compute = budget * step / 100
+            split = {"compute": compute, "database": budget - compute}
+            assert best >= _combined_savings(curves, split) - 1e-6
+
+    def test_large_budget_stops_at_each_optimum(self):
+        curves = self._curves(7)
+        curves["compute"] = (curves["compute"][0], 30.0, 0.0)
+
+        allocation = allocate_budget(curves, 1e6)
+
+        for key, (costs, savings_pct, _) in curves.items():
+            discount_factor = 1 - savings_pct / 100
+            optimum, _ = CostProfile(costs).exact_optimum(discount_factor)
+            assert allocation[key] / discount_factor == pytest.approx(optimum)
+
+    def test_fully_covered_type_gets_nothing(self):
+        curves = {"compute": ([10.0, 20.0, 30.0], 30.0, 30.0)}
+
+        assert allocate_budget(curves, 5.0) == {"compute": 0.0}
+
+
+class TestBudgetTarget:
+    def _spending(self, costs, covered=0.0):
+        return {
+            "timeseries": [{"total": c} for c in costs],
+            "summary": {"avg_hourly_covered": covered},
+        }
+
+    def _config(self, **overrides):
+        config = {
+            "target_strategy_type": "budget",
+            "budget_commitment": 7.0,
+            "savings_percentage": 30.0,
+            "enable_compute_sp": True,
+            "enable_database_sp": True,
+            "enable_sagemaker_sp": False,
+        }
+        config.update(overrides)
+        return config
+
+    def test_dispatches_budget(self):
+        spending = {"compute": self._spending([100.0, 110.0, 120.0])}
+        assert resolve_target(self._config(), spending, "compute") > 0
+
+    def test_flat_usage_takes_whole_budget(self):
+        spending = {"compute": self._spending([100.0] * 24)}
+
+        result = resolve_budget(self._config(budget_commitment=7.0), spending, "compute")
+
+        # $7/h commitment at a 30% discount covers $10/h of $100/h min-hourly
+        assert result == pytest.approx(10.0)
+
+    def test_existing_coverage_is_kept(self):
+        spending = {"compute": self._spending([100.0] * 24, covered=50.0)}
+
+        result = resolve_budget(self._config(), spending, "compute")
+
+        assert result == pytest.approx(60.0)
+
+    def test_budget_goes_to_the_steadier_type(self):
+        spending = {
+            "compute": self._spending([100.0] * 24),
+            "database": self._spending([0.0, 100.0] * 12),
+        }
+        config = self._config()
+
+        assert resolve_budget(config, spending, "compute") == pytest.approx(10.0)
+        assert resolve_budget(config, spending, "database") == pytest.approx(0.0)
+
+    def test_type_without_data_returns_none(self):
+        spending = {"compute": self._spending([100.0] * 24)}
+        assert resolve_budget(self._config(), spending, "database") is None
+
+    def test_requires_spending_data_and_type(self):
+        with pytest.raises(ValueError, match="requires spending data"):
+            resolve_budget(self._config(), None, "compute")
+        with pytest.raises(ValueError, match="one SP type"):
+            resolve_budget(self._config(), {"compute": self._spending([1.0])})
@@ -12,6 +12,8 @@ from typing import Any
 import boto3
 from botocore.exceptions import ClientError
 
+from shared.ce_gateway import DEFAULT_REQUESTS_PER_SECOND, CostExplorerGateway
+
 
 # Configure logging
 logger = logging.getLogger()
@@ -74,14 +76,16 @@ def get_clients(
         session_name: Name for the role session when assuming role
 
     Returns:
-        Dictionary of boto3 clients
+        Dictionary of boto3 clients; "ce" is wrapped in a CostExplorerGateway
+        (rate limited to config ce_requests_per_second and metered)
     """
     role_arn = config.get("management_account_role_arn")
+    ce_rate = config.get("ce_requests_per_second", DEFAULT_REQUESTS_PER_SECOND)
 
     if role_arn:
         session = get_assumed_role_session(role_arn, session_name)
         return {
-            "ce": session.client("ce"),
+            "ce": CostExplorerGateway(session.client("ce"), ce_rate),
             "savingsplans": session.client("savingsplans"),
             # Keep SNS/SQS/S3 using local credentials
             "sns": boto3.client("sns"),
@@ -89,7 +93,7 @@ def get_clients(
             "s3": boto3.client("s3"),
         }
     return {
-        "ce": boto3.client("ce"),
+        "ce": CostExplorerGateway(boto3.client("ce"), ce_rate),
         "savingsplans": boto3.client("savingsplans"),
         "sns": boto3.client("sns"),
         "sqs": boto3.client("sqs"),
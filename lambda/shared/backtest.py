@@ -0,0 +1,351 @@
+"""
+Strategy backtesting: replay recorded spend through the real purchase pipeline.
+
+docs/generate_gap_split_chart.py illustrates an idealized gap_split; this
+module answers "what would target X + split Y have done on our actual spend".
+Every scheduled run builds the same per-type spending data the scheduler sees
+(the lookback window, covered by the simulated plans still active past the
+renewal window) and decides with resolve_target() and purchase_calculator's own
+per-type step (SpTypeSpend + _process_sp_type), exactly as the scheduler does.
+
+Simulated plans sit in a heap keyed by their end, so expirations cost
+O(log P) each and the replay between runs is one pass over the samples:
+three years of hourly data with weekly runs finishes in about a second.
+
+Only targets that work from spending data can be replayed (dynamic, budget);
+aws and static read live AWS recommendations or inventory.
+
+Accounting per sample, per SP type (all in $ over the sample):
+- capacity: on-demand spend the active plans can cover (commitment / discount factor)
+- covered = min(spend, capacity); the rest is paid on demand
+- cost = commitment + uncovered spend; net savings = spend - cost
+- waste = commitment not used (commitment * unused share of capacity)
+- peak unused commitment = highest unused $/h of any sample (summed over types
+  for the totals): the worst exposure a configuration ran into
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from shared import sp_calculations
+from shared.purchase_calculator import SpTypeSpend, _process_sp_type
+from shared.sp_types import SP_TYPES, get_term
+from shared.target_strategies import resolve_target
+
+
+logger = logging.getLogger()
+
+TERM_HOURS = {"ONE_YEAR": 8760, "THREE_YEAR": 3 * 8760}
+
+BACKTEST_TARGETS = ("dynamic", "budget")
+
+_SP_TYPES_BY_KEY = {sp_type["key"]: sp_type for sp_type in SP_TYPES}
+
+
+@dataclass
+class SimulatedPlan:
+    sp_type: str
+    start_sample: int
+    end_sample: int
+    hourly_commitment: float
+    savings_percentage: float
+
+    @property
+    def hourly_coverage(self) -> float:
+        """On-demand $/h this plan covers when fully used."""
+        return sp_calculations.coverage_from_commitment(
+            self.hourly_commitment, self.savings_percentage
+        )
+
+
+class _TypeLedger:
+    """Running totals for one SP type."""
+
+    def __init__(self) -> None:
+        self.commitment = 0.0  # active $/h
+        self.capacity = 0.0  # active on-demand $/h covered
+        self.spend = 0.0
+        self.covered = 0.0
+        self.committed = 0.0
+        self.waste = 0.0
+        self.peak_unused = 0.0  # $/h
+        self.purchases = 0
+        self.expirations = 0
+
+    def account(self, hourly_spend: float, hours: float) -> float:
+        """Add one sample; returns its unused commitment in $/h."""
+        covered = min(hourly_spend, self.capacity)
+        self.spend += hourly_spend * hours
+        self.covered += covered * hours
+        self.committed += self.commitment * hours
+        if self.capacity <= 0:
+            return 0.0
+        unused = self.commitment * (1 - covered / self.capacity)
+        self.waste += unused * hours
+        self.peak_unused = max(self.peak_unused, unused)
+        return unused
+
+    def summary(self) -> dict[str, float]:
+        cost = self.committed + (self.spend - self.covered)
+        net_savings = self.spend - cost
+        return {
+            "on_demand_cost": self.spend,
+            "cost_with_savings_plans": cost,
+            "net_savings": net_savings,
+            "savings_percentage": net_savings / self.spend * 100 if self.spend > 0 else 0.0,
+            "commitment_cost": self.committed,
+            "waste": self.waste,
+            "peak_unused_commitment": self.peak_unused,
+            "utilization": (1 - self.waste / self.committed) * 100 if self.committed > 0 else 0.0,
+            "coverage": self.covered / self.spend * 100 if self.spend > 0 else 0.0,
+            "purchases": self.purchases,
+            "expirations": self.expirations,
+        }
+
+
+def _window_spending(
+    series: list[float],
+    start: int,
+    end: int,
+    effective_capacity: float,
+    timestamps: list[str] | None,
+) -> dict[str, Any]:
+    """SpendingAnalyzer-shaped data for samples [start, end) at a fixed covered capacity."""
+    timeseries = []
+    total_covered = 0.0
+    total_spend = 0.0
+    for i in range(start, end):
+        total = series[i]
+        covered = min(total, effective_capacity)
+        timeseries.append(
+            {
+                "timestamp": timestamps[i] if timestamps else "",
+                "covered": covered,
+                "total": total,
+                "coverage": covered / total * 100 if total > 0 else 0.0,
+            }
+        )
+        total_covered += covered
+        total_spend += total
+    num_samples = end - start
+    return {
+        "timeseries": timeseries,
+        "summary": {
+            "avg_coverage_total": total_covered / total_spend * 100 if total_spend > 0 else 0.0,
+            "avg_hourly_covered": sp_calculations.average_to_hourly(total_covered, num_samples),
+            "avg_hourly_total": sp_calculations.average_to_hourly(total_spend, num_samples),
+        },
+    }
+
+
+class _Replay:
+    """Scheduler runs and plan expirations over the recorded samples."""
+
+    def __init__(
+        self,
+        rates: dict[str, list[float]],
+        config: dict[str, Any],
+        timestamps: list[str] | None,
+        hours_per_sample: int,
+    ):
+        self.rates = rates
+        self.config = config
+        self.timestamps = timestamps
+        self.hours_per_sample = hours_per_sample
+        self.lookback = config["lookback_hours"] // hours_per_sample
+        self.renewal_window = config.get("renewal_window_days", 0) * 24 // hours_per_sample
+        self.ledgers = {key: _TypeLedger() for key in rates}
+        self.expiries: list[tuple[int, int, SimulatedPlan]] = []
+        self.purchases: list[dict[str, Any]] = []
+        self.runs = 0
+        self.peak_unused = 0.0
+
+    def expire(self, t: int) -> None:
+        while self.expiries and self.expiries[0][0] <= t:
+            _, _, plan = heapq.heappop(self.expiries)
+            ledger = self.ledgers[plan.sp_type]
+            ledger.commitment -= plan.hourly_commitment
+            ledger.capacity -= plan.hourly_coverage
+            ledger.expirations += 1
+            if ledger.capacity < 1e-9:  # last plan gone: drop float residue
+                ledger.commitment = ledger.capacity = 0.0
+
+    def schedule(self, t: int) -> None:
+        """One scheduler run at sample t: resolve targets, split, record purchases."""
+        self.runs += 1
+        # Like the scheduler, plans ending within the renewal window count as gone
+        effective_capacity = dict.fromkeys(self.rates, 0.0)
+        for end, _, plan in self.expiries:
+            if end > t + self.renewal_window:
+                effective_capacity[plan.sp_type] += plan.hourly_coverage
+
+        spending_data = {
+            key: _window_spending(
+                series, t - self.lookback, t, effective_capacity[key], self.timestamps
+            )
+            for key, series in self.rates.items()
+        }
+
+        for key in self.rates:
+            target_coverage = resolve_target(self.config, spending_data, sp_type_key=key)
+            if target_coverage is None:
+                continue
+            spend = SpTypeSpend.from_spending(
+                _SP_TYPES_BY_KEY[key], spending_data[key], self.config
+            )
+            plan = _process_sp_type(spend, self.config, target_coverage)
+            if plan:
+                self._buy(
+                    t,
+                    key,
+                    plan["hourly_commitment"],
+                    plan["estimated_savings_percentage"],
+                    target_coverage,
+                )
+
+    def _buy(
+        self, t: int, key: str, hourly_commitment: float, savings_pct: float, target: float
+    ) -> None:
+        term = get_term(key, self.config)
+        plan = SimulatedPlan(
+            sp_type=key,
+            start_sample=t,
+            end_sample=t + TERM_HOURS[term] // self.hours_per_sample,
+            hourly_commitment=hourly_commitment,
+            savings_percentage=savings_pct,
+        )
+        heapq.heappush(self.expiries, (plan.end_sample, len(self.purchases), plan))
+        ledger = self.ledgers[key]
+        ledger.commitment += hourly_commitment
+        ledger.capacity += plan.hourly_coverage
+        ledger.purchases += 1
+        self.purchases.append(
+            {
+                "sample": t,
+                "timestamp": self.timestamps[t] if self.timestamps else None,
+                "sp_type": key,
+                "hourly_commitment": hourly_commitment,
+                "term": term,
+                "target_coverage": target,
+            }
+        )
+
+    def account(self, t: int) -> None:
+        unused = sum(
+            ledger.account(self.rates[key][t], self.hours_per_sample)
+            for key, ledger in self.ledgers.items()
+        )
+        self.peak_unused = max(self.peak_unused, unused)
+
+    def totals(self) -> _TypeLedger:
+        totals = _TypeLedger()
+        for ledger in self.ledgers.values():
+            totals.spend += ledger.spend
+            totals.covered += ledger.covered
+            totals.committed += ledger.committed
+            totals.waste += ledger.waste
+            totals.purchases += ledger.purchases
+            totals.expirations += ledger.expirations
+        totals.peak_unused = self.peak_unused
+        return totals
+
+
+def run_backtest(
+    spend_by_type: dict[str, list[float]],
+    config: dict[str, Any],
+    *,
+    start: datetime | None = None,
+    hours_per_sample: int = 1,
+    interval_hours: int | None = None,
+    lookback_hours: int | None = None,
+) -> dict[str, Any]:
+    """
+    Replay recorded on-demand spend through the configured target + split strategy.
+
+    Args:
+        spend_by_type: sp_type_key -> spend per sample (on-demand $ per hour, or per
+            day with hours_per_sample=24), oldest first, same length for every type
+        config: Scheduler config (target/split strategy, savings_percentage,
+            min_commitment_per_plan, renewal_window_days, enable_*_sp, terms)
+        start: Time of the first sample (timestamps for targets that use them)
+        hours_per_sample: 1 for hourly spend, 24 for daily spend
+        interval_hours: Time between scheduler runs (default purchase_cooldown_days)
+        lookback_hours: Window each run analyzes (default config lookback_hours)
+
+    Returns:
+        {"summary": totals over all types, "by_type": {key: totals},
+         "purchases": [{"sample", "timestamp", "sp_type", "hourly_commitment",
+         "term", "target_coverage"}], "runs": scheduler runs,
+         "evaluated_hours": replayed hours}.
+        Totals cover the replay from the first run (the first lookback only
+        seeds it): on_demand_cost, cost_with_savings_plans, net_savings,
+        savings_percentage, commitment_cost, waste, peak_unused_commitment ($/h),
+        utilization, coverage, purchases, expirations.
+
+    Raises:
+        ValueError: For unsupported targets, mismatched series or a replay
+            shorter than one lookback window
+    """
+    if config["target_strategy_type"] not in BACKTEST_TARGETS:
+        raise ValueError(
+            f"Backtesting supports targets: {', '.join(BACKTEST_TARGETS)} "
+            f"(got '{config['target_strategy_type']}')"
+        )
+    keys = [
+        sp_type["key"]
+        for sp_type in SP_TYPES
+        if config.get(sp_type["enabled_config"]) and sp_type["key"] in spend_by_type
+    ]
+    lengths = {len(spend_by_type[key]) for key in keys}
+    if len(lengths) > 1:
+        raise ValueError("All spend series must have the same length")
+    num_samples = lengths.pop() if lengths else 0
+
+    lookback = max(1, (lookback_hours or config.get("lookback_hours", 336)) // hours_per_sample)
+    interval_hours = interval_hours or config.get("purchase_cooldown_days", 7) * 24
+    interval = max(1, interval_hours // hours_per_sample)
+    if num_samples <= lookback:
+        raise ValueError(
+            f"Backtest needs more than one lookback window of spend ({lookback} samples)"
+        )
+
+    # Per-sample amounts become $/h rates, accounted over hours_per_sample
+    rates = {key: [value / hours_per_sample for value in spend_by_type[key]] for key in keys}
+    timestamps = (
+        [(start + timedelta(hours=i * hours_per_sample)).isoformat() for i in range(num_samples)]
+        if start
+        else None
+    )
+    replay = _Replay(
+        rates,
+        {**config, "lookback_hours": lookback * hours_per_sample},
+        timestamps,
+        hours_per_sample,
+    )
+
+    for t in range(lookback, num_samples):
+        replay.expire(t)
+        if (t - lookback) % interval == 0:
+            replay.schedule(t)
+        replay.account(t)
+
+    summary = replay.totals().summary()
+    logger.info(
+        f"Backtest {config['target_strategy_type']}+{config['split_strategy_type']}: "
+        f"{replay.runs} runs, {summary['purchases']} purchases, "
+        f"net savings ${summary['net_savings']:,.2f} ({summary['savings_percentage']:.1f}%), "
+        f"waste ${summary['waste']:,.2f}"
+    )
+
+    return {
+        "summary": summary,
+        "by_type": {key: ledger.summary() for key, ledger in replay.ledgers.items()},
+        "purchases": replay.purchases,
+        "runs": replay.runs,
+        "evaluated_hours": (num_samples - lookback) * hours_per_sample,
+    }
@@ -0,0 +1,237 @@
+"""
+Cost Explorer call gateway: rate limiting, throttling backoff and cost metering.
+
+Every Cost Explorer request is billed ($0.01 per paginated request) and subject
+to a low account-wide request rate. get_clients() wraps the boto3 "ce" client
+in a CostExplorerGateway, so every CE call in shared/ goes through:
+
+- a token-bucket limiter (CE_REQUESTS_PER_SECOND),
+- retries with exponential backoff on ThrottlingException, halving the limiter
+  rate on each throttle and restoring it gradually on success,
+- a per-invocation meter of calls, throttles and estimated cost,
+- memoization of read operations: identical calls (same operation and
+  parameters) within one invocation are served from the first response, and
+  concurrent identical calls wait for the in-flight request instead of
+  issuing their own. The reporter's scheduler preview re-runs the same
+  utilization/recommendation queries once per strategy combination.
+
+Like aws_debug, the meter is module-global; handler_utils.initialize_clients()
+resets it at the start of each invocation and handlers report
+get_meter_summary() in their response body.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from typing import Any
+
+from botocore.exceptions import ClientError
+
+
+logger = logging.getLogger(__name__)
+
+CE_REQUEST_COST_USD = 0.01
+DEFAULT_REQUESTS_PER_SECOND = 5.0
+MAX_THROTTLE_RETRIES = 5
+BASE_BACKOFF_SECONDS = 0.5
+MAX_BACKOFF_SECONDS = 20.0
+
+THROTTLING_ERROR_CODES = {
+    "ThrottlingException",
+    "Throttling",
+    "TooManyRequestsException",
+    "RequestLimitExceeded",
+}
+
+# Client attributes that are not billed API operations
+_PASSTHROUGH_ATTRIBUTES = {
+    "meta",
+    "exceptions",
+    "can_paginate",
+    "get_paginator",
+    "get_waiter",
+    "close",
+}
+
+# Read-only operations whose responses can be reused within one invocation
+_MEMOIZED_PREFIXES = ("get_", "list_", "describe_")
+
+# Per-invocation meter (reset by reset_meter)
+_METER_LOCK = threading.Lock()
+_CALLS: Counter[str] = Counter()
+_THROTTLES: Counter[str] = Counter()
+_MEMO_HITS: Counter[str] = Counter()
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting how many requests start per second.
+
+    Allows an initial burst of `rate` requests, then spaces further starts
+    1/rate apart. A non-positive rate disables limiting.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def set_rate(self, rate: float) -> None:
+        with self._lock:
+            self.rate = rate
+            self._tokens = min(self._tokens, rate)
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+def _is_throttling(error: ClientError) -> bool:
+    return error.response.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES
+
+
+def _memo_key(operation: str, kwargs: dict[str, Any]) -> str:
+    return operation + ":" + json.dumps(kwargs, sort_keys=True, default=str)
+
+
+class CostExplorerGateway:
+    """Drop-in wrapper around a boto3 Cost Explorer client.
+
+    One gateway is built per invocation by get_clients(), so its memo never
+    outlives the run. Callers get deep copies and may mutate responses freely.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+        max_retries: int = MAX_THROTTLE_RETRIES,
+        base_backoff: float = BASE_BACKOFF_SECONDS,
+        memoize: bool = True,
+    ):
+        self._client = client
+        self._target_rate = requests_per_second
+        self._limiter = TokenBucket(requests_per_second)
+        self._max_retries = max_retries
+        self._base_backoff = base_backoff
+        self._memoize = memoize
+        self._memo: dict[str, Any] = {}
+        self._inflight: dict[str, threading.Event] = {}
+        self._memo_lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if name.startswith("_") or name in _PASSTHROUGH_ATTRIBUTES or not callable(attr):
+            return attr
+
+        memoize = self._memoize and name.startswith(_MEMOIZED_PREFIXES)
+
+        def call(**kwargs: Any) -> Any:
+            if memoize:
+                return self._memoized_call(name, attr, kwargs)
+            return self._call(name, attr, kwargs)
+
+        return call
+
+    def _memoized_call(self, operation: str, method: Any, kwargs: dict[str, Any]) -> Any:
+        key = _memo_key(operation, kwargs)
+        while True:
+            with self._memo_lock:
+                if key in self._memo:
+                    with _METER_LOCK:
+                        _MEMO_HITS[operation] += 1
+                    return copy.deepcopy(self._memo[key])
+                pending = self._inflight.get(key)
+                if pending is None:
+                    pending = self._inflight[key] = threading.Event()
+                    break
+            # Another thread is fetching the same request: wait, then re-check
+            # (if it failed, the memo is still empty and this thread retries)
+            pending.wait()
+
+        try:
+            response = self._call(operation, method, kwargs)
+            with self._memo_lock:
+                self._memo[key] = response
+            return copy.deepcopy(response)
+        finally:
+            with self._memo_lock:
+                del self._inflight[key]
+            pending.set()
+
+    def _call(self, operation: str, method: Any, kwargs: dict[str, Any]) -> Any:
+        for attempt in range(self._max_retries + 1):
+            self._limiter.acquire()
+            try:
+                response = method(**kwargs)
+            except ClientError as e:
+                if not _is_throttling(e) or attempt == self._max_retries:
+                    raise
+                with _METER_LOCK:
+                    _THROTTLES[operation] += 1
+                self._slow_down()
+                delay = min(MAX_BACKOFF_SECONDS, self._base_backoff * 2**attempt)
+                delay *= random.uniform(0.5, 1.0)  # jitter
+                logger.warning(
+                    f"Cost Explorer throttled {operation} (attempt {attempt + 1}), "
+                    f"retrying in {delay:.2f}s at {self._limiter.rate:.2f} req/s"
+                )
+                time.sleep(delay)
+                continue
+
+            with _METER_LOCK:
+                _CALLS[operation] += 1
+            self._speed_up()
+            return response
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _slow_down(self) -> None:
+        if self._limiter.rate > 0:
+            self._limiter.set_rate(max(0.5, self._limiter.rate / 2))
+
+    def _speed_up(self) -> None:
+        rate = self._limiter.rate
+        if 0 < rate < self._target_rate:
+            self._limiter.set_rate(min(self._target_rate, rate + 0.5))
+
+
+def reset_meter() -> None:
+    """Start a fresh per-invocation meter."""
+    with _METER_LOCK:
+        _CALLS.clear()
+        _THROTTLES.clear()
+        _MEMO_HITS.clear()
+
+
+def get_meter_summary() -> dict[str, Any]:
+    """
+    Summarize Cost Explorer usage since the last reset_meter().
+
+    Returns:
+        dict: ce_api_calls, ce_throttled_requests, ce_memoized_calls (duplicate
+            calls served without a request), ce_estimated_cost_usd and
+            per-operation call counts (ce_calls_by_operation)
+    """
+    with _METER_LOCK:
+        calls = sum(_CALLS.values())
+        return {
+            "ce_api_calls": calls,
+            "ce_throttled_requests": sum(_THROTTLES.values()),
+            "ce_memoized_calls": sum(_MEMO_HITS.values()),
+            "ce_estimated_cost_usd": round(calls * CE_REQUEST_COST_USD, 2),
+            "ce_calls_by_operation": dict(sorted(_CALLS.items())),
+        }
@@ -44,12 +44,24 @@ STRATEGY_PARAMS = {
         "default": "85.0",
         "env_var": "PRUDENT_PERCENTAGE",
     },
+    "forecast_days": {
+        "required": False,
+        "type": "int",
+        "default": "7",
+        "env_var": "FORECAST_DAYS",
+    },
     "static_commitment": {
         "required": False,
         "type": "float",
         "default": "0",
         "env_var": "STATIC_COMMITMENT",
     },
+    "budget_commitment": {
+        "required": False,
+        "type": "float",
+        "default": "0",
+        "env_var": "BUDGET_COMMITMENT",
+    },
     "savings_percentage": {
         "required": False,
         "type": "float",
@@ -147,6 +159,11 @@ AWS_COMMON = {
         "env_var": "MANAGEMENT_ACCOUNT_ROLE_ARN",
     },
     "tags": {"required": False, "type": "json", "default": "{}", "env_var": "TAGS"},
+    "coverage_cache_bucket": {
+        "required": False,
+        "type": "str",
+        "env_var": "COVERAGE_CACHE_BUCKET",
+    },
 }
 
 TIMING_PARAMS = {
@@ -156,6 +173,30 @@ TIMING_PARAMS = {
         "default": "336",
         "env_var": "LOOKBACK_HOURS",
     },
+    "coverage_shard_days": {
+        "required": False,
+        "type": "int",
+        "default": "7",
+        "env_var": "COVERAGE_SHARD_DAYS",
+    },
+    "ce_requests_per_second": {
+        "required": False,
+        "type": "float",
+        "default": "5",
+        "env_var": "CE_REQUESTS_PER_SECOND",
+    },
+    "history_lookback_days": {
+        "required": False,
+        "type": "int",
+        "default": "0",
+        "env_var": "HISTORY_LOOKBACK_DAYS",
+    },
+    "coverage_fetch_mode": {
+        "required": False,
+        "type": "str",
+        "default": "filtered",
+        "env_var": "COVERAGE_FETCH_MODE",
+    },
     "renewal_window_days": {
         "required": False,
         "type": "int",
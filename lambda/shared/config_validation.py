@@ -9,10 +9,11 @@ from typing import Any
 
 VALID_PAYMENT_OPTIONS = ["NO_UPFRONT", "ALL_UPFRONT", "PARTIAL_UPFRONT"]
 VALID_TERMS = ["ONE_YEAR", "THREE_YEAR"]
-VALID_TARGET_STRATEGIES = ["aws", "dynamic", "static"]
+VALID_TARGET_STRATEGIES = ["aws", "budget", "dynamic", "static"]
 VALID_SPLIT_STRATEGIES = ["one_shot", "fixed_step", "gap_split"]
-VALID_RISK_LEVELS = ["prudent", "min_hourly", "optimal", "maximum"]
+VALID_RISK_LEVELS = ["prudent", "min_hourly", "optimal", "maximum", "forecast"]
 VALID_REPORT_FORMATS = ["html", "json", "csv"]
+VALID_COVERAGE_FETCH_MODES = ["filtered", "grouped"]
 
 
 def _validate_number(
@@ -60,6 +61,29 @@ def _validate_lookback_hours(config: dict[str, Any]) -> None:
     )
 
 
+def _validate_coverage_fetch_params(config: dict[str, Any]) -> None:
+    if "coverage_shard_days" in config:
+        # 0 disables sharding (one request per SP type for the whole lookback)
+        _validate_number(
+            config["coverage_shard_days"], "coverage_shard_days", min_val=0, integer=True
+        )
+    if "ce_requests_per_second" in config:
+        _validate_number(config["ce_requests_per_second"], "ce_requests_per_second", min_val=1)
+    if "history_lookback_days" in config:
+        # Bounded by the retention of shared.hourly_history (MAX_HISTORY_DAYS)
+        _validate_number(
+            config["history_lookback_days"],
+            "history_lookback_days",
+            min_val=0,
+            max_val=400,
+            integer=True,
+        )
+    if "coverage_fetch_mode" in config:
+        _validate_choice(
+            config["coverage_fetch_mode"], "coverage_fetch_mode", VALID_COVERAGE_FETCH_MODES
+        )
+
+
 def _validate_strategies(config: dict[str, Any]) -> None:
     if "target_strategy_type" in config:
         _validate_choice(
@@ -71,6 +95,14 @@ def _validate_strategies(config: dict[str, Any]) -> None:
         )
     if config.get("dynamic_risk_level"):
         _validate_choice(config["dynamic_risk_level"], "dynamic_risk_level", VALID_RISK_LEVELS)
+    if "forecast_days" in config:
+        _validate_number(
+            config["forecast_days"], "forecast_days", min_val=1, max_val=90, integer=True
+        )
+    if config.get("target_strategy_type") == "budget":
+        _validate_number(config.get("budget_commitment"), "budget_commitment")
+        if config["budget_commitment"] <= 0:
+            raise ValueError("Field 'budget_commitment' must be greater than 0 for budget target")
 
 
 def _validate_spike_guard_params(config: dict[str, Any]) -> None:
@@ -153,6 +185,7 @@ def validate_scheduler_config(config: dict[str, Any]) -> None:
     _validate_sp_types_enabled(config)
     _validate_scheduler_numeric_fields(config)
     _validate_lookback_hours(config)
+    _validate_coverage_fetch_params(config)
 
     for name in ("compute_sp_term", "sagemaker_sp_term"):
         if name in config:
@@ -168,6 +201,7 @@ def validate_scheduler_config(config: dict[str, Any]) -> None:
 
     _validate_strategies(config)
     _validate_spike_guard_params(config)
+    _validate_non_empty_strings(config, ["coverage_cache_bucket"])
 
 
 def validate_reporter_config(config: dict[str, Any]) -> None:
@@ -189,6 +223,7 @@ def validate_reporter_config(config: dict[str, Any]) -> None:
         )
 
     _validate_lookback_hours(config)
+    _validate_coverage_fetch_params(config)
 
     if "low_utilization_threshold" in config:
         _validate_number(
@@ -204,6 +239,7 @@ def validate_reporter_config(config: dict[str, Any]) -> None:
             "reports_bucket",
             "sns_topic_arn",
             "management_account_role_arn",
+            "coverage_cache_bucket",
             "slack_webhook_url",
             "teams_webhook_url",
         ],
@@ -220,6 +256,7 @@ def validate_purchaser_config(config: dict[str, Any]) -> None:
         )
 
     _validate_lookback_hours(config)
+    _validate_coverage_fetch_params(config)
 
     if "tags" in config and not isinstance(config["tags"], dict):
         raise ValueError(
@@ -232,6 +269,7 @@ def validate_purchaser_config(config: dict[str, Any]) -> None:
             "queue_url",
             "sns_topic_arn",
             "management_account_role_arn",
+            "coverage_cache_bucket",
             "slack_webhook_url",
             "teams_webhook_url",
         ],
@@ -0,0 +1,182 @@
+"""
+Persistent cache for finalized Cost Explorer coverage data.
+
+Cost Explorer keeps revising the most recent ~48 hours of usage, but older hours
+never change. This module stores finalized coverage items per UTC day, SP type
+and granularity (one object per day under the coverage-cache/ prefix of the
+reports bucket, or the local data dir in local mode), so later runs only pay
+for Cost Explorer requests covering missing or still-settling hours.
+
+Usage from SpendingAnalyzer:
+    plan = cache.plan("HOURLY", "Compute", services, start, end, now=now)
+    # fetch plan.missing_windows from Cost Explorer, then:
+    cache.store(plan, fetched_items)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any
+
+from shared.storage_adapter import StorageAdapter
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "coverage-cache/v1"
+
+# Cost Explorer revises usage for roughly two days; anything older is immutable.
+FINALIZED_AFTER = timedelta(hours=48)
+
+MAX_CACHE_IO_WORKERS = 8
+
+
+@dataclass
+class CachePlan:
+    """Split of a requested time range into cached days and windows to fetch."""
+
+    granularity: str
+    sp_type: str
+    service_list: list[str]
+    cached_items: list[dict[str, Any]] = field(default_factory=list)
+    missing_windows: list[tuple[datetime, datetime]] = field(default_factory=list)
+    cacheable_days: list[str] = field(default_factory=list)
+
+
+def _day_key(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%d")
+
+
+def _item_day(item: dict[str, Any]) -> str:
+    return item.get("TimePeriod", {}).get("Start", "")[:10]
+
+
+class CoverageCache:
+    """Day-partitioned store of finalized coverage items."""
+
+    def __init__(self, storage: StorageAdapter, finalized_after: timedelta = FINALIZED_AFTER):
+        self.storage = storage
+        self.finalized_after = finalized_after
+
+    def _object_key(self, granularity: str, sp_type: str, service_list: list[str], day: str) -> str:
+        # Service list digest: editing the service constants invalidates old entries
+        digest = hashlib.sha256(",".join(sorted(service_list)).encode()).hexdigest()[:12]
+        return f"{CACHE_PREFIX}/{granularity.lower()}/{sp_type.lower()}-{digest}/{day}.json"
+
+    def _load_day(self, key: str) -> list[dict[str, Any]] | None:
+        try:
+            body = self.storage.read_object(key)
+        except Exception as e:
+            logger.warning(f"Coverage cache read failed for {key}, refetching: {e}")
+            return None
+        if body is None:
+            return None
+        try:
+            return json.loads(body)
+        except ValueError:
+            logger.warning(f"Ignoring corrupt coverage cache entry {key}")
+            return None
+
+    def plan(
+        self,
+        granularity: str,
+        sp_type: str,
+        service_list: list[str],
+        start_time: datetime,
+        end_time: datetime,
+        *,
+        now: datetime,
+    ) -> CachePlan:
+        """
+        Work out which parts of [start_time, end_time) must come from Cost Explorer.
+
+        Only whole UTC days that ended at least finalized_after before now are
+        cacheable; partial leading days and still-settling days are always fetched.
+
+        Returns:
+            CachePlan: Cached items, half-open windows to fetch (adjacent days
+                merged), and the fetched days that should be stored afterwards.
+        """
+        plan = CachePlan(granularity, sp_type, service_list)
+        finalized_before = now - self.finalized_after
+
+        segments = []  # (segment_start, segment_end, day key or None if not cacheable)
+        cursor = start_time
+        while cursor < end_time:
+            day_start = cursor.replace(hour=0, minute=0, second=0, microsecond=0)
+            day_end = min(day_start + timedelta(days=1), end_time)
+            is_whole_day = cursor == day_start and day_end == day_start + timedelta(days=1)
+            cacheable = is_whole_day and day_end <= finalized_before
+            segments.append((cursor, day_end, _day_key(day_start) if cacheable else None))
+            cursor = day_end
+
+        keys = {
+            day: self._object_key(granularity, sp_type, service_list, day)
+            for _, _, day in segments
+            if day
+        }
+        with ThreadPoolExecutor(max_workers=MAX_CACHE_IO_WORKERS) as executor:
+            loaded = dict(zip(keys, executor.map(self._load_day, keys.values()), strict=True))
+
+        for segment_start, segment_end, day in segments:
+            items = loaded.get(day) if day else None
+            if items is not None:
+                plan.cached_items.extend(items)
+                continue
+            if day:
+                plan.cacheable_days.append(day)
+            if plan.missing_windows and plan.missing_windows[-1][1] == segment_start:
+                plan.missing_windows[-1] = (plan.missing_windows[-1][0], segment_end)
+            else:
+                plan.missing_windows.append((segment_start, segment_end))
+
+        logger.debug(
+            f"Coverage cache {granularity} {sp_type}: {len(keys) - len(plan.cacheable_days)} "
+            f"day(s) cached, {len(plan.missing_windows)} window(s) to fetch"
+        )
+        return plan
+
+    def store(self, plan: CachePlan, fetched_items: list[dict[str, Any]]) -> None:
+        """Persist the finalized days of a completed fetch (empty days included)."""
+        if not plan.cacheable_days:
+            return
+
+        by_day: dict[str, list[dict[str, Any]]] = {day: [] for day in plan.cacheable_days}
+        for item in fetched_items:
+            day_items = by_day.get(_item_day(item))
+            if day_items is not None:
+                day_items.append(item)
+
+        def write(day: str) -> None:
+            key = self._object_key(plan.granularity, plan.sp_type, plan.service_list, day)
+            try:
+                self.storage.write_object(key, json.dumps(by_day[day]).encode("utf-8"))
+            except Exception as e:
+                logger.warning(f"Coverage cache write failed for {key}: {e}")
+
+        with ThreadPoolExecutor(max_workers=MAX_CACHE_IO_WORKERS) as executor:
+            list(executor.map(write, by_day))
+
+        logger.info(
+            f"Coverage cache {plan.granularity} {plan.sp_type}: stored {len(by_day)} day(s)"
+        )
+
+
+def build_coverage_cache(config: dict[str, Any], s3_client: Any) -> CoverageCache | None:
+    """
+    Create the coverage cache when COVERAGE_CACHE_BUCKET is configured.
+
+    In local mode entries are written under the local data dir instead of S3.
+
+    Returns:
+        CoverageCache or None if caching is disabled.
+    """
+    bucket = config.get("coverage_cache_bucket")
+    if not bucket:
+        return None
+    return CoverageCache(StorageAdapter(s3_client, bucket))
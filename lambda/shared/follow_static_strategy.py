@@ -4,7 +4,7 @@ import logging
 from typing import Any
 
 from shared.constants import AWS_TYPE_TO_KEY
-from shared.savings_plans_metrics import get_active_savings_plans
+from shared.plan_inventory import get_plan_inventory
 from shared.sp_types import SP_TYPES, get_term
 from shared.split_strategies import calculate_split
 
@@ -14,12 +14,12 @@ logger = logging.getLogger()
 
 def _get_current_commitments(savingsplans_client: Any) -> dict[str, float]:
     """Get total hourly commitment per SP type from active plans."""
-    plans = get_active_savings_plans(savingsplans_client)
     commitments: dict[str, float] = {}
-    for plan in plans:
-        key = AWS_TYPE_TO_KEY.get(plan["plan_type"])
+    by_type = get_plan_inventory(savingsplans_client).commitment_by_type()
+    for plan_type, commitment in by_type.items():
+        key = AWS_TYPE_TO_KEY.get(plan_type)
         if key:
-            commitments[key] = commitments.get(key, 0.0) + plan["hourly_commitment"]
+            commitments[key] = commitments.get(key, 0.0) + commitment
     return commitments
 
 
@@ -22,7 +22,10 @@ if TYPE_CHECKING:
 
 from shared import notifications
 from shared.aws_utils import get_clients
+from shared.ce_gateway import reset_meter
 from shared.constants import PLAN_TYPE_COMPUTE, PLAN_TYPE_DATABASE, PLAN_TYPE_SAGEMAKER
+from shared.optimal_coverage import clear_strategy_cache
+from shared.plan_inventory import reset_plan_inventories
 
 
 # Configure logging
@@ -146,7 +149,12 @@ def initialize_clients(
     """Build AWS clients (assumes role when management_account_role_arn is set).
 
     On ClientError, logs, invokes error_callback if provided, then re-raises.
+    Also starts a fresh Cost Explorer call meter, plan inventory and strategy
+    cache for this invocation.
     """
+    reset_meter()
+    reset_plan_inventories()
+    clear_strategy_cache()
     try:
         clients = get_clients(config, session_name=session_name)
         logger.info(f"AWS clients initialized successfully (session: {session_name})")
@@ -0,0 +1,241 @@
+"""
+Long-horizon hourly coverage history beyond Cost Explorer's 14-day retention.
+
+Each SP type has one compact binary object holding two float64 columns (total
+spend and covered spend) indexed by hour since a fixed start hour. Every run
+appends the finalized hours it fetched from Cost Explorer, so the history grows
+past the 336-hour API limit and SpendingAnalyzer can serve 90+ days of hourly
+data without extra API calls.
+
+Object layout (little-endian):
+    header: magic b"SPH1", start hour (int64, hours since epoch), hour count n (int64)
+    body:   n float64 totals, then n float64 covered values
+
+Hours with no data are stored as NaN and skipped when read. Objects live under
+the coverage-cache/ prefix of the reports bucket (same IAM scope as the
+coverage cache); in local mode they are memory-mapped from the local data dir.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import mmap
+import struct
+import sys
+from array import array
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from shared.storage_adapter import StorageAdapter
+
+
+logger = logging.getLogger(__name__)
+
+HISTORY_PREFIX = "coverage-cache/hourly-history/v1"
+MAX_HISTORY_DAYS = 400
+
+_MAGIC = b"SPH1"
+_HEADER = struct.Struct("<4sqq")
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_CE_HOUR_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def _hour_index(moment: datetime) -> int:
+    return int((moment - _EPOCH).total_seconds() // 3600)
+
+
+def _hour_start(index: int) -> datetime:
+    return _EPOCH + timedelta(hours=index)
+
+
+def _to_le_bytes(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array("d", values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_le_bytes(buffer: Any) -> array:
+    values = array("d")
+    values.frombytes(buffer)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+@dataclass
+class HourlySeries:
+    """Contiguous hourly columns starting at start_hour (hours since epoch)."""
+
+    start_hour: int
+    totals: array
+    covered: array
+
+    @property
+    def end_hour(self) -> int:
+        """Exclusive end hour index."""
+        return self.start_hour + len(self.totals)
+
+    @property
+    def start_time(self) -> datetime:
+        return _hour_start(self.start_hour)
+
+    @property
+    def end_time(self) -> datetime:
+        """Exclusive end of the stored hours."""
+        return _hour_start(self.end_hour)
+
+
+class HourlyHistoryStore:
+    """Append-only per-SP-type store of finalized hourly coverage."""
+
+    def __init__(self, storage: StorageAdapter):
+        self.storage = storage
+
+    def _object_key(self, sp_type: str) -> str:
+        return f"{HISTORY_PREFIX}/{sp_type.lower()}.bin"
+
+    def load(self, sp_type: str, start: datetime | None = None) -> HourlySeries | None:
+        """
+        Load the stored series, optionally only the hours from start onwards.
+
+        Locally the object is memory-mapped and only the requested column
+        slices are copied; from S3 the object is read once and sliced the same way.
+        """
+        key = self._object_key(sp_type)
+        try:
+            if self.storage.is_local:
+                path = self.storage.reports_dir / key
+                if not path.exists() or path.stat().st_size < _HEADER.size:
+                    return None
+                with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                    return self._decode(memoryview(m), start)
+            body = self.storage.read_object(key)
+        except Exception as e:
+            logger.warning(f"Hourly history read failed for {sp_type}: {e}")
+            return None
+        return self._decode(memoryview(body), start) if body else None
+
+    def _decode(self, view: memoryview, start: datetime | None) -> HourlySeries | None:
+        try:
+            magic, start_hour, count = _HEADER.unpack_from(view)
+            if magic != _MAGIC or len(view) != _HEADER.size + 16 * count:
+                raise ValueError("bad header")
+            skip = 0 if start is None else min(count, max(0, _hour_index(start) - start_hour))
+            totals_at = _HEADER.size + 8 * skip
+            covered_at = _HEADER.size + 8 * (count + skip)
+            size = 8 * (count - skip)
+            return HourlySeries(
+                start_hour + skip,
+                _from_le_bytes(view[totals_at : totals_at + size]),
+                _from_le_bytes(view[covered_at : covered_at + size]),
+            )
+        except (ValueError, struct.error):
+            logger.warning("Ignoring corrupt hourly history object")
+            return None
+        finally:
+            view.release()
+
+    def save(self, sp_type: str, series: HourlySeries) -> None:
+        """Write a series back (S3 has no append, so the object is rewritten)."""
+        header = _HEADER.pack(_MAGIC, series.start_hour, len(series.totals))
+        body = header + _to_le_bytes(series.totals) + _to_le_bytes(series.covered)
+        self.storage.write_object(
+            self._object_key(sp_type), body, content_type="application/octet-stream"
+        )
+
+    def extend(
+        self, sp_type: str, items: list[dict[str, Any]], finalized_before: datetime
+    ) -> HourlySeries | None:
+        """
+        Append finalized hours from freshly fetched hourly items.
+
+        Only hours after the stored end and before finalized_before are appended;
+        gaps between runs are filled with NaN. The series is trimmed to
+        MAX_HISTORY_DAYS.
+
+        Returns:
+            The updated series, or None if nothing was appended.
+        """
+        by_hour: dict[int, tuple[float, float]] = {}
+        cutoff = _hour_index(finalized_before)
+        for item in items:
+            start = item.get("TimePeriod", {}).get("Start", "")
+            try:
+                moment = datetime.strptime(start, _CE_HOUR_FORMAT).replace(tzinfo=UTC)
+            except ValueError:
+                continue
+            index = _hour_index(moment)
+            if index >= cutoff:
+                continue
+            coverage = item.get("Coverage", {})
+            total, covered = by_hour.get(index, (0.0, 0.0))
+            by_hour[index] = (
+                total + float(coverage.get("TotalCost", "0")),
+                covered + float(coverage.get("SpendCoveredBySavingsPlans", "0")),
+            )
+
+        series = self.load(sp_type)
+        first_new = series.end_hour if series else min(by_hour, default=cutoff)
+        new_hours = [index for index in by_hour if index >= first_new]
+        if not new_hours:
+            return None
+        if series is None:
+            series = HourlySeries(first_new, array("d"), array("d"))
+
+        for index in range(series.end_hour, max(new_hours) + 1):
+            total, covered = by_hour.get(index, (math.nan, math.nan))
+            series.totals.append(total)
+            series.covered.append(covered)
+
+        excess = len(series.totals) - MAX_HISTORY_DAYS * 24
+        if excess > 0:
+            series = HourlySeries(
+                series.start_hour + excess, series.totals[excess:], series.covered[excess:]
+            )
+
+        try:
+            self.save(sp_type, series)
+        except Exception as e:
+            logger.warning(f"Hourly history write failed for {sp_type}: {e}")
+            return None
+        logger.info(
+            f"Hourly history {sp_type}: appended {len(new_hours)} hour(s), "
+            f"{len(series.totals)} hour(s) stored"
+        )
+        return series
+
+
+def series_to_items(sp_type: str, series: HourlySeries, end: datetime) -> list[dict[str, Any]]:
+    """Convert stored hours before end to Cost Explorer-shaped coverage items (NaN skipped)."""
+    items = []
+    for index in range(series.start_hour, min(series.end_hour, _hour_index(end))):
+        offset = index - series.start_hour
+        total = series.totals[offset]
+        if math.isnan(total):
+            continue
+        hour = _hour_start(index)
+        items.append(
+            {
+                "TimePeriod": {
+                    "Start": hour.strftime(_CE_HOUR_FORMAT),
+                    "End": (hour + timedelta(hours=1)).strftime(_CE_HOUR_FORMAT),
+                },
+                "Coverage": {
+                    "SpendCoveredBySavingsPlans": repr(series.covered[offset]),
+                    "TotalCost": repr(total),
+                },
+                "Attributes": {"SERVICE": sp_type.lower()},
+            }
+        )
+    return items
+
+
+def build_hourly_history(config: dict[str, Any], s3_client: Any) -> HourlyHistoryStore | None:
+    """Create the history store when COVERAGE_CACHE_BUCKET is configured."""
+    bucket = config.get("coverage_cache_bucket")
+    if not bucket:
+        return None
+    return HourlyHistoryStore(StorageAdapter(s3_client, bucket))
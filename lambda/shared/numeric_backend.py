@@ -0,0 +1,102 @@
+"""
+Numeric kernels with an optional NumPy backend.
+
+The optimizers work on plain lists of floats so the Lambdas need nothing beyond
+the standard library. When NumPy is importable (e.g. from a Lambda layer attached
+through lambda_config.<function>.layers) the kernels below run vectorized
+instead; otherwise the pure-Python versions are used. NUMERIC_BACKEND=python
+forces the fallback.
+
+Both backends return plain Python floats and lists, and follow the same
+operation order wherever the result feeds a comparison:
+- sorted_with_suffix: identical results (np.cumsum adds sequentially, like
+  itertools.accumulate);
+- net_savings_at: identical results (element-wise IEEE arithmetic in the same
+  order as CostProfile.net_savings).
+tests/cross_platform/test_backend_parity.py checks both backends against each
+other.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Any
+
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional (not in the Lambda deployment package)
+    np = None
+
+
+logger = logging.getLogger()
+
+BACKENDS = ("python", "numpy")
+
+_STATE = {
+    "backend": "numpy"
+    if np is not None and os.environ.get("NUMERIC_BACKEND") != "python"
+    else "python"
+}
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+def get_backend() -> str:
+    """Active backend name: "numpy" or "python"."""
+    return _STATE["backend"]
+
+
+def set_backend(name: str) -> None:
+    """
+    Select the backend (tests and benchmarks compare both).
+
+    Raises:
+        ValueError: If name is unknown, or "numpy" is requested without NumPy
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"backend must be one of: {', '.join(BACKENDS)}")
+    if name == "numpy" and np is None:
+        raise ValueError("NumPy backend requested but numpy is not installed")
+    _STATE["backend"] = name
+    logger.debug(f"Numeric backend: {name}")
+
+
+def sorted_with_suffix(values: list[float]) -> tuple[list[float], list[float]]:
+    """(sorted values, suffix sums) where suffix[i] = sum(sorted[i:]) and suffix[n] = 0."""
+    if _STATE["backend"] == "numpy" and values:
+        ordered = np.sort(np.asarray(values, dtype=float))
+        suffix = np.empty(len(ordered) + 1)
+        suffix[-1] = 0.0
+        suffix[-2::-1] = np.cumsum(ordered[::-1])
+        return ordered.tolist(), suffix.tolist()
+    ordered = sorted(values)
+    return ordered, list(accumulate(reversed(ordered), initial=0.0))[::-1]
+
+
+def net_savings_at(
+    sorted_costs: list[float],
+    suffix: list[float],
+    levels: Any,
+    discount_factor: float,
+) -> list[float]:
+    """Net savings at each coverage level, from a sorted profile (see CostProfile)."""
+    num_hours = len(sorted_costs)
+    baseline = suffix[0]
+    if _STATE["backend"] == "numpy":
+        coverage = np.asarray(levels, dtype=float)
+        j = np.searchsorted(np.asarray(sorted_costs), coverage, side="right")
+        spillover = np.asarray(suffix)[j] - coverage * (num_hours - j)
+        return (baseline - coverage * discount_factor * num_hours - spillover).tolist()
+
+    results = []
+    for coverage in levels:
+        j = bisect_right(sorted_costs, coverage)
+        spillover = suffix[j] - coverage * (num_hours - j)
+        results.append(baseline - coverage * discount_factor * num_hours - spillover)
+    return results
@@ -2,9 +2,39 @@
 Optimal Savings Plan Coverage Calculator.
 
 KEEP IN SYNC with docs/js/costCalculator.js — verified by tests/cross_platform/test_algorithm_parity.py.
+
+Two solvers are available:
+- "grid" (default, mirrors the JS): tests 100 coverage levels between min and max
+  hourly cost.
+- "exact": net savings is piecewise linear in coverage with breakpoints at the
+  hourly costs, so the optimum is found by evaluating every breakpoint from the
+  sorted costs and their suffix sums in O(N log N). Its net savings are never
+  below the grid's, and the grid is within N * (max - min) / 100 of it (the
+  slope of the savings curve is bounded by N).
+
+CostProfile holds the sorted costs and their suffix sums once, so net savings at
+any coverage is a binary search away; the grid and exact solvers, the savings
+curve and the knee point all share one profile. The batch kernels behind it run on NumPy
+when it is importable (see shared.numeric_backend).
+
+Results of calculate_optimal_coverage() and calculate_strategies() are memoized
+on a content hash of the cost vector plus their parameters: the reporter's
+scheduler preview resolves the same dynamic targets for several strategy
+combinations, and its charts optimize the same series again. The cache is
+invocation-scoped (handler_utils.initialize_clients() calls
+clear_strategy_cache()) and callers receive copies.
 """
 
-from typing import TypedDict
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+from array import array
+from dataclasses import dataclass
+from typing import Any, TypedDict
+
+from shared.numeric_backend import net_savings_at, sorted_with_suffix
 
 
 class OptimalCoverageResult(TypedDict):
@@ -16,8 +46,130 @@ class OptimalCoverageResult(TypedDict):
     percentiles: dict[str, float]  # P50, P75, P90 as % of max cost
 
 
+SOLVER_METHODS = ("grid", "exact")
+
+# Default discount grid (percent) for calculate_strategy_sweep()
+SENSITIVITY_SAVINGS_PERCENTAGES = tuple(range(10, 75, 5))
+
+# Bound on memoized results; a full cache is simply cleared
+MAX_CACHED_RESULTS = 256
+
+_CACHE_LOCK = threading.Lock()
+_RESULT_CACHE: dict[tuple, Any] = {}
+
+
+def _cost_digest(hourly_costs: list[float]) -> str:
+    """Content hash of the cost vector (order-sensitive, exact float bits)."""
+    return hashlib.blake2b(array("d", hourly_costs).tobytes(), digest_size=16).hexdigest()
+
+
+def _memoized(key: tuple, compute: Any) -> Any:
+    with _CACHE_LOCK:
+        if key in _RESULT_CACHE:
+            return copy.deepcopy(_RESULT_CACHE[key])
+    result = compute()
+    with _CACHE_LOCK:
+        if len(_RESULT_CACHE) >= MAX_CACHED_RESULTS:
+            _RESULT_CACHE.clear()
+        _RESULT_CACHE[key] = result
+    return copy.deepcopy(result)
+
+
+def clear_strategy_cache() -> None:
+    """Forget memoized optimization results (start of each invocation)."""
+    with _CACHE_LOCK:
+        _RESULT_CACHE.clear()
+
+
+@dataclass(frozen=True)
+class SavingsCurve:
+    """Net savings sampled at evenly spaced coverage levels, as compact float arrays."""
+
+    coverage: array
+    net_savings: array
+    savings_percent: array
+
+    def to_dict(self) -> dict[str, list[float]]:
+        """JSON-friendly columns (e.g. for report charts or the simulator)."""
+        return {
+            "coverage": list(self.coverage),
+            "net_savings": list(self.net_savings),
+            "savings_percent": list(self.savings_percent),
+        }
+
+
+class CostProfile:
+    """
+    Sorted hourly costs with suffix sums: net savings at any coverage in O(log N).
+
+    Net savings S(c) = baseline - N * c * discount_factor - sum(max(0, x - c)); with
+    j = number of hours costing <= c, the spillover is suffix[j] - c * (N - j).
+    """
+
+    def __init__(self, hourly_costs: list[float]):
+        # suffix[i] = sum(sorted_costs[i:])
+        self.sorted_costs, self.suffix = sorted_with_suffix(hourly_costs)
+        self.num_hours = len(self.sorted_costs)
+        self.baseline_cost = self.suffix[0]
+
+    def _net_savings_at(self, coverage: float, discount_factor: float, j: int) -> float:
+        spillover_cost = self.suffix[j] - coverage * (self.num_hours - j)
+        return self.baseline_cost - coverage * discount_factor * self.num_hours - spillover_cost
+
+    def net_savings(self, coverage: float, discount_factor: float) -> float:
+        """Net savings over all hours with `coverage` $/h committed."""
+        return self.net_savings_many([coverage], discount_factor)[0]
+
+    def net_savings_many(self, levels: Any, discount_factor: float) -> list[float]:
+        """net_savings() for a batch of coverage levels (vectorized under NumPy)."""
+        return net_savings_at(self.sorted_costs, self.suffix, levels, discount_factor)
+
+    def curve(
+        self, discount_factor: float, start: float, stop: float, num_points: int = 200
+    ) -> SavingsCurve:
+        """Sample num_points + 1 evenly spaced coverage levels from start to stop."""
+        step = (stop - start) / num_points
+        coverage = array("d", (start + i * step for i in range(num_points + 1)))
+        net_savings = array("d", self.net_savings_many(coverage, discount_factor))
+        baseline = self.baseline_cost
+        savings_percent = array(
+            "d", ((net / baseline) * 100 if baseline > 0 else 0 for net in net_savings)
+        )
+        return SavingsCurve(coverage, net_savings, savings_percent)
+
+    def exact_optimum(self, discount_factor: float) -> tuple[float, float]:
+        """
+        Exact (coverage, net savings) maximum over [min_cost, max_cost].
+
+        S is linear between consecutive hourly costs, so the maximum lies on one
+        of them; each breakpoint is evaluated in O(1). Ties keep the lowest
+        coverage reaching the maximum.
+        """
+        costs = self.sorted_costs
+        n = self.num_hours
+        best_coverage = costs[0]
+        best_net_savings = float("-inf")
+        i = 0
+        while i < n:
+            coverage = costs[i]
+            # Skip duplicates: every hour at this cost is fully covered
+            j = i
+            while j < n and costs[j] == coverage:
+                j += 1
+            net_savings = self._net_savings_at(coverage, discount_factor, j)
+            if net_savings > best_net_savings:
+                best_net_savings = net_savings
+                best_coverage = coverage
+            i = j
+
+        return best_coverage, best_net_savings
+
+
 def calculate_optimal_coverage(
-    hourly_costs: list[float], savings_percentage: float
+    hourly_costs: list[float],
+    savings_percentage: float,
+    method: str = "grid",
+    profile: CostProfile | None = None,
 ) -> OptimalCoverageResult:
     """
     Calculate optimal Savings Plan coverage that maximizes net savings.
@@ -26,7 +178,7 @@ def calculate_optimal_coverage(
     docs/js/costCalculator.js. Both implementations should produce
     identical results for the same inputs.
 
-    Algorithm:
+    Algorithm (method="grid"):
     1. Test 100 coverage levels from $0 to max hourly cost
     2. For each level, calculate total cost:
        - Commitment cost: coverage * discount * hours
@@ -34,9 +186,15 @@ def calculate_optimal_coverage(
     3. Compare to baseline on-demand cost
     4. Return the coverage level with maximum net savings
 
+    method="exact" returns the true maximum instead (see module docstring); use it
+    for long inputs (8,760 hours, multi-account series) where the grid is slow
+    and only accurate to 1% of the cost range.
+
     Args:
         hourly_costs: List of hourly costs (typically 168 hours = 1 week)
         savings_percentage: Savings plan discount percentage (e.g., 30 for 30%)
+        method: "grid" (JS-compatible) or "exact"
+        profile: CostProfile of hourly_costs to reuse (built if omitted)
 
     Returns:
         OptimalCoverageResult with optimal coverage and savings analysis
@@ -47,76 +205,87 @@ def calculate_optimal_coverage(
         >>> print(f"Optimal: ${result['coverage_hourly']:.2f}/hr")
         Optimal: $58.50/hr
     """
-    if not hourly_costs:
-        raise ValueError("hourly_costs cannot be empty")
+    key = ("optimal", _cost_digest(hourly_costs), savings_percentage, method)
+    return _memoized(
+        key, lambda: _solve_optimal_coverage(hourly_costs, savings_percentage, method, profile)
+    )
 
-    if not 0 <= savings_percentage <= 99:
-        raise ValueError("savings_percentage must be between 0 and 99")
 
-    sorted_costs = sorted(hourly_costs)
-    max_cost = max(hourly_costs)
-    min_cost = min(hourly_costs)
+def _grid_optimum(profile: CostProfile, discount_factor: float) -> tuple[float, float]:
+    """
+    Best (coverage, net savings) among 100 evenly spaced levels in [min_cost, max_cost].
 
-    # Discount factor: if 30% savings, you pay 70% of on-demand price
-    # NOTE: This is equivalent to shared.sp_calculations.commitment_from_coverage()
-    # Kept as a variable here for performance (reused in loop below)
-    discount_factor = 1 - (savings_percentage / 100)
+    Each level is evaluated on the profile in O(log N). S is flat between
+    breakpoints when N * discount_factor is an integer; near-equal savings are
+    treated as a tie and the lowest coverage is kept, so rounding noise never
+    picks the level and sweeps over round discounts stay monotonic.
+    """
+    min_cost = profile.sorted_costs[0]
+    max_cost = profile.sorted_costs[-1]
+    if max_cost == min_cost:
+        return min_cost, profile.net_savings(min_cost, discount_factor)
 
     best_net_savings = float("-inf")
     best_coverage = min_cost  # Start at min-hourly as baseline
-    best_coverage_percentage = 0.0
+    tolerance = 1e-9 * profile.baseline_cost
 
     # Test coverage levels from min to max (min is always safe)
     # Use 100 increments for granularity
-    range_to_test = max_cost - min_cost
-    if range_to_test == 0:
-        # All costs are the same, optimal is at min (= max)
-        return {
-            "coverage_hourly": min_cost,
-            "coverage_percentage": 100.0,
-            "max_net_savings": sum(hourly_costs) * (savings_percentage / 100),
-            "percentiles": {"p50": 100.0, "p75": 100.0, "p90": 100.0},
-        }
-
-    increment = range_to_test / 100
+    increment = (max_cost - min_cost) / 100
+    levels = []
     coverage_cost = min_cost
+    while coverage_cost <= max_cost:
+        levels.append(coverage_cost)
+        coverage_cost += increment
+
+    for coverage_cost, net_savings in zip(
+        levels, profile.net_savings_many(levels, discount_factor), strict=True
+    ):
+        if net_savings > best_net_savings + tolerance:
+            best_net_savings = net_savings
+            best_coverage = coverage_cost
 
-    # TODO: Optimization - could implement early stopping when savings decrease
-    # Since this is a convex optimization problem, once savings start decreasing,
-    # we've passed the optimal point and can stop testing.
-    # Current implementation tests all 100 points for simplicity and robustness.
+    return best_coverage, best_net_savings
 
-    while coverage_cost <= max_cost:
-        commitment_cost = 0.0
-        spillover_cost = 0.0
 
-        # Calculate cost for this coverage level across all hours (e.g., 336 hours = 14 days)
-        for hour_cost in hourly_costs:
-            # For this hour:
-            # - Commitment: You pay for coverage at discounted rate (e.g., 70% if 30% discount)
-            #   This is paid regardless of whether you use it or not
-            commitment_cost += coverage_cost * discount_factor
+def _solve_optimal_coverage(
+    hourly_costs: list[float],
+    savings_percentage: float,
+    method: str,
+    profile: CostProfile | None,
+) -> OptimalCoverageResult:
+    if not hourly_costs:
+        raise ValueError("hourly_costs cannot be empty")
 
-            # - Spillover: Usage above coverage is paid at full on-demand rate
-            #   If actual usage is $80 and coverage is $50, you pay $30 at on-demand
-            spillover_cost += max(0, hour_cost - coverage_cost)
+    if not 0 <= savings_percentage <= 99:
+        raise ValueError("savings_percentage must be between 0 and 99")
 
-        # Total cost with this SP coverage across all hours
-        total_cost = commitment_cost + spillover_cost
+    if method not in SOLVER_METHODS:
+        raise ValueError(f"method must be one of: {', '.join(SOLVER_METHODS)}")
 
-        # Baseline: what you'd pay without any SP (full on-demand for everything)
-        baseline_cost = sum(hourly_costs)
+    profile = profile or CostProfile(hourly_costs)
+    sorted_costs = profile.sorted_costs
+    max_cost = sorted_costs[-1]
+    min_cost = sorted_costs[0]
 
-        # Net savings: baseline - total_with_sp (can be negative if coverage too high)
-        net_savings = baseline_cost - total_cost
+    # Discount factor: if 30% savings, you pay 70% of on-demand price
+    # NOTE: This is equivalent to shared.sp_calculations.commitment_from_coverage()
+    discount_factor = 1 - (savings_percentage / 100)
 
-        # Track best result
-        if net_savings > best_net_savings:
-            best_net_savings = net_savings
-            best_coverage = coverage_cost
-            best_coverage_percentage = (coverage_cost / max_cost * 100) if max_cost > 0 else 0
+    if max_cost == min_cost:
+        # All costs are the same, optimal is at min (= max)
+        return {
+            "coverage_hourly": min_cost,
+            "coverage_percentage": 100.0,
+            "max_net_savings": sum(hourly_costs) * (savings_percentage / 100),
+            "percentiles": {"p50": 100.0, "p75": 100.0, "p90": 100.0},
+        }
 
-        coverage_cost += increment
+    if method == "exact":
+        best_coverage, best_net_savings = profile.exact_optimum(discount_factor)
+    else:
+        best_coverage, best_net_savings = _grid_optimum(profile, discount_factor)
+    best_coverage_percentage = (best_coverage / max_cost * 100) if max_cost > 0 else 0
 
     # Calculate baseline savings at min-hourly (100% safe coverage)
     min_hourly_savings = min_cost * len(hourly_costs) * (savings_percentage / 100)
@@ -186,64 +355,26 @@ def coverage_as_percentage_of_min(hourly_coverage: float, min_hourly: float) ->
     return (hourly_coverage / min_hourly) * 100
 
 
-def _build_savings_curve(
-    hourly_costs: list[float],
-    discount_factor: float,
-    min_cost: float,
-    max_coverage: float,
-    num_points: int = 200,
-) -> list[dict]:
-    """Build the savings curve by simulating coverage at different levels."""
-    baseline_cost = sum(hourly_costs)
-    step = (max_coverage - min_cost) / num_points
-    curve_points = []
-
-    for i in range(num_points + 1):
-        coverage = min_cost + (i * step)
-
-        commitment_cost = 0.0
-        spillover_cost = 0.0
-
-        for hour_cost in hourly_costs:
-            commitment_cost += coverage * discount_factor
-            spillover_cost += max(0, hour_cost - coverage)
-
-        total_cost = commitment_cost + spillover_cost
-        net_savings = baseline_cost - total_cost
-        savings_pct = (net_savings / baseline_cost) * 100 if baseline_cost > 0 else 0
-
-        curve_points.append(
-            {
-                "coverage": coverage,
-                "savings_percent": savings_pct,
-                "net_savings": net_savings,
-            }
-        )
-
-    return curve_points
-
-
 def _compute_marginal_rates(
-    curve_points: list[dict], min_cost: float, optimal_coverage: float
+    curve: SavingsCurve, min_cost: float, optimal_coverage: float
 ) -> list[dict]:
     """Compute marginal savings rates between curve points."""
+    coverage = curve.coverage
+    savings_percent = curve.savings_percent
     marginal_rates = []
-    for i in range(1, len(curve_points)):
-        if (
-            curve_points[i]["coverage"] <= min_cost
-            or curve_points[i]["coverage"] > optimal_coverage
-        ):
+    for i in range(1, len(coverage)):
+        if coverage[i] <= min_cost or coverage[i] > optimal_coverage:
             continue
-        coverage_delta = curve_points[i]["coverage"] - curve_points[i - 1]["coverage"]
-        savings_delta = curve_points[i]["savings_percent"] - curve_points[i - 1]["savings_percent"]
+        coverage_delta = coverage[i] - coverage[i - 1]
+        savings_delta = savings_percent[i] - savings_percent[i - 1]
         marginal_rate = savings_delta / coverage_delta if coverage_delta > 0 else 0
 
         marginal_rates.append(
             {
                 "index": i,
-                "coverage": curve_points[i]["coverage"],
+                "coverage": coverage[i],
                 "marginal_rate": marginal_rate,
-                "savings_percent": curve_points[i]["savings_percent"],
+                "savings_percent": savings_percent[i],
             }
         )
     return marginal_rates
@@ -254,6 +385,7 @@ def calculate_knee_point(
     savings_percentage: float,
     min_cost: float,
     optimal_coverage: float,
+    profile: CostProfile | None = None,
 ) -> float:
     """
     Calculate the knee point on the savings curve.
@@ -268,6 +400,7 @@ def calculate_knee_point(
         savings_percentage: Savings plan discount percentage (e.g., 30 for 30%)
         min_cost: Minimum hourly cost (baseline)
         optimal_coverage: Optimal coverage from calculate_optimal_coverage()
+        profile: CostProfile of hourly_costs to reuse (built if omitted)
 
     Returns:
         Knee point coverage in $/hour
@@ -275,8 +408,9 @@ def calculate_knee_point(
     discount_factor = 1 - (savings_percentage / 100)
     max_coverage = optimal_coverage * 1.2
 
-    curve_points = _build_savings_curve(hourly_costs, discount_factor, min_cost, max_coverage)
-    marginal_rates = _compute_marginal_rates(curve_points, min_cost, optimal_coverage)
+    profile = profile or CostProfile(hourly_costs)
+    curve = profile.curve(discount_factor, min_cost, max_coverage)
+    marginal_rates = _compute_marginal_rates(curve, min_cost, optimal_coverage)
 
     if not marginal_rates:
         return min_cost
@@ -293,11 +427,14 @@ def calculate_knee_point(
     if knee_index == 0:
         return min_cost + (optimal_coverage - min_cost) * 0.60
 
-    return curve_points[knee_index]["coverage"]
+    return curve.coverage[knee_index]
 
 
 def calculate_strategies(
-    hourly_costs: list[float], savings_percentage: float, prudent_pct: float = 85.0
+    hourly_costs: list[float],
+    savings_percentage: float,
+    prudent_pct: float = 85.0,
+    method: str = "grid",
 ) -> dict[str, float]:
     """
     Calculate all dynamic target strategy levels.
@@ -310,10 +447,20 @@ def calculate_strategies(
         hourly_costs: List of hourly costs
         savings_percentage: Savings plan discount percentage (e.g., 30 for 30%)
         prudent_pct: Percentage of min-hourly to use for prudent strategy (default: 85%)
+        method: Optimal-coverage solver for "maximum" ("grid" or "exact")
 
     Returns:
         Dict with keys: prudent, min_hourly, optimal, maximum (all in $/hour)
     """
+    key = ("strategies", _cost_digest(hourly_costs), savings_percentage, prudent_pct, method)
+    return _memoized(
+        key, lambda: _solve_strategies(hourly_costs, savings_percentage, prudent_pct, method)
+    )
+
+
+def _solve_strategies(
+    hourly_costs: list[float], savings_percentage: float, prudent_pct: float, method: str
+) -> dict[str, float]:
     if not hourly_costs:
         return {
             "prudent": 0.0,
@@ -325,10 +472,12 @@ def calculate_strategies(
     min_hourly = min(hourly_costs)
     prudent = min_hourly * (prudent_pct / 100.0)
 
-    optimal_result = calculate_optimal_coverage(hourly_costs, savings_percentage)
+    # One sorted profile serves both the optimum and the knee-point curve
+    profile = CostProfile(hourly_costs)
+    optimal_result = calculate_optimal_coverage(hourly_costs, savings_percentage, method, profile)
     maximum = optimal_result["coverage_hourly"]
 
-    optimal = calculate_knee_point(hourly_costs, savings_percentage, min_hourly, maximum)
+    optimal = calculate_knee_point(hourly_costs, savings_percentage, min_hourly, maximum, profile)
 
     return {
         "prudent": prudent,
@@ -336,3 +485,79 @@ def calculate_strategies(
         "optimal": optimal,
         "maximum": maximum,
     }
+
+
+def calculate_strategy_sweep(
+    hourly_costs: list[float],
+    savings_percentages: list[float] | tuple[float, ...] = SENSITIVITY_SAVINGS_PERCENTAGES,
+    prudent_pct: float = 85.0,
+    method: str = "grid",
+) -> list[dict[str, float]]:
+    """
+    Strategy levels for a whole grid of savings percentages.
+
+    The discount fed to calculate_strategies() is an estimate; the sweep shows
+    how each level moves with it. The costs are sorted once into a CostProfile
+    and every discount is answered from it: the grid/exact optimum and the
+    knee-point curve cost O(log N) per evaluated level, so a 13-point sweep over
+    a year of hours stays in the milliseconds.
+
+    "maximum" uses the same 100-step grid (_grid_optimum) as
+    calculate_optimal_coverage(), so each row matches calculate_strategies() at
+    that discount.
+
+    Args:
+        hourly_costs: List of hourly costs
+        savings_percentages: Discount percentages to evaluate (each 0-99)
+        prudent_pct: Percentage of min-hourly to use for prudent strategy
+        method: Optimal-coverage solver for "maximum" ("grid" or "exact")
+
+    Returns:
+        One dict per savings percentage, in input order, with keys:
+        savings_percentage, prudent, min_hourly, optimal, maximum ($/hour)
+
+    Raises:
+        ValueError: If a savings percentage is outside 0-99 or method is unknown
+    """
+    if method not in SOLVER_METHODS:
+        raise ValueError(f"method must be one of: {', '.join(SOLVER_METHODS)}")
+    for savings_percentage in savings_percentages:
+        if not 0 <= savings_percentage <= 99:
+            raise ValueError("savings_percentage must be between 0 and 99")
+
+    if not hourly_costs:
+        return [
+            {
+                "savings_percentage": savings_percentage,
+                "prudent": 0.0,
+                "min_hourly": 0.0,
+                "optimal": 0.0,
+                "maximum": 0.0,
+            }
+            for savings_percentage in savings_percentages
+        ]
+
+    profile = CostProfile(hourly_costs)
+    min_hourly = profile.sorted_costs[0]
+    prudent = min_hourly * (prudent_pct / 100.0)
+
+    rows = []
+    for savings_percentage in savings_percentages:
+        discount_factor = 1 - (savings_percentage / 100)
+        if method == "exact":
+            maximum, _ = profile.exact_optimum(discount_factor)
+        else:
+            maximum, _ = _grid_optimum(profile, discount_factor)
+        optimal = calculate_knee_point(
+            hourly_costs, savings_percentage, min_hourly, maximum, profile
+        )
+        rows.append(
+            {
+                "savings_percentage": savings_percentage,
+                "prudent": prudent,
+                "min_hourly": min_hourly,
+                "optimal": optimal,
+                "maximum": maximum,
+            }
+        )
+    return rows
@@ -0,0 +1,241 @@
+"""
+Parameter sweep: backtest a grid of strategy settings and keep the Pareto front.
+
+gap_split_divider, fixed_step_percent, dynamic_risk_level and prudent_percentage
+trade savings against exposure, and no single setting wins on both. The sweep
+replays the same history (see shared.backtest) for every combination and keeps
+the configurations no other one beats on both axes: higher net savings and lower
+peak unused commitment.
+
+Grid expansion only varies a parameter where it matters: prudent_percentage
+with the "prudent" risk level, fixed_step_percent with the fixed_step split and
+gap_split_divider with gap_split, so the default grid is 40 backtests rather
+than the full 324-way product.
+
+Backtests run in a process pool. The history is handed to each worker once
+through the pool initializer; with the fork start method (Linux) the workers
+inherit it from the parent's memory without pickling, and each task only ships
+its parameter dict. Where processes cannot be started the grid runs serially
+with the same results.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+from itertools import product
+from typing import TYPE_CHECKING, Any
+
+from shared.backtest import run_backtest
+from shared.sp_types import SP_TYPES
+
+
+if TYPE_CHECKING:
+    from shared.hourly_history import HourlyHistoryStore
+
+
+logger = logging.getLogger()
+
+DEFAULT_GRID: dict[str, tuple[Any, ...]] = {
+    "dynamic_risk_level": ("prudent", "min_hourly", "optimal"),
+    "prudent_percentage": (70.0, 85.0, 95.0),
+    "split_strategy_type": ("one_shot", "fixed_step", "gap_split"),
+    "fixed_step_percent": (5.0, 10.0, 20.0),
+    "gap_split_divider": (1.5, 2.0, 3.0, 4.0),
+}
+
+# Parameter -> (parameter, value) it depends on
+DEPENDENT_PARAMS = {
+    "prudent_percentage": ("dynamic_risk_level", "prudent"),
+    "fixed_step_percent": ("split_strategy_type", "fixed_step"),
+    "gap_split_divider": ("split_strategy_type", "gap_split"),
+}
+
+# Metrics copied from the backtest summary into each sweep result
+RESULT_METRICS = (
+    "net_savings",
+    "savings_percentage",
+    "peak_unused_commitment",
+    "waste",
+    "utilization",
+    "coverage",
+    "purchases",
+)
+
+# Per-process copy of the history, set by _init_worker
+_WORKER: dict[str, Any] = {}
+
+
+def build_parameter_grid(grid: dict[str, tuple[Any, ...]] | None = None) -> list[dict[str, Any]]:
+    """
+    Expand a grid into parameter overrides, skipping irrelevant combinations.
+
+    A dependent parameter (see DEPENDENT_PARAMS) is left out when the value it
+    depends on is not selected, so e.g. one_shot appears once rather than once
+    per gap_split_divider.
+    """
+    grid = grid or DEFAULT_GRID
+    names = list(grid)
+    seen: set[tuple[tuple[str, Any], ...]] = set()
+    combos = []
+    for values in product(*(grid[name] for name in names)):
+        params = dict(zip(names, values, strict=True))
+        for name, (parent, required) in DEPENDENT_PARAMS.items():
+            if name in params and params.get(parent, required) != required:
+                del params[name]
+        key = tuple(params.items())
+        if key not in seen:
+            seen.add(key)
+            combos.append(params)
+    return combos
+
+
+def spend_from_history(
+    store: HourlyHistoryStore, config: dict[str, Any], days: int | None = None
+) -> tuple[dict[str, list[float]], datetime | None]:
+    """
+    Hourly spend of the enabled SP types over the hours every stored series covers.
+
+    Args:
+        store: Long-horizon hourly history (see shared.hourly_history)
+        config: Scheduler config (enable_*_sp)
+        days: Keep only the most recent days (default: all common hours)
+
+    Returns:
+        (sp_type_key -> hourly spend with missing hours as 0, time of the first
+        hour); ({}, None) without stored history
+    """
+    loaded = {}
+    for sp_type in SP_TYPES:
+        if not config.get(sp_type["enabled_config"]):
+            continue
+        series = store.load(sp_type["name"])
+        if series is not None and len(series.totals):
+            loaded[sp_type["key"]] = series
+    if not loaded:
+        return {}, None
+
+    start_hour = max(series.start_hour for series in loaded.values())
+    end_hour = min(series.end_hour for series in loaded.values())
+    if days:
+        start_hour = max(start_hour, end_hour - days * 24)
+    if end_hour <= start_hour:
+        return {}, None
+
+    spend = {
+        key: [
+            0.0 if math.isnan(value) else value
+            for value in series.totals[
+                start_hour - series.start_hour : end_hour - series.start_hour
+            ]
+        ]
+        for key, series in loaded.items()
+    }
+    series = next(iter(loaded.values()))
+    return spend, series.start_time + timedelta(hours=start_hour - series.start_hour)
+
+
+def _init_worker(
+    spend_by_type: dict[str, Any], config: dict[str, Any], backtest_kwargs: dict[str, Any]
+) -> None:
+    _WORKER.update(spend=spend_by_type, config=config, kwargs=backtest_kwargs)
+
+
+def _evaluate(params: dict[str, Any]) -> dict[str, Any]:
+    result = run_backtest(_WORKER["spend"], {**_WORKER["config"], **params}, **_WORKER["kwargs"])
+    return {"params": params, **{metric: result["summary"][metric] for metric in RESULT_METRICS}}
+
+
+def _pool_context() -> Any:
+    """Fork where available, so workers share the parent's history pages."""
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return None
+
+
+def _run_grid(
+    combos: list[dict[str, Any]], initargs: tuple[Any, ...], workers: int
+) -> list[dict[str, Any]]:
+    if workers > 1 and len(combos) > 1:
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=_pool_context(),
+                initializer=_init_worker,
+                initargs=initargs,
+            ) as pool:
+                return list(pool.map(_evaluate, combos))
+        except (OSError, NotImplementedError, BrokenProcessPool) as e:
+            logger.info(f"Process pool unavailable ({e}), sweeping serially")
+
+    _init_worker(*initargs)
+    try:
+        return [_evaluate(params) for params in combos]
+    finally:
+        _WORKER.clear()
+
+
+def pareto_front(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Results not dominated on (higher net_savings, lower peak_unused_commitment).
+
+    Sorted by peak unused commitment ascending, so net savings rise along the front.
+    """
+    ordered = sorted(results, key=lambda row: (row["peak_unused_commitment"], -row["net_savings"]))
+    front = []
+    best_savings = float("-inf")
+    for row in ordered:
+        if row["net_savings"] > best_savings:
+            front.append(row)
+            best_savings = row["net_savings"]
+    return front
+
+
+def run_parameter_sweep(
+    spend_by_type: dict[str, list[float]],
+    config: dict[str, Any],
+    grid: dict[str, tuple[Any, ...]] | None = None,
+    *,
+    workers: int | None = None,
+    **backtest_kwargs: Any,
+) -> dict[str, Any]:
+    """
+    Backtest every grid combination on the same history.
+
+    Args:
+        spend_by_type: sp_type_key -> spend per sample (see run_backtest)
+        config: Base scheduler config; the dynamic target is always used since
+            the swept parameters belong to it
+        grid: Parameter -> values to try (default DEFAULT_GRID)
+        workers: Processes to use (default: CPU count; 1 runs serially)
+        **backtest_kwargs: Passed to run_backtest (start, hours_per_sample, ...)
+
+    Returns:
+        {"grid": the grid swept, "evaluated": number of backtests,
+         "results": [{"params", <RESULT_METRICS>}] in grid order,
+         "pareto_front": pareto_front(results)}
+
+    Raises:
+        ValueError: From run_backtest, e.g. for a history shorter than the lookback
+    """
+    grid = grid or DEFAULT_GRID
+    combos = build_parameter_grid(grid)
+    base_config = {**config, "target_strategy_type": "dynamic"}
+    workers = workers if workers is not None else min(os.cpu_count() or 1, len(combos))
+
+    results = _run_grid(combos, (spend_by_type, base_config, backtest_kwargs), workers)
+    front = pareto_front(results)
+    logger.info(
+        f"Parameter sweep: {len(results)} backtests, {len(front)} Pareto-optimal configurations"
+    )
+    return {
+        "grid": {name: list(values) for name, values in grid.items()},
+        "evaluated": len(results),
+        "results": results,
+        "pareto_front": front,
+    }
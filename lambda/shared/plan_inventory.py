@@ -0,0 +1,103 @@
+"""
+Run-scoped inventory of active Savings Plans.
+
+Several steps of one invocation need the active plans (cooldown check, static
+strategy commitments, purchaser renewal window, reporter summary). The inventory
+lists them once per Savings Plans client, following nextToken so organizations
+with hundreds of plans are complete, and indexes them by type and ARN; date
+queries go through its PlanLadder (shared.plan_ladder), built once per listing.
+
+Like the Cost Explorer meter, the registry is module-global:
+handler_utils.initialize_clients() calls reset_plan_inventories() at the start of
+each invocation, so a warm Lambda container never serves a previous run's plans.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING, Any
+
+from shared.aws_debug import add_response
+from shared.plan_ladder import PlanLadder
+
+
+if TYPE_CHECKING:
+    from mypy_boto3_savingsplans.client import SavingsPlansClient
+
+
+logger = logging.getLogger(__name__)
+
+# Largest page describe_savings_plans accepts
+PAGE_SIZE = 1000
+
+_REGISTRY_LOCK = threading.Lock()
+# id(client) -> (client, inventory); the client is held so its id is never reused
+_INVENTORIES: dict[int, tuple[Any, PlanInventory]] = {}
+
+
+class PlanInventory:
+    """Active Savings Plans (raw describe_savings_plans entries) with lookup indexes."""
+
+    def __init__(self, plans: list[dict[str, Any]]):
+        self.plans = plans
+        self.by_type: dict[str, list[dict[str, Any]]] = {}
+        self.by_arn: dict[str, dict[str, Any]] = {}
+        for plan in plans:
+            self.by_type.setdefault(plan.get("savingsPlanType", "Unknown"), []).append(plan)
+            if plan.get("savingsPlanArn"):
+                self.by_arn[plan["savingsPlanArn"]] = plan
+        self.ladder = PlanLadder(plans)
+
+    @classmethod
+    def fetch(cls, savingsplans_client: SavingsPlansClient) -> PlanInventory:
+        """
+        List every active plan, following nextToken.
+
+        Raises:
+            ClientError: If the Savings Plans API call fails
+        """
+        plans: list[dict[str, Any]] = []
+        params: dict[str, Any] = {"states": ["active"], "maxResults": PAGE_SIZE}
+        while True:
+            response = savingsplans_client.describe_savings_plans(**params)
+            add_response(
+                api="describe_savings_plans",
+                params=params,
+                response=response,
+                context="plan_inventory",
+            )
+            plans.extend(response.get("savingsPlans", []))
+
+            next_token = response.get("nextToken")
+            if not isinstance(next_token, str) or not next_token:
+                break
+            params = {**params, "nextToken": next_token}
+
+        logger.info(f"Plan inventory: {len(plans)} active Savings Plans")
+        return cls(plans)
+
+    def commitment_by_type(self) -> dict[str, float]:
+        """Total hourly commitment per AWS plan type (e.g. {"Compute": 2.5})."""
+        return {
+            plan_type: sum(float(plan.get("commitment", "0")) for plan in plans)
+            for plan_type, plans in self.by_type.items()
+        }
+
+
+def get_plan_inventory(savingsplans_client: SavingsPlansClient) -> PlanInventory:
+    """Return this invocation's inventory for the client, listing plans on first use."""
+    key = id(savingsplans_client)
+    with _REGISTRY_LOCK:
+        entry = _INVENTORIES.get(key)
+        if entry is not None:
+            return entry[1]
+        inventory = PlanInventory.fetch(savingsplans_client)
+        _INVENTORIES[key] = (savingsplans_client, inventory)
+        return inventory
+
+
+def reset_plan_inventories() -> None:
+    """Forget inventories from a previous invocation."""
+    with _REGISTRY_LOCK:
+        _INVENTORIES.clear()
@@ -0,0 +1,174 @@
+"""
+Expiry-indexed plan ladder: Savings Plans sorted by end and start date, per type.
+
+Cooldown checks, renewal windows and the reporter's "next expiry" all ask date
+questions about the same plans. The ladder parses every date once, keeps each
+type's plans in arrays sorted by end and by start (plus a combined ladder for
+all types) with commitment prefix sums, and answers each question with a binary
+search:
+- expiring between t1 and t2 / within N days (plans or $/h committed);
+- purchased since t / within N days;
+- commitment active at t (started by t minus ended by t).
+
+Building from P plans costs O(P log P); queries are O(log P) plus the size of
+the returned list, so thousands of plans stay cheap.
+
+Plans are read either as raw describe_savings_plans entries (RAW_FIELDS, as
+held by PlanInventory) or as get_active_savings_plans() details
+(DETAIL_FIELDS, as rendered by the reporter). Plans are active on [start, end);
+a plan without a start date counts as active since forever, one without an end
+date never expires.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from datetime import UTC, datetime, timedelta
+from itertools import accumulate
+from typing import Any, NamedTuple
+
+
+class PlanFields(NamedTuple):
+    """Plan dict keys holding the type, start, end and hourly commitment."""
+
+    plan_type: str
+    start: str
+    end: str
+    commitment: str
+
+
+RAW_FIELDS = PlanFields("savingsPlanType", "start", "end", "commitment")
+DETAIL_FIELDS = PlanFields("plan_type", "start_date", "end_date", "hourly_commitment")
+
+_SINCE_FOREVER = datetime.min.replace(tzinfo=UTC)
+
+
+def parse_plan_date(value: Any) -> datetime | None:
+    """Timezone-aware datetime from an ISO timestamp or YYYY-MM-DD date (UTC if naive)."""
+    if isinstance(value, datetime):
+        moment = value
+    elif isinstance(value, str) and value:
+        try:
+            moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    else:
+        return None
+    return moment if moment.tzinfo else moment.replace(tzinfo=UTC)
+
+
+class _Rungs:
+    """One set of plans sorted by end and by start, with commitment prefix sums."""
+
+    def __init__(self, entries: list[tuple[datetime | None, datetime | None, float, int]]):
+        by_end = sorted((end, i, commitment) for _, end, commitment, i in entries if end)
+        by_start = sorted(
+            (start or _SINCE_FOREVER, i, commitment) for start, _, commitment, i in entries
+        )
+        self.end_times = [end for end, _, _ in by_end]
+        self.end_plans = [i for _, i, _ in by_end]
+        self.ended = list(accumulate((c for _, _, c in by_end), initial=0.0))
+        self.start_times = [start for start, _, _ in by_start]
+        self.start_plans = [i for _, i, _ in by_start]
+        self.started = list(accumulate((c for _, _, c in by_start), initial=0.0))
+
+
+class PlanLadder:
+    """Plans indexed by end and start date, per plan type and overall."""
+
+    def __init__(self, plans: list[dict[str, Any]], fields: PlanFields = RAW_FIELDS):
+        self.plans = plans
+        entries: dict[str, list[tuple[datetime | None, datetime | None, float, int]]] = {}
+        for i, plan in enumerate(plans):
+            entry = (
+                parse_plan_date(plan.get(fields.start)),
+                parse_plan_date(plan.get(fields.end)),
+                float(plan.get(fields.commitment, 0) or 0),
+                i,
+            )
+            entries.setdefault(plan.get(fields.plan_type, "Unknown"), []).append(entry)
+        self._by_type = {
+            plan_type: _Rungs(type_entries) for plan_type, type_entries in entries.items()
+        }
+        self._all = _Rungs([entry for type_entries in entries.values() for entry in type_entries])
+
+    @classmethod
+    def from_plan_details(cls, plans: list[dict[str, Any]]) -> PlanLadder:
+        """Ladder over get_active_savings_plans() output."""
+        return cls(plans, DETAIL_FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.plans)
+
+    @property
+    def plan_types(self) -> list[str]:
+        return list(self._by_type)
+
+    def _rungs(self, plan_type: str | None) -> _Rungs | None:
+        return self._all if plan_type is None else self._by_type.get(plan_type)
+
+    def expiring_between(
+        self, start: datetime, end: datetime, plan_type: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Plans ending in (start, end], soonest first (all types when plan_type is None)."""
+        rungs = self._rungs(plan_type)
+        if rungs is None:
+            return []
+        lo = bisect_right(rungs.end_times, start)
+        hi = bisect_right(rungs.end_times, end)
+        return [self.plans[i] for i in rungs.end_plans[lo:hi]]
+
+    def expiring_before(
+        self, moment: datetime, plan_type: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Plans ending at or before moment, soonest first."""
+        return self.expiring_between(_SINCE_FOREVER, moment, plan_type)
+
+    def expiring_within(
+        self, days: float, now: datetime, plan_type: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Plans ending in (now, now + days]."""
+        return self.expiring_between(now, now + timedelta(days=days), plan_type)
+
+    def expiring_commitment(
+        self, start: datetime, end: datetime, plan_type: str | None = None
+    ) -> float:
+        """$/h committed by plans ending in (start, end] (new plans do not offset it)."""
+        rungs = self._rungs(plan_type)
+        if rungs is None or end <= start:
+            return 0.0
+        lo = bisect_right(rungs.end_times, start)
+        hi = bisect_right(rungs.end_times, end)
+        return rungs.ended[hi] - rungs.ended[lo]
+
+    def next_expiring(self, plan_type: str | None = None) -> tuple[datetime, dict[str, Any]] | None:
+        """(end, plan) of the soonest-ending dated plan, or None."""
+        rungs = self._rungs(plan_type)
+        if rungs is None or not rungs.end_times:
+            return None
+        return rungs.end_times[0], self.plans[rungs.end_plans[0]]
+
+    def purchased_since(
+        self, cutoff: datetime, plan_type: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Plans starting at or after cutoff, oldest first."""
+        rungs = self._rungs(plan_type)
+        if rungs is None:
+            return []
+        lo = bisect_left(rungs.start_times, cutoff)
+        return [self.plans[i] for i in rungs.start_plans[lo:]]
+
+    def purchased_within(
+        self, days: float, now: datetime, plan_type: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Plans starting at or after now - days."""
+        return self.purchased_since(now - timedelta(days=days), plan_type)
+
+    def commitment_at(self, moment: datetime, plan_type: str | None = None) -> float:
+        """$/h committed by plans active at moment (start <= moment < end)."""
+        rungs = self._rungs(plan_type)
+        if rungs is None:
+            return 0.0
+        started = rungs.started[bisect_right(rungs.start_times, moment)]
+        ended = rungs.ended[bisect_right(rungs.end_times, moment)]
+        return max(0.0, started - ended)
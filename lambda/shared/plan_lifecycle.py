@@ -0,0 +1,175 @@
+"""
+Event-driven gap_split lifecycle simulation (idealized: target fixed at 100%).
+
+Shows how gap_split spreads purchases and renewals over time for a given term,
+divider and horizon, without any spend data (shared.backtest replays recorded
+spend instead). docs/generate_gap_split_chart.py draws its lifecycle chart
+from it.
+
+Each plan adds two events to a min-heap: entering the renewal window (from then
+on the scheduler treats it as gone) and expiring. Running sums of active and
+"expiring soon" coverage are updated as events pop, so a scheduler run costs
+O(log P) and a simulation O(R + P log P) for R runs and P plans, whatever the
+horizon. Coverage is kept as a step function (the days it changes), sampled
+with a binary search or a single sweep.
+"""
+
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from shared.split_strategies.gap_split import gap_split_size
+
+
+DAYS_PER_YEAR = 365
+TARGET_COVERAGE = 100.0
+
+# Day-of-year for the 1st of each month (non-leap year)
+MONTH_STARTS = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+# Event kinds: a plan enters the renewal window (on or) before it expires
+_RENEWAL_WINDOW = 0
+_EXPIRE = 1
+
+
+@dataclass
+class LifecyclePlan:
+    coverage_pct: float
+    start_day: int
+    end_day: int
+
+
+@dataclass
+class PlanLifecycle:
+    """Plans bought by the simulation and the coverage step function they form."""
+
+    plans: list[LifecyclePlan] = field(default_factory=list)
+    change_days: list[int] = field(default_factory=list)
+    change_levels: list[float] = field(default_factory=list)
+
+    def coverage_at(self, day: int) -> float:
+        """Total coverage (%) of the plans active on day (start <= day < end)."""
+        i = bisect_right(self.change_days, day)
+        return self.change_levels[i - 1] if i else 0.0
+
+    def sample(self, days: Iterable[int]) -> dict[str, list[float]]:
+        """
+        Per-day series for charts, in one sweep over the plans.
+
+        Args:
+            days: Days to sample, ascending
+
+        Returns:
+            {"coverage", "active_plans", "largest_plan", "days_to_next_expiry"}
+            lists aligned with days (0 where no plan is active)
+        """
+        by_start = sorted(self.plans, key=lambda plan: plan.start_day)
+        ends: list[tuple[int, int]] = []  # (end_day, plan index): next expiry first
+        largest: list[tuple[float, int, int]] = []  # (-coverage, end_day, index), lazy
+        series: dict[str, list[float]] = {
+            "coverage": [],
+            "active_plans": [],
+            "largest_plan": [],
+            "days_to_next_expiry": [],
+        }
+        next_plan = 0
+        for day in days:
+            while next_plan < len(by_start) and by_start[next_plan].start_day <= day:
+                plan = by_start[next_plan]
+                heapq.heappush(ends, (plan.end_day, next_plan))
+                heapq.heappush(largest, (-plan.coverage_pct, plan.end_day, next_plan))
+                next_plan += 1
+            while ends and ends[0][0] <= day:
+                heapq.heappop(ends)
+            while largest and largest[0][1] <= day:
+                heapq.heappop(largest)
+
+            series["coverage"].append(self.coverage_at(day))
+            series["active_plans"].append(len(ends))
+            series["largest_plan"].append(-largest[0][0] if largest else 0.0)
+            series["days_to_next_expiry"].append(ends[0][0] - day if ends else 0)
+        return series
+
+
+def monthly_purchase_days(total_years: int) -> list[int]:
+    """Scheduler runs on the 1st of each month for total_years (day 0 = Jan 1st)."""
+    horizon = total_years * DAYS_PER_YEAR
+    return [
+        day
+        for year in range(total_years + 1)
+        for month_start in MONTH_STARTS
+        if (day := year * DAYS_PER_YEAR + month_start) <= horizon
+    ]
+
+
+def simulate_gap_split_lifecycle(
+    purchase_days: Iterable[int],
+    *,
+    term_days: int,
+    divider: float,
+    min_purchase_pct: float = 1.0,
+    max_purchase_pct: float | None = None,
+    renewal_window_days: int = 7,
+) -> PlanLifecycle:
+    """
+    Simulate gap_split toward 100% coverage with scheduler runs on purchase_days.
+
+    Purchases are sized with gap_split_size(), the scheduler's own sizing
+    before its 0.1% rounding.
+
+    Args:
+        purchase_days: Scheduler run days, ascending
+        term_days: Plan length in days (e.g. 365 for one-year terms)
+        divider: gap_split_divider
+        min_purchase_pct: Smallest purchase, unless the gap itself is smaller
+        max_purchase_pct: Largest purchase (None for no cap)
+        renewal_window_days: Plans ending within this many days of a run count
+            as already gone, as in the scheduler
+
+    Returns:
+        PlanLifecycle with the plans bought and the coverage step function
+    """
+    lifecycle = PlanLifecycle()
+    events: list[tuple[int, int, int]] = []  # (day, kind, plan index)
+    active = 0.0
+    expiring_soon = 0.0
+
+    def record(day: int) -> None:
+        if lifecycle.change_days and lifecycle.change_days[-1] == day:
+            lifecycle.change_levels[-1] = active
+        else:
+            lifecycle.change_days.append(day)
+            lifecycle.change_levels.append(active)
+
+    def apply_events(until: float) -> None:
+        nonlocal active, expiring_soon
+        while events and events[0][0] <= until:
+            event_day, kind, index = heapq.heappop(events)
+            coverage = lifecycle.plans[index].coverage_pct
+            if kind == _RENEWAL_WINDOW:
+                expiring_soon += coverage
+            else:
+                expiring_soon -= coverage
+                active -= coverage
+                if active < 1e-9:  # last plan gone: drop float residue
+                    active = expiring_soon = 0.0
+                record(event_day)
+
+    for day in purchase_days:
+        apply_events(day)
+        gap = TARGET_COVERAGE - (active - expiring_soon)
+        if gap > 0.001:
+            purchase = gap_split_size(gap, divider, min_purchase_pct, max_purchase_pct)
+            plan = LifecyclePlan(purchase, day, day + term_days)
+            lifecycle.plans.append(plan)
+            index = len(lifecycle.plans) - 1
+            heapq.heappush(events, (plan.end_day - renewal_window_days, _RENEWAL_WINDOW, index))
+            heapq.heappush(events, (plan.end_day, _EXPIRE, index))
+            active += purchase
+            record(day)
+
+    apply_events(float("inf"))
+    return lifecycle
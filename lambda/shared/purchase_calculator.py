@@ -1,20 +1,33 @@
 """
 Purchase Calculator Module - Two-phase strategy pipeline.
 
-Phase 1: Resolve target coverage (fixed/dynamic/aws)
+Phase 1: Resolve target coverage (dynamic/budget/aws)
 Phase 2: Calculate split for each SP type (one_shot/fixed_step/gap_split)
 
 AWS target short-circuits to follow_aws_strategy.py (special path).
+
+Before phase 1, commitment from plans ending within renewal_window_days is
+removed from each type's measured coverage (see plan_ladder), so targets
+and splits plan for the coverage that will still exist.
+
+PurchaseContext holds that strategy-independent preparation so several
+target + split combinations (the reporter's scheduler preview) share it.
 """
 
+from __future__ import annotations
+
 import logging
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from botocore.exceptions import ClientError
 
 from shared import sp_calculations
+from shared.constants import AWS_TYPE_TO_KEY
 from shared.follow_aws_strategy import calculate_purchase_need_follow_aws
 from shared.follow_static_strategy import calculate_purchase_need_static
+from shared.plan_inventory import get_plan_inventory
 from shared.sp_types import SP_TYPES, get_term
 from shared.split_strategies import calculate_split
 from shared.target_strategies import resolve_target
@@ -22,35 +35,57 @@ from shared.target_strategies import resolve_target
 
 logger = logging.getLogger()
 
+# Targets with their own purchase path (no target + split pipeline)
+SHORT_CIRCUIT_TARGETS = ("aws", "static")
 
-def _process_sp_type(
-    sp_type: dict[str, Any],
-    config: dict[str, Any],
-    spending_data: dict[str, Any],
-    target_coverage: float,
-) -> dict[str, Any] | None:
-    if not config[sp_type["enabled_config"]]:
-        return None
 
-    key = sp_type["key"]
-    data = spending_data.get(key)
-    if not data:
-        logger.info(f"{sp_type['name']} SP - No spending data available")
-        return None
+@dataclass
+class SpTypeSpend:
+    """One SP type's spend figures, shared by every target + split evaluated on it."""
 
-    summary = data["summary"]
-    current_coverage_avg = summary["avg_coverage_total"]
-    avg_hourly_total = summary["avg_hourly_total"]
-    avg_hourly_covered = summary["avg_hourly_covered"]
+    sp_type: dict[str, Any]
+    min_hourly: float
+    avg_hourly_total: float
+    avg_hourly_covered: float
+    current_coverage: float  # % of min-hourly
+    savings_percentage: float
 
-    timeseries = data.get("timeseries", [])
-    total_costs = [item["total"] for item in timeseries if item["total"] > 0]
-    min_hourly = min(total_costs) if total_costs else avg_hourly_total
+    @classmethod
+    def from_spending(
+        cls, sp_type: dict[str, Any], data: dict[str, Any], config: dict[str, Any]
+    ) -> SpTypeSpend:
+        summary = data["summary"]
+        avg_hourly_total = summary["avg_hourly_total"]
 
-    avg_to_min_ratio = (
-        avg_hourly_total / min_hourly if min_hourly > 0 and avg_hourly_total > 0 else 1.0
-    )
-    current_coverage = current_coverage_avg * avg_to_min_ratio
+        timeseries = data.get("timeseries", [])
+        total_costs = [item["total"] for item in timeseries if item["total"] > 0]
+        min_hourly = min(total_costs) if total_costs else avg_hourly_total
+
+        avg_to_min_ratio = (
+            avg_hourly_total / min_hourly if min_hourly > 0 and avg_hourly_total > 0 else 1.0
+        )
+        key = sp_type["key"]
+        return cls(
+            sp_type=sp_type,
+            min_hourly=min_hourly,
+            avg_hourly_total=avg_hourly_total,
+            avg_hourly_covered=summary["avg_hourly_covered"],
+            current_coverage=summary["avg_coverage_total"] * avg_to_min_ratio,
+            savings_percentage=config.get(
+                f"{key}_savings_percentage", config["savings_percentage"]
+            ),
+        )
+
+
+def _process_sp_type(
+    spend: SpTypeSpend, config: dict[str, Any], target_coverage: float
+) -> dict[str, Any] | None:
+    sp_type = spend.sp_type
+    key = sp_type["key"]
+    current_coverage = spend.current_coverage
+    avg_hourly_total = spend.avg_hourly_total
+    avg_hourly_covered = spend.avg_hourly_covered
+    min_hourly = spend.min_hourly
 
     coverage_gap = target_coverage - current_coverage
 
@@ -69,7 +104,7 @@ def _process_sp_type(
         return None
 
     purchase_percent = calculate_split(current_coverage, target_coverage, config)
-    savings_pct = config.get(f"{key}_savings_percentage", config["savings_percentage"])
+    savings_pct = spend.savings_percentage
     od_coverage_to_add = min_hourly * (purchase_percent / 100.0) if purchase_percent > 0 else 0
     hourly_commitment = round(
         sp_calculations.commitment_from_coverage(od_coverage_to_add, savings_pct), 5
@@ -147,17 +182,145 @@ def _ensure_savings_rates(config: dict[str, Any], clients: dict[str, Any]) -> di
     return config
 
 
+def _expiring_commitments(config: dict[str, Any], clients: dict[str, Any]) -> dict[str, float]:
+    """$/h per SP type of plans ending within renewal_window_days (empty if unavailable)."""
+    window_days = config.get("renewal_window_days")
+    if not window_days:
+        return {}
+    try:
+        inventory = get_plan_inventory(clients["savingsplans"])
+    except (ClientError, KeyError, TypeError, ValueError):
+        logger.debug("Could not list active Savings Plans, ignoring upcoming expirations")
+        return {}
+
+    now = datetime.now(UTC)
+    horizon = now + timedelta(days=window_days)
+    return {
+        key: inventory.ladder.expiring_commitment(now, horizon, plan_type)
+        for plan_type, key in AWS_TYPE_TO_KEY.items()
+    }
+
+
+def _exclude_expiring(
+    spending_data: dict[str, Any], expiring: dict[str, float], config: dict[str, Any]
+) -> dict[str, Any]:
+    """Copy of spending_data with expiring commitment removed from covered spend."""
+    adjusted = dict(spending_data)
+    for key, commitment in expiring.items():
+        data = spending_data.get(key)
+        if commitment <= 0 or not data or "summary" not in data:
+            continue
+        summary = data["summary"]
+        savings_pct = config.get(f"{key}_savings_percentage", config["savings_percentage"])
+        expiring_coverage = sp_calculations.coverage_from_commitment(commitment, savings_pct)
+        covered = max(0.0, summary["avg_hourly_covered"] - expiring_coverage)
+        avg_total = summary["avg_hourly_total"]
+        logger.info(
+            f"{key} SP - ${commitment:.5f}/h expiring within renewal window: "
+            f"excluding ${expiring_coverage:.4f}/h of covered spend"
+        )
+        adjusted[key] = {
+            **data,
+            "summary": {
+                **summary,
+                "avg_hourly_covered": covered,
+                "avg_coverage_total": covered / avg_total * 100 if avg_total > 0 else 0.0,
+            },
+        }
+    return adjusted
+
+
+class PurchaseContext:
+    """
+    Everything calculate_purchase_need derives before its strategies run.
+
+    Savings rates, the expiring-commitment exclusion and each type's spend
+    figures do not depend on the target or split strategy, so they are built
+    once and any number of combinations evaluated against them. Resolved
+    targets are memoized per target strategy: combinations sharing a target
+    only pay for their split.
+    """
+
+    def __init__(self, config: dict[str, Any], spending_data: dict[str, Any]):
+        self.config = config
+        self.spending_data = spending_data
+        self.spend: dict[str, SpTypeSpend] = {}
+        for sp_type in SP_TYPES:
+            if not config[sp_type["enabled_config"]]:
+                continue
+            data = spending_data.get(sp_type["key"])
+            if not data:
+                logger.info(f"{sp_type['name']} SP - No spending data available")
+                continue
+            self.spend[sp_type["key"]] = SpTypeSpend.from_spending(sp_type, data, config)
+        self._targets: dict[tuple[str, str], float | None] = {}
+
+    @classmethod
+    def build(
+        cls,
+        config: dict[str, Any],
+        clients: dict[str, Any],
+        spending_data: dict[str, Any] | None = None,
+    ) -> PurchaseContext:
+        """Fetch savings rates, analyze spend if not given and exclude expiring plans."""
+        # Fetch actual savings rates from existing SP plans (skips if already in config)
+        config = _ensure_savings_rates(config, clients)
+
+        if spending_data is None:
+            from shared.spending_analyzer import SpendingAnalyzer
+
+            analyzer = SpendingAnalyzer.from_clients(clients, config)
+            spending_data = analyzer.analyze_current_spending(config)
+            spending_data.pop("_unknown_services", None)
+
+        spending_data = _exclude_expiring(
+            spending_data, _expiring_commitments(config, clients), config
+        )
+        return cls(config, spending_data)
+
+    def _target(self, config: dict[str, Any], sp_type: dict[str, Any]) -> float | None:
+        memo_key = (config["target_strategy_type"], sp_type["key"])
+        if memo_key not in self._targets:
+            target = resolve_target(config, self.spending_data, sp_type_key=sp_type["key"])
+            if target is not None:
+                logger.info(f"{sp_type['name']} SP resolved target: {target:.2f}%")
+            self._targets[memo_key] = target
+        return self._targets[memo_key]
+
+    def evaluate(self, target_strategy: str, split_strategy: str) -> list[dict[str, Any]]:
+        """Purchase plans for one target + split combination (not aws/static)."""
+        config = {
+            **self.config,
+            "target_strategy_type": target_strategy,
+            "split_strategy_type": split_strategy,
+        }
+        purchase_plans = []
+        for sp_type in SP_TYPES:
+            target_coverage = self._target(config, sp_type)
+            if target_coverage is None:
+                continue
+            spend = self.spend.get(sp_type["key"])
+            if spend is None:
+                continue
+            plan = _process_sp_type(spend, config, target_coverage)
+            if plan:
+                purchase_plans.append(plan)
+
+        logger.info(f"Purchase need calculated: {len(purchase_plans)} plans")
+        return purchase_plans
+
+
 def calculate_purchase_need(
     config: dict[str, Any], clients: dict[str, Any], spending_data: dict[str, Any] | None = None
 ) -> list[dict[str, Any]]:
     """
     Calculate required purchases using configured target + split strategy.
 
-    Two-phase pipeline:
+    Two-phase pipeline (on coverage excluding plans about to expire):
     1. resolve_target() -> coverage target %
     2. For each SP type: calculate_split() -> purchase %
 
-    AWS target short-circuits to follow_aws_strategy.py.
+    AWS and static targets short-circuit to their own modules.
     """
     target_strategy = config["target_strategy_type"]
     split_strategy = config["split_strategy_type"]
@@ -172,25 +335,5 @@ def calculate_purchase_need(
     if target_strategy == "static":
         return calculate_purchase_need_static(config, clients)
 
-    # Fetch actual savings rates from existing SP plans (skips if already in config)
-    config = _ensure_savings_rates(config, clients)
-
-    if spending_data is None:
-        from shared.spending_analyzer import SpendingAnalyzer
-
-        analyzer = SpendingAnalyzer(clients["savingsplans"], clients["ce"])
-        spending_data = analyzer.analyze_current_spending(config)
-        spending_data.pop("_unknown_services", None)
-
-    purchase_plans = []
-    for sp_type in SP_TYPES:
-        target_coverage = resolve_target(config, spending_data, sp_type_key=sp_type["key"])
-        if target_coverage is None:
-            continue
-        logger.info(f"{sp_type['name']} SP resolved target: {target_coverage:.2f}%")
-        plan = _process_sp_type(sp_type, config, spending_data, target_coverage)
-        if plan:
-            purchase_plans.append(plan)
-
-    logger.info(f"Purchase need calculated: {len(purchase_plans)} plans")
-    return purchase_plans
+    context = PurchaseContext.build(config, clients, spending_data)
+    return context.evaluate(target_strategy, split_strategy)
@@ -0,0 +1,249 @@
+"""
+Monte Carlo commitment risk: how likely is a coverage level to lose money?
+
+calculate_strategies() picks coverage levels from one realization of the past
+(the lookback). A commitment is paid every hour for its whole term, so the
+question before a large purchase is how those levels fare on usage that looks
+like the past but is not exactly it.
+
+Method (moving block bootstrap):
+- cut the hourly history into overlapping blocks of one week (one day for
+  shorter histories), so daily and weekly seasonality survive resampling;
+- build each path by concatenating randomly chosen blocks up to the horizon
+  (the history length by default);
+- evaluate every candidate on the path at once: the path is sorted once and the
+  on-demand spend covered at level L, sum(min(cost, L)), is a prefix sum plus a
+  binary search, so C candidates cost O(H log H + C log H) per path.
+
+Net savings of a level L over H hours is sum(min(cost, L)) - H * L * discount
+factor; it is negative when the commitment ends up underused.
+
+Paths are split into chunks with their own seeds and run in a process pool.
+Where processes cannot be started (AWS Lambda has no /dev/shm, so the pool's
+semaphores fail) chunks run serially; for a given seed both modes return the
+same numbers. The scheduler and reporter seed from the lookback's last hour
+(lookback_seed), so every run over the same window reports the same figures.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import os
+import random
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import accumulate
+from typing import Any
+
+from shared.optimal_coverage import calculate_strategies
+from shared.sp_types import SP_TYPES
+
+
+logger = logging.getLogger()
+
+DEFAULT_PATHS = 2000
+PATHS_PER_CHUNK = 250
+
+HOURS_PER_DAY = 24
+HOURS_PER_WEEK = 168
+
+# Percentiles reported for the net savings distribution
+SAVINGS_PERCENTILES = (5, 50, 95)
+
+STRATEGY_CANDIDATES = ("prudent", "min_hourly", "optimal", "maximum")
+
+
+def _block_length(num_hours: int) -> int:
+    if num_hours >= 2 * HOURS_PER_WEEK:
+        return HOURS_PER_WEEK
+    if num_hours >= 2 * HOURS_PER_DAY:
+        return HOURS_PER_DAY
+    return num_hours
+
+
+def _simulate_chunk(
+    task: tuple[list[float], list[float], float, int, int, int],
+) -> tuple[list[list[float]], list[list[float]]]:
+    """Net savings ($/h) and utilization per level for one chunk of bootstrap paths.
+
+    task is (history, levels, discount_factor, horizon, paths, seed).
+    """
+    history, levels, discount_factor, horizon, paths, seed = task
+    rng = random.Random(seed)
+    block = _block_length(len(history))
+    last_start = len(history) - block
+    blocks_per_path = math.ceil(horizon / block)
+
+    savings: list[list[float]] = [[] for _ in levels]
+    utilization: list[list[float]] = [[] for _ in levels]
+    for _ in range(paths):
+        path: list[float] = []
+        for _ in range(blocks_per_path):
+            start = rng.randint(0, last_start)
+            path.extend(history[start : start + block])
+        path = sorted(path[:horizon])
+        prefix = [0.0, *accumulate(path)]
+
+        for i, level in enumerate(levels):
+            j = bisect_left(path, level)
+            covered = prefix[j] + (horizon - j) * level
+            commitment_cost = horizon * level * discount_factor
+            savings[i].append((covered - commitment_cost) / horizon)
+            utilization[i].append(covered / (horizon * level) if level > 0 else 1.0)
+    return savings, utilization
+
+
+def _run_chunks(tasks: list[tuple[Any, ...]], workers: int) -> list[tuple[Any, Any]]:
+    if workers > 1 and len(tasks) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(_simulate_chunk, tasks))
+        except (OSError, NotImplementedError, BrokenProcessPool) as e:
+            logger.info(f"Process pool unavailable ({e}), simulating serially")
+    return [_simulate_chunk(task) for task in tasks]
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * pct / 100))]
+
+
+def simulate_commitment_risk(
+    hourly_costs: list[float],
+    levels: dict[str, float],
+    savings_percentage: float,
+    *,
+    paths: int = DEFAULT_PATHS,
+    horizon_hours: int | None = None,
+    seed: int | None = None,
+    workers: int | None = None,
+) -> dict[str, dict[str, float]]:
+    """
+    Bootstrap the net savings distribution of each coverage level.
+
+    Args:
+        hourly_costs: Hourly on-demand spend, oldest first, zero hours included
+        levels: Candidate name -> coverage ($/h of on-demand usage covered)
+        savings_percentage: Savings plan discount percentage (e.g., 30 for 30%)
+        paths: Number of simulated paths
+        horizon_hours: Length of each path (default: the history length)
+        seed: Seed for reproducible paths
+        workers: Processes to use (default: CPU count; 1 runs serially)
+
+    Returns:
+        Candidate name -> coverage_hourly, expected_savings, savings_p5/p50/p95
+        (net savings in $/h), probability_of_loss (share of paths with negative
+        net savings) and expected_utilization (0-1)
+
+    Raises:
+        ValueError: If the history is empty or paths/horizon are not positive
+    """
+    if not hourly_costs:
+        raise ValueError("Cannot simulate commitment risk without hourly costs")
+    horizon = horizon_hours or len(hourly_costs)
+    if paths < 1 or horizon < 1:
+        raise ValueError("paths and horizon_hours must be positive")
+
+    names = list(levels)
+    level_values = [levels[name] for name in names]
+    discount_factor = 1 - savings_percentage / 100
+    history = list(hourly_costs)
+
+    seeder = random.Random(seed)
+    tasks = []
+    for start in range(0, paths, PATHS_PER_CHUNK):
+        chunk_paths = min(PATHS_PER_CHUNK, paths - start)
+        tasks.append(
+            (history, level_values, discount_factor, horizon, chunk_paths, seeder.getrandbits(64))
+        )
+    workers = workers if workers is not None else min(os.cpu_count() or 1, len(tasks))
+
+    savings: list[list[float]] = [[] for _ in names]
+    utilization: list[list[float]] = [[] for _ in names]
+    for chunk_savings, chunk_utilization in _run_chunks(tasks, workers):
+        for i in range(len(names)):
+            savings[i].extend(chunk_savings[i])
+            utilization[i].extend(chunk_utilization[i])
+
+    results = {}
+    for i, name in enumerate(names):
+        ordered = sorted(savings[i])
+        results[name] = {
+            "coverage_hourly": level_values[i],
+            "expected_savings": sum(ordered) / paths,
+            **{f"savings_p{pct}": _percentile(ordered, pct) for pct in SAVINGS_PERCENTILES},
+            "probability_of_loss": sum(1 for value in ordered if value < 0) / paths,
+            "expected_utilization": sum(utilization[i]) / paths,
+        }
+    return results
+
+
+def simulate_strategy_risk(
+    hourly_costs: list[float],
+    savings_percentage: float,
+    prudent_pct: float = 85.0,
+    **kwargs: Any,
+) -> dict[str, dict[str, float]]:
+    """simulate_commitment_risk() for each calculate_strategies() level.
+
+    Levels come from the hours with usage (as the dynamic target computes them);
+    the simulation keeps zero hours, which a commitment is still paid for.
+    """
+    nonzero = [cost for cost in hourly_costs if cost > 0]
+    if not nonzero:
+        raise ValueError("Cannot simulate commitment risk without usage")
+    strategies = calculate_strategies(nonzero, savings_percentage, prudent_pct=prudent_pct)
+    levels = {name: strategies[name] for name in STRATEGY_CANDIDATES}
+    return simulate_commitment_risk(hourly_costs, levels, savings_percentage, **kwargs)
+
+
+def lookback_seed(spending_data: dict[str, Any] | None) -> int:
+    """Seed derived from the latest timeseries timestamp (the lookback end date)."""
+    lookback_end = max(
+        (
+            str(item.get("timestamp") or "")
+            for data in (spending_data or {}).values()
+            if isinstance(data, dict)
+            for item in data.get("timeseries", [])[-1:]
+        ),
+        default="",
+    )
+    return int.from_bytes(hashlib.blake2b(lookback_end.encode(), digest_size=8).digest(), "big")
+
+
+def simulate_spending_risk(
+    spending_data: dict[str, Any] | None,
+    config: dict[str, Any],
+    sp_type_keys: list[str] | None = None,
+    **kwargs: Any,
+) -> dict[str, dict[str, dict[str, float]]]:
+    """
+    Strategy risk per SP type from SpendingAnalyzer output.
+
+    Uses {key}_savings_percentage from config when present, else
+    savings_percentage. Types without usage are left out.
+
+    Returns:
+        sp_type_key -> candidate name -> simulate_commitment_risk() result
+    """
+    if not spending_data:
+        return {}
+    keys = sp_type_keys if sp_type_keys is not None else [sp_type["key"] for sp_type in SP_TYPES]
+    prudent_pct = config.get("prudent_percentage", 85.0)
+
+    risk = {}
+    for key in keys:
+        data = spending_data.get(key)
+        if not data:
+            continue
+        hourly_costs = [item.get("total", 0.0) for item in data.get("timeseries", [])]
+        savings_pct = config.get(f"{key}_savings_percentage", config.get("savings_percentage"))
+        if savings_pct is None:
+            continue
+        try:
+            risk[key] = simulate_strategy_risk(hourly_costs, savings_pct, prudent_pct, **kwargs)
+        except ValueError as e:
+            logger.debug(f"Skipping commitment risk for {key}: {e}")
+    return risk
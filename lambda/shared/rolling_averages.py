@@ -0,0 +1,80 @@
+"""
+Rolling-window averages over a single daily spending series.
+
+The spike guards compare several lookback windows (e.g. 14d vs 90d) of the same
+daily series. Instead of one Cost Explorer query per window, the series is
+fetched once for the longest window and each SP type's daily totals are turned
+into a prefix-sum array; every window average is then two bisects and one
+subtraction.
+
+Averages match SpendingAnalyzer.analyze_daily_spending(lookback_days=N)
+["summary"]["avg_hourly_total"]: the mean total over the data points whose
+period ends within the last N days.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from datetime import UTC, datetime, timedelta
+from itertools import accumulate
+from typing import Any
+
+from shared.spending_analyzer import daily_end_time
+
+
+_DATE_FORMAT = "%Y-%m-%d"
+
+
+class RollingAverages:
+    """Window averages per SP type over one daily series ending at `end`."""
+
+    def __init__(self, spending_data: dict[str, Any], lookback_days: int, end: datetime):
+        """
+        Args:
+            spending_data: analyze_daily_spending() output ({sp_type: {"timeseries": [...]}})
+            lookback_days: Days covered by spending_data (longest answerable window)
+            end: Exclusive end of the daily query (see spending_analyzer.daily_end_time)
+        """
+        self.lookback_days = lookback_days
+        self.end = end
+        self._end_date = end.strftime(_DATE_FORMAT)
+        self._dates: dict[str, list[str]] = {}
+        self._prefix: dict[str, list[float]] = {}
+        for sp_type, data in spending_data.items():
+            if sp_type.startswith("_"):
+                continue
+            points = sorted(
+                (point["timestamp"][:10], point["total"]) for point in data.get("timeseries", [])
+            )
+            self._dates[sp_type] = [date for date, _ in points]
+            self._prefix[sp_type] = list(accumulate((total for _, total in points), initial=0.0))
+
+    @classmethod
+    def from_daily_spending(
+        cls, spending_data: dict[str, Any], lookback_days: int, now: datetime | None = None
+    ) -> RollingAverages:
+        """Wrap a series fetched by analyze_daily_spending() during this run."""
+        return cls(spending_data, lookback_days, daily_end_time(now or datetime.now(UTC)))
+
+    def covers(self, days: int) -> bool:
+        return days <= self.lookback_days
+
+    def average(self, sp_type: str, days: int) -> float:
+        """Mean daily-point total over the last `days` days (0.0 when empty)."""
+        if not self.covers(days):
+            raise ValueError(f"{days}-day window exceeds the {self.lookback_days}-day series")
+        dates = self._dates.get(sp_type, [])
+        prefix = self._prefix.get(sp_type, [0.0])
+        cutoff = (self.end - timedelta(days=days)).strftime(_DATE_FORMAT)
+        lo = bisect_right(dates, cutoff)
+        hi = bisect_right(dates, self._end_date)
+        count = hi - lo
+        return (prefix[hi] - prefix[lo]) / count if count > 0 else 0.0
+
+    def averages(self, days: int) -> dict[str, float]:
+        """{sp_type: average} for one window."""
+        return {sp_type: self.average(sp_type, days) for sp_type in self._dates}
+
+    def window_averages(self, windows: list[int]) -> dict[int, dict[str, float]]:
+        """{days: {sp_type: average}} for every requested window."""
+        return {days: self.averages(days) for days in windows}
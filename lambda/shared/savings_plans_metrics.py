@@ -17,6 +17,7 @@ from botocore.exceptions import ClientError
 from shared import sp_calculations
 from shared.aws_debug import add_response
 from shared.constants import AWS_TYPE_TO_KEY, DIMENSION_SAVINGS_PLANS_TYPE, PLAN_TYPE_TO_API_FILTER
+from shared.plan_inventory import get_plan_inventory
 
 
 if TYPE_CHECKING:
@@ -122,26 +123,17 @@ def get_recent_purchase_sp_types(
     if cooldown_days <= 0:
         return set()
 
-    cutoff = datetime.now(UTC) - timedelta(days=cooldown_days)
-    plans = get_active_savings_plans(savingsplans_client)
+    ladder = get_plan_inventory(savingsplans_client).ladder
     recent_types: set[str] = set()
 
-    for plan in plans:
-        start_str = plan.get("start_date", "")
-        if not start_str or start_str == "Unknown":
-            continue
-        try:
-            start_date = datetime.fromisoformat(start_str.replace("Z", "+00:00"))
-            if start_date >= cutoff:
-                sp_key = AWS_TYPE_TO_KEY.get(plan["plan_type"])
-                if sp_key:
-                    logger.info(
-                        f"Recent purchase detected: {sp_key} plan {plan['plan_id']} "
-                        f"started {start_str} (within {cooldown_days}-day cooldown)"
-                    )
-                    recent_types.add(sp_key)
-        except (ValueError, TypeError):
-            continue
+    for plan in ladder.purchased_within(cooldown_days, datetime.now(UTC)):
+        sp_key = AWS_TYPE_TO_KEY.get(plan.get("savingsPlanType", ""))
+        if sp_key:
+            logger.info(
+                f"Recent purchase detected: {sp_key} plan {plan.get('savingsPlanId', 'Unknown')} "
+                f"started {plan.get('start')} (within {cooldown_days}-day cooldown)"
+            )
+            recent_types.add(sp_key)
 
     return recent_types
 
@@ -152,6 +144,9 @@ def get_active_savings_plans(
     """
     Get all active Savings Plans with details.
 
+    Reads the run-scoped plan inventory, so the (paginated) listing happens
+    once per invocation however many callers need it.
+
     Args:
         savingsplans_client: Boto3 Savings Plans client
 
@@ -176,18 +171,7 @@ def get_active_savings_plans(
     logger.info("Fetching active Savings Plans")
 
     try:
-        params = {"states": ["active"]}
-        response = savingsplans_client.describe_savings_plans(states=["active"])
-
-        # Capture raw AWS response for debugging
-        add_response(
-            api="describe_savings_plans",
-            params=params,
-            response=response,
-            context="get_active_savings_plans",
-        )
-
-        savings_plans = response.get("savingsPlans", [])
+        savings_plans = get_plan_inventory(savingsplans_client).plans
         logger.info(f"Found {len(savings_plans)} active Savings Plans")
 
         plans_data = []
@@ -537,7 +521,7 @@ def get_savings_plans_summary(
     Get comprehensive Savings Plans summary combining all metrics.
 
     Calls AWS APIs efficiently:
-    - describe_savings_plans (once for all plans)
+    - describe_savings_plans (once per run, via the plan inventory)
     - get_savings_plans_utilization (once per enabled plan type for metrics)
 
     Args:
@@ -8,6 +8,8 @@ Used by Scheduler (purchase decisions), Purchaser (cap validation), and Reporter
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
@@ -15,12 +17,18 @@ from botocore.exceptions import ClientError
 
 from shared import sp_calculations
 from shared.aws_debug import add_response
+from shared.ce_gateway import DEFAULT_REQUESTS_PER_SECOND
+from shared.coverage_cache import FINALIZED_AFTER, build_coverage_cache
+from shared.hourly_history import build_hourly_history, series_to_items
 
 
 if TYPE_CHECKING:
     from mypy_boto3_ce.client import CostExplorerClient
     from mypy_boto3_savingsplans.client import SavingsPlansClient
 
+    from shared.coverage_cache import CachePlan, CoverageCache
+    from shared.hourly_history import HourlyHistoryStore
+
 
 logger = logging.getLogger(__name__)
 
@@ -79,8 +87,97 @@ COMPUTE_SERVICE_NAMES_LOWER = {svc.lower() for svc in COMPUTE_SP_SERVICES}
 DATABASE_SERVICE_NAMES_LOWER = {svc.lower() for svc in DATABASE_SP_SERVICES}
 SAGEMAKER_SERVICE_NAMES_LOWER = {svc.lower() for svc in SAGEMAKER_SP_SERVICES}
 
+# Indexed SERVICE -> SP type lookup used to classify GROUP BY SERVICE coverage
+SERVICE_TO_SP_TYPE = {
+    **dict.fromkeys(COMPUTE_SP_SERVICES, "Compute"),
+    **dict.fromkeys(DATABASE_SP_SERVICES, "Database"),
+    **dict.fromkeys(SAGEMAKER_SP_SERVICES, "SageMaker"),
+}
+
+# Hourly fetch modes (config coverage_fetch_mode):
+# - "filtered": one service-filtered request per SP type, plus a 1-day GROUP BY
+#   SERVICE call to detect services missing from the constants above
+# - "grouped": one GROUP BY SERVICE request covering every type; coverage is
+#   classified locally and unknown services are reported from the same data
+COVERAGE_FETCH_MODES = ("filtered", "grouped")
+DEFAULT_COVERAGE_FETCH_MODE = "filtered"
+
+# Pseudo SP type naming the single grouped request (coverage cache key)
+_GROUPED_REQUEST = "AllServices"
+
+# Upper bound on concurrent Cost Explorer requests issued by one analyzer fetch.
+# The effective pool is also capped by the ce_requests_per_second budget;
+# request pacing itself is done by shared.ce_gateway.
+MAX_FETCH_WORKERS = 8
+
+# Default hourly fetch shard size in days (overridable via config)
+DEFAULT_COVERAGE_SHARD_DAYS = 7
+
+CE_DATE_FORMATS = {"HOURLY": "%Y-%m-%dT%H:%M:%SZ", "DAILY": "%Y-%m-%d"}
+
+
+def build_time_shards(
+    start_time: datetime, end_time: datetime, shard_days: int
+) -> list[tuple[datetime, datetime]]:
+    """
+    Split [start_time, end_time) into consecutive half-open windows of shard_days days.
+
+    The last window is truncated at end_time. A non-positive shard_days returns the
+    whole range as a single window.
+    """
+    if shard_days <= 0 or end_time <= start_time:
+        return [(start_time, end_time)]
+
+    step = timedelta(days=shard_days)
+    shards = []
+    shard_start = start_time
+    while shard_start < end_time:
+        shard_end = min(shard_start + step, end_time)
+        shards.append((shard_start, shard_end))
+        shard_start = shard_end
+    return shards
+
+
+def paginate_coverage(
+    ce_client: CostExplorerClient, params: dict[str, Any], **debug_metadata: Any
+) -> Iterator[list[dict[str, Any]]]:
+    """
+    Yield SavingsPlansCoverages pages for a get_savings_plans_coverage request.
+
+    Follows NextToken until Cost Explorer reports no further pages. Each raw
+    response is recorded for debug output and then dropped, so only one page
+    is held in memory at a time.
+
+    Args:
+        ce_client: Boto3 Cost Explorer client
+        params: get_savings_plans_coverage parameters (without NextToken)
+        **debug_metadata: Extra fields for aws_debug (e.g., sp_type, context)
+
+    Yields:
+        list: Coverage items of one response page
+
+    Raises:
+        ClientError: If AWS API calls fail
+    """
+    page_params = params
+    while True:
+        response = ce_client.get_savings_plans_coverage(**page_params)
+        add_response(
+            api="get_savings_plans_coverage",
+            params=page_params,
+            response=response,
+            **debug_metadata,
+        )
+
+        yield response.get("SavingsPlansCoverages", [])
+
+        next_token = response.get("NextToken")
+        if not next_token:
+            return
+        page_params = {**params, "NextToken": next_token}
+
 
-def _build_timeseries_by_timestamp(coverage_data: list[dict[str, Any]]) -> dict[str, dict]:
+def _build_timeseries_by_timestamp(coverage_data: Iterable[dict[str, Any]]) -> dict[str, dict]:
     """Build timeseries data grouped by timestamp and SP type."""
     timeseries_by_timestamp = {}
 
@@ -137,7 +234,14 @@ def _calculate_sp_type_summary(
     }
 
 
-def group_coverage_by_sp_type(coverage_data: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+def daily_end_time(now: datetime) -> datetime:
+    """Exclusive end of daily coverage queries: midnight UTC yesterday (today is incomplete)."""
+    return (now - timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def group_coverage_by_sp_type(
+    coverage_data: Iterable[dict[str, Any]],
+) -> dict[str, dict[str, Any]]:
     """
     Group Cost Explorer coverage data by Savings Plan type with time series.
 
@@ -145,10 +249,11 @@ def group_coverage_by_sp_type(coverage_data: list[dict[str, Any]]) -> dict[str,
     preserving the time series for graphing and analysis.
 
     Items are pre-tagged with SP type names ("compute", "database", "sagemaker")
-    in _fetch_coverage_data for direct classification.
+    in _fetch_coverage_data for direct classification. The items are consumed in a
+    single pass, so a generator streaming Cost Explorer pages can be passed directly.
 
     Args:
-        coverage_data: List of coverage items from SavingsPlansCoverages response
+        coverage_data: Coverage items from SavingsPlansCoverages responses (any iterable)
 
     Returns:
         dict: Time series and summary data by SP type, e.g.:
@@ -220,16 +325,40 @@ class SpendingAnalyzer:
     accurate coverage percentages and spending details by SP type (Compute, Database, SageMaker).
     """
 
-    def __init__(self, savingsplans_client: SavingsPlansClient, ce_client: CostExplorerClient):
+    def __init__(
+        self,
+        savingsplans_client: SavingsPlansClient,
+        ce_client: CostExplorerClient,
+        max_workers: int = MAX_FETCH_WORKERS,
+        cache: CoverageCache | None = None,
+        history: HourlyHistoryStore | None = None,
+    ):
         """
         Initialize the spending analyzer.
 
         Args:
             savingsplans_client: Boto3 Savings Plans client
             ce_client: Boto3 Cost Explorer client
+            max_workers: Maximum concurrent Cost Explorer fetches (one per SP type
+                and time shard; 1 streams them sequentially)
+            cache: Optional store of finalized coverage days (see shared.coverage_cache)
+            history: Optional long-horizon hourly store (see shared.hourly_history)
         """
         self.savingsplans_client = savingsplans_client
         self.ce_client = ce_client
+        self.max_workers = max_workers
+        self.cache = cache
+        self.history = history
+
+    @classmethod
+    def from_clients(cls, clients: dict[str, Any], config: dict[str, Any]) -> SpendingAnalyzer:
+        """Build an analyzer from get_clients() output, enabling the coverage stores if configured."""
+        return cls(
+            clients["savingsplans"],
+            clients["ce"],
+            cache=build_coverage_cache(config, clients.get("s3")),
+            history=build_hourly_history(config, clients.get("s3")),
+        )
 
     def analyze_current_spending(self, config: dict[str, Any]) -> dict[str, dict[str, Any]]:
         """
@@ -271,15 +400,16 @@ class SpendingAnalyzer:
         """
         now = datetime.now(UTC)
 
-        # Step 1: Validate our service constants are complete
-        unknown_services = self._validate_service_constants(now)
+        # Step 1: Validate our service constants are complete (grouped mode
+        # discovers unknown services from the coverage data itself)
+        grouped = config.get("coverage_fetch_mode", DEFAULT_COVERAGE_FETCH_MODE) == "grouped"
+        unknown_services: set[str] = set() if grouped else self._validate_service_constants(now)
 
-        # Step 2: Fetch coverage data from Cost Explorer
+        # Step 2 + 3: Stream coverage pages from Cost Explorer into per-type time series
         lookback_hours = config["lookback_hours"]
-        coverage_data = self._fetch_coverage_data(now, lookback_hours, config)
-
-        # Step 3: Group coverage by SP type with time series
-        sp_type_data = group_coverage_by_sp_type(coverage_data)
+        sp_type_data = group_coverage_by_sp_type(
+            self._fetch_coverage_data(now, lookback_hours, config, unknown_services)
+        )
 
         logger.info(
             f"Coverage by type - Compute: {sp_type_data['compute']['summary']['avg_coverage_total']:.2f}% "
@@ -292,7 +422,7 @@ class SpendingAnalyzer:
         )
 
         # Include unknown services in result for handler to check
-        sp_type_data["_unknown_services"] = list(unknown_services)
+        sp_type_data["_unknown_services"] = sorted(unknown_services)
 
         return sp_type_data
 
@@ -300,31 +430,25 @@ class SpendingAnalyzer:
         """Fetch coverage at DAILY granularity for long-term trend charts (up to 365 days)."""
         now = datetime.now(UTC)
         lookback_days = config["lookback_days"]
-        end_time = now - timedelta(days=1)
+        end_time = daily_end_time(now)
         start_time = end_time - timedelta(days=lookback_days)
 
         service_filters = self._build_service_filters(config)
         if not service_filters:
             return group_coverage_by_sp_type([])
 
-        date_format = "%Y-%m-%d"
-        all_coverages = []
-
-        for sp_type, service_list in service_filters:
-            params = {
-                "TimePeriod": {
-                    "Start": start_time.strftime(date_format),
-                    "End": end_time.strftime(date_format),
-                },
-                "Granularity": "DAILY",
-                "Filter": {"Dimensions": {"Key": "SERVICE", "Values": service_list}},
-            }
-            response = self.ce_client.get_savings_plans_coverage(**params)
-            coverages = response.get("SavingsPlansCoverages", [])
-            self._tag_coverage_items(coverages, sp_type)
-            all_coverages.extend(coverages)
-
-        return group_coverage_by_sp_type(all_coverages)
+        return group_coverage_by_sp_type(
+            item
+            for _, items in self._fetch_per_type(
+                service_filters,
+                "DAILY",
+                start_time=start_time,
+                end_time=end_time,
+                now=now,
+                context="analyze_daily_spending",
+            )
+            for item in items
+        )
 
     def _build_service_filters(self, config: dict[str, Any]) -> list[tuple[str, list[str]]]:
         """Build list of (SP type name, service list) tuples based on enabled SP types."""
@@ -344,22 +468,204 @@ class SpendingAnalyzer:
                 item["Attributes"] = {}
             item["Attributes"]["SERVICE"] = sp_type.lower()
 
+    def _iter_tagged_coverages(
+        self, params: dict[str, Any], sp_type: str, context: str
+    ) -> Iterator[dict[str, Any]]:
+        """Yield every coverage item of a paginated request, tagged with its SP type."""
+        for page in paginate_coverage(self.ce_client, params, sp_type=sp_type, context=context):
+            self._tag_coverage_items(page, sp_type)
+            yield from page
+
+    def _fetch_per_type(
+        self,
+        service_filters: list[tuple[str, list[str]]],
+        granularity: str,
+        *,
+        start_time: datetime,
+        end_time: datetime,
+        now: datetime,
+        context: str,
+        shard_days: int = 0,
+        requests_per_second: float = 0,
+        group_by_service: bool = False,
+    ) -> Iterator[tuple[str, Iterable[dict[str, Any]]]]:
+        """
+        Fetch coverage items for each SP type, concurrently when allowed.
+
+        With a cache, finalized days already stored are served from it and only
+        the missing windows are requested. Each window is split into time shards
+        of shard_days days. With a single worker (or a single request overall)
+        pages are streamed lazily. Otherwise every (SP type, shard) request is
+        fetched on a bounded thread pool whose size never exceeds the per-second
+        request budget (the CE gateway paces the requests themselves). Results are
+        yielded in service_filters order with shards in chronological order,
+        regardless of which request finishes first, so the merged output is
+        deterministic.
+
+        With group_by_service, requests are grouped by SERVICE instead of
+        filtered and items are yielded untagged (see _fetch_grouped_by_type).
+
+        Yields:
+            tuple: (SP type name, coverage items tagged with that type)
+        """
+        date_format = CE_DATE_FORMATS[granularity]
+        plans: dict[str, CachePlan] = {}
+        requests: dict[str, list[dict[str, Any]]] = {}
+
+        for sp_type, service_list in service_filters:
+            windows = [(start_time, end_time)]
+            if self.cache:
+                plans[sp_type] = self.cache.plan(
+                    granularity, sp_type, service_list, start_time, end_time, now=now
+                )
+                windows = plans[sp_type].missing_windows
+
+            requests[sp_type] = [
+                {
+                    "TimePeriod": {
+                        "Start": shard_start.strftime(date_format),
+                        "End": shard_end.strftime(date_format),
+                    },
+                    "Granularity": granularity,
+                    **(
+                        {"GroupBy": [{"Type": "DIMENSION", "Key": "SERVICE"}]}
+                        if group_by_service
+                        else {"Filter": {"Dimensions": {"Key": "SERVICE", "Values": service_list}}}
+                    ),
+                }
+                for window_start, window_end in windows
+                for shard_start, shard_end in build_time_shards(
+                    window_start, window_end, shard_days
+                )
+            ]
+
+        workers = min(self.max_workers, sum(len(params) for params in requests.values()))
+        if requests_per_second > 0:
+            workers = min(workers, max(1, int(requests_per_second)))
+
+        def iter_items(params: dict[str, Any], sp_type: str) -> Iterator[dict[str, Any]]:
+            if not group_by_service:
+                return self._iter_tagged_coverages(params, sp_type, context)
+            return (
+                item
+                for page in paginate_coverage(self.ce_client, params, context=context)
+                for item in page
+            )
+
+        if workers <= 1:
+            for sp_type, type_requests in requests.items():
+                items = (item for params in type_requests for item in iter_items(params, sp_type))
+                yield sp_type, self._through_cache(plans.get(sp_type), items)
+            return
+
+        def fetch(sp_type: str, params: dict[str, Any]) -> list[dict[str, Any]]:
+            return list(iter_items(params, sp_type))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures_by_type = {
+                sp_type: [executor.submit(fetch, sp_type, params) for params in type_requests]
+                for sp_type, type_requests in requests.items()
+            }
+
+            for sp_type, futures in futures_by_type.items():
+                items = [item for future in futures for item in future.result()]
+                yield sp_type, self._through_cache(plans.get(sp_type), items)
+
+    def _through_cache(
+        self, plan: CachePlan | None, fetched: Iterable[dict[str, Any]]
+    ) -> Iterator[dict[str, Any]]:
+        """Yield cached items then fetched ones, storing finalized days once exhausted."""
+        if plan is None:
+            yield from fetched
+            return
+
+        yield from plan.cached_items
+        fetched_items = []
+        for item in fetched:
+            fetched_items.append(item)
+            yield item
+        self.cache.store(plan, fetched_items)
+
+    def _fetch_grouped_by_type(
+        self,
+        service_filters: list[tuple[str, list[str]]],
+        unknown_services: set[str],
+        **fetch_kwargs: Any,
+    ) -> Iterator[tuple[str, list[dict[str, Any]]]]:
+        """
+        Fetch coverage for every service in one GROUP BY SERVICE request per shard.
+
+        Each item is classified through SERVICE_TO_SP_TYPE and re-tagged with its SP
+        type (as a copy, so cached raw items keep their real service names). Items of
+        disabled types are dropped; services missing from the constants are added to
+        unknown_services.
+
+        Yields:
+            tuple: (SP type name, coverage items tagged with that type), in
+                service_filters order
+        """
+        enabled = {sp_type for sp_type, _ in service_filters}
+        by_type: dict[str, list[dict[str, Any]]] = {sp_type: [] for sp_type in enabled}
+        for _, items in self._fetch_per_type(
+            [(_GROUPED_REQUEST, [])], "HOURLY", group_by_service=True, **fetch_kwargs
+        ):
+            for item in items:
+                attributes = item.get("Attributes", {})
+                service = attributes.get("SERVICE")
+                sp_type = SERVICE_TO_SP_TYPE.get(service)
+                if sp_type is None:
+                    if service:
+                        unknown_services.add(service)
+                    continue
+                if sp_type in enabled:
+                    by_type[sp_type].append(
+                        {**item, "Attributes": {**attributes, "SERVICE": sp_type.lower()}}
+                    )
+
+        if unknown_services:
+            logger.warning(
+                f"Discovered {len(unknown_services)} unknown service(s) with Savings Plans coverage: "
+                f"{sorted(unknown_services)}. Analysis will continue with known services only."
+            )
+        for sp_type, _ in service_filters:
+            yield sp_type, by_type[sp_type]
+
     def _fetch_coverage_data(
-        self, now: datetime, lookback_hours: int, config: dict[str, Any]
-    ) -> list[dict[str, Any]]:
+        self,
+        now: datetime,
+        lookback_hours: int,
+        config: dict[str, Any],
+        unknown_services: set[str] | None = None,
+    ) -> Iterator[dict[str, Any]]:
         """
-        Fetch Savings Plans coverage data from Cost Explorer at HOURLY granularity.
+        Stream Savings Plans coverage data from Cost Explorer at HOURLY granularity.
 
         AWS retains hourly data for 14 days (336 hours).
-        Service filtering keeps each call under the 500-item limit.
+        The lookback is split into half-open windows of coverage_shard_days days and
+        each (SP type, window) request is service-filtered, which keeps every call
+        small; any further pages are followed through NextToken. Requests run
+        concurrently, bounded by max_workers and the ce_requests_per_second budget,
+        and are yielded in a fixed Compute, Database, SageMaker order. Days already
+        held by the coverage cache are not requested again.
+
+        With coverage_fetch_mode "grouped", a single GROUP BY SERVICE request (per
+        shard) replaces the per-type requests and unknown services are added to
+        unknown_services from that data.
+
+        With an hourly history store, finalized hours are appended to it after each
+        fetch, and when history_lookback_days extends past lookback_hours the older
+        hours (plus any stored hours inside the API window) are served from the store.
 
         Args:
             now: Current timestamp
             lookback_hours: Number of hours to look back (max 336)
-            config: Configuration dictionary with enable flags
+            config: Configuration dictionary with enable flags, and optionally
+                coverage_shard_days (0 disables sharding), ce_requests_per_second,
+                history_lookback_days and coverage_fetch_mode
+            unknown_services: Set collecting unknown services in grouped mode
 
-        Returns:
-            list: Coverage data items from Cost Explorer response
+        Yields:
+            dict: Coverage items, tagged with their SP type
 
         Raises:
             ClientError: If AWS API calls fail
@@ -371,43 +677,59 @@ class SpendingAnalyzer:
         service_filters = self._build_service_filters(config)
         if not service_filters:
             logger.warning("No SP types enabled - returning empty coverage data")
-            return []
+            return
 
+        shard_days = config.get("coverage_shard_days", DEFAULT_COVERAGE_SHARD_DAYS)
+        requests_per_second = config.get("ce_requests_per_second", DEFAULT_REQUESTS_PER_SECOND)
+
+        api_start, history_items = self._plan_history(
+            service_filters, start_time, end_time, config.get("history_lookback_days", 0)
+        )
+
+        grouped = config.get("coverage_fetch_mode", DEFAULT_COVERAGE_FETCH_MODE) == "grouped"
+        call_mode = "one grouped-by-service call" if grouped else "service-filtered calls"
         logger.info(
-            f"Fetching hourly coverage data for {lookback_hours} hours "
-            f"using {len(service_filters)} service-filtered calls"
+            f"Fetching hourly coverage data for {(end_time - api_start) // timedelta(hours=1)} "
+            f"hours for {len(service_filters)} SP type(s) using {call_mode} in {shard_days}-day "
+            f"shards (budget: {requests_per_second} requests/s, "
+            f"cache: {'on' if self.cache else 'off'})"
         )
 
-        date_format = "%Y-%m-%dT%H:%M:%SZ"
-        all_coverages = []
+        fetch_kwargs = {
+            "start_time": api_start,
+            "end_time": end_time,
+            "now": now,
+            "context": "_fetch_coverage_data",
+            "shard_days": shard_days,
+            "requests_per_second": requests_per_second,
+        }
+        total_items = 0
+        fetched_by_type: dict[str, list[dict[str, Any]]] = {}
 
         try:
-            for sp_type, service_list in service_filters:
-                params = {
-                    "TimePeriod": {
-                        "Start": start_time.strftime(date_format),
-                        "End": end_time.strftime(date_format),
-                    },
-                    "Granularity": "HOURLY",
-                    "Filter": {"Dimensions": {"Key": "SERVICE", "Values": service_list}},
-                }
-
-                response = self.ce_client.get_savings_plans_coverage(**params)
-                add_response(
-                    api="get_savings_plans_coverage",
-                    params=params,
-                    response=response,
-                    sp_type=sp_type,
-                    context="_fetch_coverage_data",
+            if grouped:
+                per_type = self._fetch_grouped_by_type(
+                    service_filters,
+                    unknown_services if unknown_services is not None else set(),
+                    **fetch_kwargs,
                 )
-
-                coverages = response.get("SavingsPlansCoverages", [])
-                self._tag_coverage_items(coverages, sp_type)
-                all_coverages.extend(coverages)
-
+            else:
+                per_type = self._fetch_per_type(service_filters, "HOURLY", **fetch_kwargs)
+
+            for sp_type, items in per_type:
+                stored = history_items.get(sp_type, [])
+                yield from stored
+                type_items = len(stored)
+                fetched = fetched_by_type.setdefault(sp_type, [])
+                for item in items:
+                    type_items += 1
+                    if self.history:
+                        fetched.append(item)
+                    yield item
+
+                total_items += type_items
                 logger.debug(
-                    f"SP type '{sp_type}': Fetched {len(coverages)} items "
-                    f"(total: {len(all_coverages)})"
+                    f"SP type '{sp_type}': Fetched {type_items} items (total: {total_items})"
                 )
 
         except ClientError as e:
@@ -422,24 +744,65 @@ class SpendingAnalyzer:
                 ) from e
             raise
 
-        if not all_coverages:
+        if self.history:
+            for sp_type, fetched in fetched_by_type.items():
+                self.history.extend(sp_type, fetched, finalized_before=now - FINALIZED_AFTER)
+
+        if not total_items:
             logger.warning("No hourly coverage data available from Cost Explorer")
-            return []
+            return
+
+        logger.info(f"Fetched {total_items} total hourly coverage data points ({call_mode})")
+
+    def _plan_history(
+        self,
+        service_filters: list[tuple[str, list[str]]],
+        start_time: datetime,
+        end_time: datetime,
+        history_days: int,
+    ) -> tuple[datetime, dict[str, list[dict[str, Any]]]]:
+        """
+        Decide which hours come from the hourly history store.
+
+        The store serves [history start, api_start) for every SP type; api_start
+        moves past start_time only when every type's stored series already covers
+        start_time, so the API and the store never overlap or leave a gap.
 
+        Returns:
+            tuple: (start of the window to fetch from Cost Explorer, stored items by SP type)
+        """
+        if not self.history or history_days <= 0:
+            return start_time, {}
+
+        history_start = min(start_time, end_time - timedelta(days=history_days))
+        series_by_type = {
+            sp_type: self.history.load(sp_type, history_start) for sp_type, _ in service_filters
+        }
+
+        api_start = start_time
+        if all(
+            series is not None and series.start_time <= start_time
+            for series in series_by_type.values()
+        ):
+            api_start = max(start_time, min(series.end_time for series in series_by_type.values()))
+
+        history_items = {
+            sp_type: series_to_items(sp_type, series, api_start) if series else []
+            for sp_type, series in series_by_type.items()
+        }
         logger.info(
-            f"Fetched {len(all_coverages)} total hourly coverage data points "
-            f"from {len(service_filters)} service-filtered calls"
+            f"Serving {sum(len(items) for items in history_items.values())} hourly data points "
+            f"from history (since {history_start:%Y-%m-%d}), API window starts {api_start:%Y-%m-%d %H:%M}"
         )
-
-        return all_coverages
+        return api_start, history_items
 
     def _validate_service_constants(self, now: datetime) -> set[str]:
         """
         Validate that our service constants include all AWS services with SP coverage.
 
-        Makes a single-day GROUP BY SERVICE call to discover all services with coverage data,
-        then compares against our predefined service constants. This helps detect when AWS
-        adds new services that support Savings Plans.
+        Makes a single-day GROUP BY SERVICE call (following any NextToken pages) to discover
+        all services with coverage data, then compares against our predefined service
+        constants. This helps detect when AWS adds new services that support Savings Plans.
 
         Uses 1-day period to stay well under the 500-item limit while still discovering
         all active services.
@@ -471,20 +834,18 @@ class SpendingAnalyzer:
                 "GroupBy": [{"Type": "DIMENSION", "Key": "SERVICE"}],
             }
 
-            response = self.ce_client.get_savings_plans_coverage(**params)
-            coverages = response.get("SavingsPlansCoverages", [])
-
-            # Collect all unique services from the response
+            # Collect all unique services across every response page
             discovered_services = set()
-            for item in coverages:
-                service = item.get("Attributes", {}).get("SERVICE")
-                if service:
-                    discovered_services.add(service)
+            for page in paginate_coverage(
+                self.ce_client, params, context="_validate_service_constants"
+            ):
+                for item in page:
+                    service = item.get("Attributes", {}).get("SERVICE")
+                    if service:
+                        discovered_services.add(service)
 
             # Check against our known services
-            all_known_services = set(
-                COMPUTE_SP_SERVICES + DATABASE_SP_SERVICES + SAGEMAKER_SP_SERVICES
-            )
+            all_known_services = set(SERVICE_TO_SP_TYPE)
             unknown_services = discovered_services - all_known_services
 
             if unknown_services:
@@ -28,17 +28,10 @@ def _resolve_min_purchase(config: dict[str, Any]) -> float:
     return round(100.0 / term_months, 2)
 
 
-def calculate_gap_split(
-    current_coverage: float, target_coverage: float, config: dict[str, Any]
+def gap_split_size(
+    gap: float, divider: float, min_purchase: float, max_purchase: float | None
 ) -> float:
-    gap = target_coverage - current_coverage
-    if gap <= 0:
-        return 0.0
-
-    divider = config["gap_split_divider"]
-    min_purchase = _resolve_min_purchase(config)
-    max_purchase = config.get("max_purchase_percent")
-
+    """Unrounded purchase % for a positive gap: gap / divider within [min, max] purchase."""
     divided = gap / divider
 
     if max_purchase is not None and divided > max_purchase:
@@ -47,4 +40,20 @@ def calculate_gap_split(
     if gap < min_purchase:
         divided = gap
 
+    return divided
+
+
+def calculate_gap_split(
+    current_coverage: float, target_coverage: float, config: dict[str, Any]
+) -> float:
+    gap = target_coverage - current_coverage
+    if gap <= 0:
+        return 0.0
+
+    divided = gap_split_size(
+        gap,
+        config["gap_split_divider"],
+        _resolve_min_purchase(config),
+        config.get("max_purchase_percent"),
+    )
     return round(divided, 1)
@@ -10,6 +10,8 @@ import logging
 from datetime import UTC, datetime
 from typing import Any
 
+from botocore.exceptions import ClientError
+
 from . import local_mode
 
 
@@ -242,3 +244,54 @@ class StorageAdapter:
         except Exception as e:
             logger.error(f"Failed to list S3 reports: {e}")
             raise
+
+    def read_object(self, key: str) -> bytes | None:
+        """
+        Read a raw object (e.g. cache entries) by key.
+
+        Args:
+            key: Object key, may contain "/" separators.
+
+        Returns:
+            bytes: Object body, or None if the object does not exist.
+
+        Raises:
+            Exception: If the read fails for any other reason.
+        """
+        if self.is_local:
+            file_path = self.reports_dir / key
+            return file_path.read_bytes() if file_path.exists() else None
+
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                return None
+            raise
+        return response["Body"].read()
+
+    def write_object(self, key: str, body: bytes, content_type: str = "application/json") -> None:
+        """
+        Write a raw object by key, overwriting any existing object.
+
+        Args:
+            key: Object key, may contain "/" separators.
+            body: Object content.
+            content_type: MIME type stored with the S3 object.
+
+        Raises:
+            Exception: If the write fails.
+        """
+        if self.is_local:
+            file_path = self.reports_dir / key
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_bytes(body)
+            return
+
+        self.s3_client.put_object(
+            Bucket=self.bucket_name,
+            Key=key,
+            Body=body,
+            ContentType=content_type,
+            ServerSideEncryption="AES256",
+        )
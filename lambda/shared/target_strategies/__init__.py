@@ -1,11 +1,13 @@
 from typing import Any
 
 from shared.target_strategies.aws_target import resolve_aws
+from shared.target_strategies.budget_target import resolve_budget
 from shared.target_strategies.dynamic_target import resolve_dynamic
 
 
 TARGET_STRATEGIES = {
     "aws": resolve_aws,
+    "budget": resolve_budget,
     "dynamic": resolve_dynamic,
 }
 
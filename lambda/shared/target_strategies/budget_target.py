@@ -0,0 +1,129 @@
+"""Budget target — spread a capped $/h of new commitment across SP types.
+
+Each type's net savings S(L) over the lookback is concave and piecewise linear
+in its coverage level L (on-demand $/h): between consecutive hourly costs,
+committing one more dollar saves (hours above L) / (N * discount_factor) - 1
+dollars. Pooling every type's segments and filling the budget from the highest
+rate down is therefore the exact optimum of the combined savings (a fractional
+knapsack over linear pieces). Segments with a non-positive rate are never
+bought, so the budget is a cap, not a quota.
+
+The allocation is expressed as a per-type coverage target (% of min-hourly,
+like dynamic); the split strategy then paces purchases toward it, so one run
+never commits more than budget_commitment in total.
+"""
+
+import logging
+from bisect import bisect_right
+from typing import Any
+
+from shared.optimal_coverage import CostProfile
+from shared.sp_types import SP_TYPES
+
+
+logger = logging.getLogger()
+
+
+def _marginal_segments(
+    hourly_costs: list[float], savings_percentage: float, start_level: float
+) -> list[tuple[float, float]]:
+    """(savings per $ committed, commitment $/h) pieces above start_level, best first."""
+    profile = CostProfile(hourly_costs)
+    costs = profile.sorted_costs
+    num_hours = profile.num_hours
+    discount_factor = 1 - (savings_percentage / 100)
+
+    segments = []
+    level = start_level
+    j = bisect_right(costs, level)
+    while j < num_hours:
+        rate = (num_hours - j) / (num_hours * discount_factor) - 1
+        if rate <= 0:
+            break
+        next_level = costs[j]
+        while j < num_hours and costs[j] == next_level:
+            j += 1
+        segments.append((rate, (next_level - level) * discount_factor))
+        level = next_level
+    return segments
+
+
+def allocate_budget(
+    curves: dict[str, tuple[list[float], float, float]], budget: float
+) -> dict[str, float]:
+    """
+    Split budget ($/h of commitment) across SP types to maximize combined net savings.
+
+    Args:
+        curves: sp_type_key -> (hourly_costs, savings_percentage, current_level), the
+            current level being the on-demand $/h already covered
+        budget: Total new hourly commitment available
+
+    Returns:
+        sp_type_key -> hourly commitment to add (sums to at most budget)
+    """
+    pieces = [
+        (rate, order, key, width)
+        for order, (key, (costs, savings_pct, level)) in enumerate(curves.items())
+        for rate, width in _marginal_segments(costs, savings_pct, level)
+    ]
+    pieces.sort(key=lambda piece: (-piece[0], piece[1]))
+
+    allocation = dict.fromkeys(curves, 0.0)
+    remaining = budget
+    for _, _, key, width in pieces:
+        if remaining <= 0:
+            break
+        take = min(width, remaining)
+        allocation[key] += take
+        remaining -= take
+    return allocation
+
+
+def _budget_curves(
+    config: dict[str, Any], spending_data: dict[str, Any]
+) -> dict[str, tuple[list[float], float, float]]:
+    curves = {}
+    for sp_type in SP_TYPES:
+        key = sp_type["key"]
+        data = spending_data.get(key)
+        if not config.get(sp_type["enabled_config"]) or not data:
+            continue
+        # Zero-cost hours stay in: commitment is paid every hour
+        hourly_costs = [item.get("total", 0.0) for item in data.get("timeseries", [])]
+        if not any(cost > 0 for cost in hourly_costs):
+            continue
+        savings_pct = config.get(f"{key}_savings_percentage", config["savings_percentage"])
+        curves[key] = (hourly_costs, savings_pct, data["summary"]["avg_hourly_covered"])
+    return curves
+
+
+def resolve_budget(
+    config: dict[str, Any],
+    spending_data: dict[str, Any] | None = None,
+    sp_type_key: str | None = None,
+) -> float | None:
+    if not spending_data:
+        raise ValueError("Budget target strategy requires spending data")
+    if not sp_type_key:
+        raise ValueError("Budget target strategy resolves one SP type at a time")
+
+    curves = _budget_curves(config, spending_data)
+    if sp_type_key not in curves:
+        return None
+
+    budget = config["budget_commitment"]
+    allocation = allocate_budget(curves, budget)
+
+    hourly_costs, savings_pct, current_level = curves[sp_type_key]
+    nonzero = [cost for cost in hourly_costs if cost > 0]
+    min_hourly = min(nonzero)
+    added_coverage = allocation[sp_type_key] / (1 - savings_pct / 100)
+    target_percent = (current_level + added_coverage) / min_hourly * 100.0
+
+    logger.info(
+        f"Budget target ({sp_type_key}): allocated ${allocation[sp_type_key]:.5f}/h "
+        f"of ${budget:.5f}/h, target={target_percent:.1f}%"
+    )
+
+    return target_percent
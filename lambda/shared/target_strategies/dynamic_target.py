@@ -2,11 +2,44 @@ import logging
 from typing import Any
 
 from shared.optimal_coverage import calculate_strategies
+from shared.usage_forecast import DEFAULT_FORECAST_DAYS, forecast_hourly_costs
 
 
 logger = logging.getLogger()
 
-VALID_RISK_LEVELS = ["prudent", "min_hourly", "optimal", "maximum"]
+VALID_RISK_LEVELS = ["prudent", "min_hourly", "optimal", "maximum", "forecast"]
+
+
+def _combined_timeseries(
+    spending_data: dict[str, Any], types_to_check: list[str]
+) -> list[dict[str, Any]]:
+    """Hourly totals summed across types, zero hours kept so the season stays aligned."""
+    totals: dict[str | int, float] = {}
+    for key in types_to_check:
+        sp_data = spending_data.get(key) or {}
+        for i, item in enumerate(sp_data.get("timeseries", [])):
+            # Types share the same chronological hours; position stands in for a missing timestamp
+            hour = item.get("timestamp") or i
+            totals[hour] = totals.get(hour, 0.0) + item.get("total", 0.0)
+    return [
+        {"timestamp": hour if isinstance(hour, str) else "", "total": total}
+        for hour, total in totals.items()
+    ]
+
+
+def _forecast_coverage(
+    config: dict[str, Any],
+    spending_data: dict[str, Any],
+    types_to_check: list[str],
+    savings_percentage: float,
+) -> float | None:
+    """Optimal coverage ($/h) against the projected usage, None if nothing is projected."""
+    days = config.get("forecast_days", DEFAULT_FORECAST_DAYS)
+    projected = forecast_hourly_costs(_combined_timeseries(spending_data, types_to_check), days)
+    projected = [cost for cost in projected if cost > 0]
+    if not projected:
+        return None
+    return calculate_strategies(projected, savings_percentage)["optimal"]
 
 
 def resolve_dynamic(
@@ -44,8 +77,14 @@ def resolve_dynamic(
     )
 
     prudent_pct = config.get("prudent_percentage", 85.0)
-    strategies = calculate_strategies(hourly_costs, savings_percentage, prudent_pct=prudent_pct)
-    coverage_hourly = strategies[risk_level]
+    coverage_hourly = None
+    if risk_level == "forecast":
+        coverage_hourly = _forecast_coverage(
+            config, spending_data, types_to_check, savings_percentage
+        )
+    if coverage_hourly is None:
+        strategies = calculate_strategies(hourly_costs, savings_percentage, prudent_pct=prudent_pct)
+        coverage_hourly = strategies["optimal" if risk_level == "forecast" else risk_level]
 
     min_hourly = min(hourly_costs)
     if min_hourly <= 0:
@@ -0,0 +1,129 @@
+"""Unit tests for shared.backtest."""
+
+import random
+from datetime import UTC, datetime
+
+import pytest
+
+from shared.backtest import run_backtest
+
+
+HOURS_PER_YEAR = 8760
+
+
+def _config(**overrides):
+    config = {
+        "target_strategy_type": "dynamic",
+        "split_strategy_type": "one_shot",
+        "dynamic_risk_level": "min_hourly",
+        "savings_percentage": 30.0,
+        "fixed_step_percent": 10.0,
+        "gap_split_divider": 2.0,
+        "min_purchase_percent": 1.0,
+        "max_purchase_percent": None,
+        "min_commitment_per_plan": 0.001,
+        "renewal_window_days": 7,
+        "purchase_cooldown_days": 7,
+        "lookback_hours": 336,
+        "enable_compute_sp": True,
+        "enable_database_sp": False,
+        "enable_sagemaker_sp": False,
+        "compute_sp_term": "ONE_YEAR",
+        "compute_sp_payment_option": "NO_UPFRONT",
+        "database_sp_payment_option": "NO_UPFRONT",
+        "sagemaker_sp_payment_option": "NO_UPFRONT",
+    }
+    config.update(overrides)
+    return config
+
+
+def _office_hours(hours, seed=0):
+    rng = random.Random(seed)
+    return [
+        (30.0 if (h // 24) % 7 < 5 and 8 <= h % 24 < 18 else 10.0) * rng.uniform(0.9, 1.1)
+        for h in range(hours)
+    ]
+
+
+class TestBacktest:
+    def test_flat_spend_is_covered_after_first_run(self):
+        spend = [10.0] * (336 + 24 * 30)
+
+        result = run_backtest({"compute": spend}, _config())
+
+        summary = result["summary"]
+        assert result["purchases"][0]["sample"] == 336
+        assert result["purchases"][0]["hourly_commitment"] == pytest.approx(7.0)
+        assert summary["purchases"] == 1
+        assert summary["coverage"] == pytest.approx(100.0)
+        assert summary["savings_percentage"] == pytest.approx(30.0)
+        assert summary["waste"] == pytest.approx(0.0)
+        assert summary["peak_unused_commitment"] == pytest.approx(0.0)
+        assert result["evaluated_hours"] == 24 * 30
+
+    def test_expired_plans_are_renewed(self):
+        spend = [10.0] * (336 + 2 * HOURS_PER_YEAR)
+
+        result = run_backtest({"compute": spend}, _config(), interval_hours=24 * 30)
+
+        # Runs every 30 days renew each plan 5 days before it ends (days 360 and 720)
+        summary = result["summary"]
+        assert [p["sample"] // 24 for p in result["purchases"]] == [14, 374, 734]
+        assert summary["expirations"] == 2
+        # Renewed within the renewal window: never below full coverage for long
+        assert summary["coverage"] > 99.0
+        # The replacement overlaps the expiring plan during the window
+        assert summary["waste"] > 0
+        # ... when the old plan's 7 $/h go entirely unused
+        assert summary["peak_unused_commitment"] == pytest.approx(7.0)
+
+    def test_gradual_split_builds_coverage(self):
+        spend = _office_hours(336 + 24 * 180)
+
+        one_shot = run_backtest({"compute": spend}, _config())
+        gradual = run_backtest(
+            {"compute": spend}, _config(split_strategy_type="fixed_step", fixed_step_percent=10.0)
+        )
+
+        assert gradual["summary"]["purchases"] > one_shot["summary"]["purchases"]
+        assert gradual["summary"]["coverage"] < one_shot["summary"]["coverage"]
+        assert 0 < gradual["summary"]["net_savings"] < one_shot["summary"]["net_savings"]
+
+    def test_daily_samples_match_hourly_on_flat_spend(self):
+        hourly = [12.0] * (336 + 24 * 60)
+        daily = [12.0 * 24] * (len(hourly) // 24)
+
+        by_hour = run_backtest({"compute": hourly}, _config())
+        by_day = run_backtest({"compute": daily}, _config(), hours_per_sample=24)
+
+        assert by_day["summary"]["net_savings"] == pytest.approx(by_hour["summary"]["net_savings"])
+        assert by_day["evaluated_hours"] == by_hour["evaluated_hours"]
+
+    def test_timestamps_follow_start(self):
+        spend = [10.0] * 400
+
+        result = run_backtest({"compute": spend}, _config(), start=datetime(2025, 1, 6, tzinfo=UTC))
+
+        assert result["purchases"][0]["timestamp"] == "2025-01-20T00:00:00+00:00"
+
+    def test_budget_target_caps_each_run(self):
+        spend = {"compute": [10.0] * 400, "database": [4.0] * 400}
+        config = _config(
+            target_strategy_type="budget", budget_commitment=1.0, enable_database_sp=True
+        )
+
+        result = run_backtest(spend, config)
+
+        first_run = [p for p in result["purchases"] if p["sample"] == 336]
+        assert sum(p["hourly_commitment"] for p in first_run) <= 1.0 + 1e-6
+
+    def test_invalid_inputs(self):
+        with pytest.raises(ValueError, match="supports targets"):
+            run_backtest({"compute": [1.0] * 400}, _config(target_strategy_type="aws"))
+        with pytest.raises(ValueError, match="lookback window"):
+            run_backtest({"compute": [1.0] * 100}, _config())
+        with pytest.raises(ValueError, match="same length"):
+            run_backtest(
+                {"compute": [1.0] * 400, "database": [1.0] * 401},
+                _config(enable_database_sp=True),
+            )
@@ -0,0 +1,172 @@
+"""Unit tests for shared.ce_gateway."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from shared import ce_gateway
+from shared.ce_gateway import CostExplorerGateway, get_meter_summary, reset_meter
+
+
+def _throttle():
+    return ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+        "GetSavingsPlansCoverage",
+    )
+
+
+@pytest.fixture(autouse=True)
+def fresh_meter():
+    reset_meter()
+    yield
+    reset_meter()
+
+
+class TestCostExplorerGateway:
+    def test_successful_calls_are_metered(self):
+        client = MagicMock()
+        client.get_savings_plans_coverage.return_value = {"SavingsPlansCoverages": []}
+        gateway = CostExplorerGateway(client, requests_per_second=0)
+
+        gateway.get_savings_plans_coverage(TimePeriod={}, NextToken="1")
+        gateway.get_savings_plans_coverage(TimePeriod={}, NextToken="2")
+        gateway.get_cost_and_usage(TimePeriod={})
+
+        summary = get_meter_summary()
+        assert summary["ce_api_calls"] == 3
+        assert summary["ce_estimated_cost_usd"] == 0.03
+        assert summary["ce_calls_by_operation"] == {
+            "get_cost_and_usage": 1,
+            "get_savings_plans_coverage": 2,
+        }
+
+    def test_reset_clears_meter(self):
+        gateway = CostExplorerGateway(MagicMock(), requests_per_second=0)
+        gateway.get_savings_plans_coverage()
+
+        reset_meter()
+
+        assert get_meter_summary()["ce_api_calls"] == 0
+
+    def test_throttling_is_retried_and_slows_the_limiter(self):
+        client = MagicMock()
+        client.get_savings_plans_coverage.side_effect = [_throttle(), {"ok": True}]
+        gateway = CostExplorerGateway(client, requests_per_second=4)
+
+        with patch.object(ce_gateway.time, "sleep") as sleep:
+            assert gateway.get_savings_plans_coverage() == {"ok": True}
+
+        sleep.assert_called_once()
+        summary = get_meter_summary()
+        assert summary["ce_throttled_requests"] == 1
+        assert summary["ce_api_calls"] == 1
+        # Halved to 2.0 on throttle, then +0.5 after the successful retry
+        assert gateway._limiter.rate == 2.5
+
+    def test_throttling_gives_up_after_max_retries(self):
+        client = MagicMock()
+        client.get_savings_plans_coverage.side_effect = _throttle()
+        gateway = CostExplorerGateway(client, requests_per_second=0, max_retries=2)
+
+        with patch.object(ce_gateway.time, "sleep"), pytest.raises(ClientError):
+            gateway.get_savings_plans_coverage()
+
+        assert client.get_savings_plans_coverage.call_count == 3
+        assert get_meter_summary()["ce_api_calls"] == 0
+
+    def test_other_errors_are_not_retried(self):
+        client = MagicMock()
+        client.get_savings_plans_coverage.side_effect = ClientError(
+            {"Error": {"Code": "AccessDeniedException", "Message": "no"}},
+            "GetSavingsPlansCoverage",
+        )
+        gateway = CostExplorerGateway(client, requests_per_second=0)
+
+        with pytest.raises(ClientError):
+            gateway.get_savings_plans_coverage()
+
+        assert client.get_savings_plans_coverage.call_count == 1
+
+    def test_client_metadata_passes_through(self):
+        client = MagicMock()
+        gateway = CostExplorerGateway(client)
+
+        assert gateway.meta is client.meta
+
+
+class TestMemoization:
+    def test_identical_calls_issue_one_request(self):
+        client = MagicMock()
+        client.get_savings_plans_utilization.return_value = {"Total": {"Utilization": "90"}}
+        gateway = CostExplorerGateway(client, requests_per_second=0)
+        params = {"TimePeriod": {"Start": "a", "End": "b"}, "Granularity": "HOURLY"}
+
+        first = gateway.get_savings_plans_utilization(**params)
+        first["Total"]["Utilization"] = "mutated"
+        second = gateway.get_savings_plans_utilization(
+            Granularity="HOURLY", TimePeriod={"End": "b", "Start": "a"}
+        )
+
+        assert client.get_savings_plans_utilization.call_count == 1
+        assert second == {"Total": {"Utilization": "90"}}
+        summary = get_meter_summary()
+        assert summary["ce_api_calls"] == 1
+        assert summary["ce_memoized_calls"] == 1
+
+    def test_different_params_are_not_shared(self):
+        client = MagicMock()
+        gateway = CostExplorerGateway(client, requests_per_second=0)
+
+        gateway.get_savings_plans_utilization(Granularity="HOURLY")
+        gateway.get_savings_plans_utilization(Granularity="DAILY")
+
+        assert client.get_savings_plans_utilization.call_count == 2
+
+    def test_concurrent_identical_calls_are_coalesced(self):
+        release = threading.Event()
+        client = MagicMock()
+
+        def slow_call(**kwargs):
+            release.wait(timeout=5)
+            return {"ok": True}
+
+        client.get_savings_plans_purchase_recommendation.side_effect = slow_call
+        gateway = CostExplorerGateway(client, requests_per_second=0)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(gateway.get_savings_plans_purchase_recommendation, Term="ONE_YEAR")
+                for _ in range(4)
+            ]
+            time.sleep(0.05)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert results == [{"ok": True}] * 4
+        assert client.get_savings_plans_purchase_recommendation.call_count == 1
+
+    def test_failures_are_not_memoized(self):
+        client = MagicMock()
+        client.get_savings_plans_utilization.side_effect = [
+            ClientError({"Error": {"Code": "DataUnavailableException"}}, "Op"),
+            {"ok": True},
+        ]
+        gateway = CostExplorerGateway(client, requests_per_second=0)
+
+        with pytest.raises(ClientError):
+            gateway.get_savings_plans_utilization()
+
+        assert gateway.get_savings_plans_utilization() == {"ok": True}
+
+    def test_memoization_can_be_disabled(self):
+        client = MagicMock()
+        gateway = CostExplorerGateway(client, requests_per_second=0, memoize=False)
+
+        gateway.get_cost_and_usage()
+        gateway.get_cost_and_usage()
+
+        assert client.get_cost_and_usage.call_count == 2
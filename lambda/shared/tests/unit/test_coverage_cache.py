@@ -0,0 +1,113 @@
+"""Unit tests for shared.coverage_cache (local-mode storage)."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from shared.coverage_cache import CoverageCache, build_coverage_cache
+from shared.spending_analyzer import COMPUTE_SP_SERVICES, SpendingAnalyzer
+from shared.storage_adapter import StorageAdapter
+
+
+NOW = datetime(2026, 3, 15, 10, 30, tzinfo=UTC)
+TODAY = NOW.replace(hour=0, minute=0)
+SERVICES = ["Amazon Elastic Compute Cloud - Compute"]
+
+
+@pytest.fixture
+def cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("LOCAL_MODE", "true")
+    monkeypatch.setenv("LOCAL_DATA_DIR", str(tmp_path))
+    return CoverageCache(StorageAdapter())
+
+
+def _hourly_item(moment, total):
+    return {
+        "TimePeriod": {
+            "Start": moment.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "End": (moment + timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        },
+        "Coverage": {"SpendCoveredBySavingsPlans": "0", "TotalCost": str(total)},
+        "Attributes": {"SERVICE": "compute"},
+    }
+
+
+class TestCoverageCachePlan:
+    def test_empty_cache_fetches_whole_range(self, cache):
+        start = TODAY - timedelta(days=5)
+
+        plan = cache.plan("HOURLY", "Compute", SERVICES, start, TODAY, now=NOW)
+
+        assert plan.missing_windows == [(start, TODAY)]
+        assert plan.cached_items == []
+        # Only days ending 48h+ before NOW are finalized
+        assert plan.cacheable_days == ["2026-03-10", "2026-03-11", "2026-03-12"]
+
+    def test_stored_days_are_served_from_cache(self, cache):
+        start = TODAY - timedelta(days=5)
+        first = cache.plan("HOURLY", "Compute", SERVICES, start, TODAY, now=NOW)
+        fetched = [_hourly_item(start + timedelta(hours=h), 1.0) for h in range(5 * 24)]
+        cache.store(first, fetched)
+
+        second = cache.plan("HOURLY", "Compute", SERVICES, start, TODAY, now=NOW)
+
+        assert len(second.cached_items) == 3 * 24
+        assert second.missing_windows == [(TODAY - timedelta(days=2), TODAY)]
+        assert second.cacheable_days == []
+
+    def test_partial_leading_day_is_never_cached(self, cache):
+        start = TODAY - timedelta(days=4, hours=6)
+
+        plan = cache.plan("HOURLY", "Compute", SERVICES, start, TODAY, now=NOW)
+
+        assert plan.cacheable_days == ["2026-03-11", "2026-03-12"]
+        assert plan.missing_windows[0][0] == start
+
+    def test_service_list_change_invalidates_entries(self, cache):
+        start = TODAY - timedelta(days=5)
+        plan = cache.plan("HOURLY", "Compute", SERVICES, start, TODAY, now=NOW)
+        cache.store(plan, [])
+
+        other = cache.plan("HOURLY", "Compute", [*SERVICES, "AWS Lambda"], start, TODAY, now=NOW)
+
+        assert other.missing_windows == [(start, TODAY)]
+
+
+class TestStorageAdapterObjects:
+    def test_missing_s3_object_reads_as_none(self, monkeypatch):
+        monkeypatch.setenv("LOCAL_MODE", "false")
+        s3 = MagicMock()
+        s3.get_object.side_effect = ClientError(
+            {"Error": {"Code": "NoSuchKey", "Message": "missing"}}, "GetObject"
+        )
+
+        assert StorageAdapter(s3, "bucket").read_object("coverage-cache/x.json") is None
+
+    def test_cache_disabled_without_bucket(self):
+        assert build_coverage_cache({}, MagicMock()) is None
+
+
+class TestAnalyzerWithCache:
+    def test_second_run_only_fetches_unsettled_days(self, cache):
+        ce = MagicMock()
+        ce.get_savings_plans_coverage.return_value = {"SavingsPlansCoverages": []}
+        config = {
+            "lookback_days": 10,
+            "enable_compute_sp": True,
+            "enable_database_sp": False,
+            "enable_sagemaker_sp": False,
+        }
+
+        SpendingAnalyzer(MagicMock(), ce, cache=cache).analyze_daily_spending(config)
+        first_call = ce.get_savings_plans_coverage.call_args.kwargs
+        ce.reset_mock()
+        SpendingAnalyzer(MagicMock(), ce, cache=cache).analyze_daily_spending(config)
+        second_call = ce.get_savings_plans_coverage.call_args.kwargs
+
+        assert first_call["Filter"]["Dimensions"]["Values"] == COMPUTE_SP_SERVICES
+        assert ce.get_savings_plans_coverage.call_count == 1
+        # The rerun starts where the finalized (cached) days end
+        assert second_call["TimePeriod"]["Start"] > first_call["TimePeriod"]["Start"]
+        assert second_call["TimePeriod"]["End"] == first_call["TimePeriod"]["End"]
@@ -0,0 +1,133 @@
+"""Unit tests for shared.hourly_history."""
+
+import math
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from shared.hourly_history import MAX_HISTORY_DAYS, HourlyHistoryStore, series_to_items
+from shared.spending_analyzer import SpendingAnalyzer
+from shared.storage_adapter import StorageAdapter
+
+
+START = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def store(monkeypatch, tmp_path):
+    monkeypatch.setenv("LOCAL_MODE", "true")
+    monkeypatch.setenv("LOCAL_DATA_DIR", str(tmp_path))
+    return HourlyHistoryStore(StorageAdapter())
+
+
+def _item(moment, total, covered=0.0):
+    return {
+        "TimePeriod": {
+            "Start": moment.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "End": (moment + timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        },
+        "Coverage": {"SpendCoveredBySavingsPlans": str(covered), "TotalCost": str(total)},
+    }
+
+
+def _hours(start, count, total=1.0):
+    return [_item(start + timedelta(hours=h), total + h, covered=0.5) for h in range(count)]
+
+
+class TestHourlyHistoryStore:
+    def test_extend_and_load_round_trip(self, store):
+        store.extend("Compute", _hours(START, 48), finalized_before=START + timedelta(days=3))
+
+        series = store.load("Compute")
+
+        assert series.start_time == START
+        assert series.end_time == START + timedelta(hours=48)
+        assert list(series.totals[:3]) == [1.0, 2.0, 3.0]
+        assert set(series.covered) == {0.5}
+
+    def test_unsettled_hours_are_not_appended(self, store):
+        store.extend("Compute", _hours(START, 48), finalized_before=START + timedelta(hours=30))
+
+        assert store.load("Compute").end_time == START + timedelta(hours=30)
+
+    def test_later_runs_append_and_fill_gaps_with_nan(self, store):
+        store.extend("Compute", _hours(START, 24), finalized_before=START + timedelta(days=30))
+        later = START + timedelta(hours=30)
+        store.extend("Compute", _hours(later, 6), finalized_before=START + timedelta(days=30))
+
+        series = store.load("Compute")
+
+        assert series.end_time == later + timedelta(hours=6)
+        assert all(math.isnan(v) for v in series.totals[24:30])
+        # NaN hours are skipped when served as coverage items
+        items = series_to_items("Compute", series, series.end_time)
+        assert len(items) == 30
+
+    def test_overlapping_hours_are_not_rewritten(self, store):
+        store.extend("Compute", _hours(START, 24), finalized_before=START + timedelta(days=30))
+        store.extend(
+            "Compute", _hours(START, 48, total=100.0), finalized_before=START + timedelta(days=30)
+        )
+
+        series = store.load("Compute")
+
+        assert series.totals[0] == 1.0
+        assert series.totals[24] == 124.0
+
+    def test_load_from_start_slices_columns(self, store):
+        store.extend("Compute", _hours(START, 48), finalized_before=START + timedelta(days=3))
+
+        series = store.load("Compute", START + timedelta(hours=40))
+
+        assert series.start_time == START + timedelta(hours=40)
+        assert list(series.totals) == [41.0 + h for h in range(8)]
+
+    def test_retention_is_capped(self, store):
+        count = MAX_HISTORY_DAYS * 24 + 10
+        far = START + timedelta(hours=count + 1)
+        store.extend("Compute", _hours(START, count), finalized_before=far)
+
+        series = store.load("Compute")
+
+        assert len(series.totals) == MAX_HISTORY_DAYS * 24
+        assert series.start_time == START + timedelta(hours=10)
+
+    def test_s3_objects_decode_like_local_files(self, store, monkeypatch):
+        store.extend("Compute", _hours(START, 5), finalized_before=START + timedelta(days=1))
+        body = (store.storage.reports_dir / store._object_key("Compute")).read_bytes()
+        monkeypatch.setenv("LOCAL_MODE", "false")
+        s3 = MagicMock()
+        s3.get_object.return_value = {"Body": MagicMock(read=MagicMock(return_value=body))}
+
+        series = HourlyHistoryStore(StorageAdapter(s3, "bucket")).load("Compute")
+
+        assert list(series.totals) == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+
+class TestAnalyzerWithHistory:
+    def test_old_hours_are_served_from_history(self, store):
+        now = datetime.now(UTC)
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        history_start = today - timedelta(days=30)
+        store.extend(
+            "Compute", _hours(history_start, 27 * 24), finalized_before=now - timedelta(hours=48)
+        )
+        stored_end = store.load("Compute").end_time
+
+        ce = MagicMock()
+        ce.get_savings_plans_coverage.return_value = {"SavingsPlansCoverages": []}
+        config = {
+            "lookback_hours": 336,
+            "history_lookback_days": 30,
+            "coverage_shard_days": 0,
+            "enable_compute_sp": True,
+            "enable_database_sp": False,
+            "enable_sagemaker_sp": False,
+        }
+
+        result = SpendingAnalyzer(MagicMock(), ce, history=store).analyze_current_spending(config)
+
+        assert len(result["compute"]["timeseries"]) == 27 * 24
+        hourly_call = ce.get_savings_plans_coverage.call_args_list[-1].kwargs
+        assert hourly_call["TimePeriod"]["Start"] == stored_end.strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -0,0 +1,241 @@
+"""Unit tests for the exact solver, savings-curve engine and result cache in shared.optimal_coverage."""
+
+import random
+from unittest.mock import patch
+
+import pytest
+
+from shared import optimal_coverage
+from shared.optimal_coverage import (
+    CostProfile,
+    calculate_knee_point,
+    calculate_optimal_coverage,
+    calculate_strategies,
+    calculate_strategy_sweep,
+    clear_strategy_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_strategy_cache()
+    yield
+    clear_strategy_cache()
+
+
+def _net_savings(hourly_costs, savings_percentage, coverage):
+    discount_factor = 1 - savings_percentage / 100
+    spillover = sum(max(0.0, cost - coverage) for cost in hourly_costs)
+    return sum(hourly_costs) - coverage * discount_factor * len(hourly_costs) - spillover
+
+
+def _random_costs(seed, count):
+    rng = random.Random(seed)
+    return [round(rng.uniform(20, 120), 2) for _ in range(count)]
+
+
+class TestExactSolver:
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_brute_force_over_breakpoints(self, seed):
+        hourly_costs = _random_costs(seed, 200)
+
+        result = calculate_optimal_coverage(hourly_costs, 30.0, method="exact")
+
+        best = max(_net_savings(hourly_costs, 30.0, c) for c in hourly_costs)
+        assert result["max_net_savings"] == pytest.approx(best)
+        assert result["max_net_savings"] == pytest.approx(
+            _net_savings(hourly_costs, 30.0, result["coverage_hourly"])
+        )
+
+    @pytest.mark.parametrize("savings_percentage", [5.0, 30.0, 60.0, 90.0])
+    def test_never_below_grid_and_within_grid_tolerance(self, savings_percentage):
+        hourly_costs = _random_costs(42, 336)
+
+        grid = calculate_optimal_coverage(hourly_costs, savings_percentage)
+        exact = calculate_optimal_coverage(hourly_costs, savings_percentage, method="exact")
+
+        tolerance = len(hourly_costs) * (max(hourly_costs) - min(hourly_costs)) / 100
+        assert exact["max_net_savings"] >= grid["max_net_savings"] - 1e-9
+        assert exact["max_net_savings"] - grid["max_net_savings"] <= tolerance
+        assert set(exact) == set(grid)
+
+    def test_flat_costs_match_grid(self):
+        grid = calculate_optimal_coverage([50.0] * 24, 30.0)
+        exact = calculate_optimal_coverage([50.0] * 24, 30.0, method="exact")
+
+        assert exact == grid
+
+    def test_ties_keep_lowest_coverage(self):
+        # 50% discount: slope is zero between 10 and 20, so both are optimal
+        result = calculate_optimal_coverage([10.0, 20.0], 50.0, method="exact")
+
+        assert result["coverage_hourly"] == 10.0
+
+    def test_year_of_hours(self):
+        hourly_costs = _random_costs(7, 8760)
+
+        result = calculate_optimal_coverage(hourly_costs, 35.0, method="exact")
+
+        assert min(hourly_costs) <= result["coverage_hourly"] <= max(hourly_costs)
+
+    def test_unknown_method_rejected(self):
+        with pytest.raises(ValueError, match="method"):
+            calculate_optimal_coverage([1.0, 2.0], 30.0, method="newton")
+
+    def test_strategies_accept_exact_method(self):
+        hourly_costs = _random_costs(3, 168)
+
+        strategies = calculate_strategies(hourly_costs, 30.0, method="exact")
+
+        assert strategies["min_hourly"] <= strategies["optimal"] <= strategies["maximum"]
+
+
+class TestSavingsCurve:
+    def test_curve_matches_direct_evaluation(self):
+        hourly_costs = _random_costs(11, 168)
+        profile = CostProfile(hourly_costs)
+
+        curve = profile.curve(0.7, 20.0, 130.0, num_points=50)
+
+        assert len(curve.coverage) == 51
+        assert curve.coverage[0] == 20.0
+        assert curve.coverage[-1] == pytest.approx(130.0)
+        for coverage, net in zip(curve.coverage, curve.net_savings, strict=True):
+            assert net == pytest.approx(_net_savings(hourly_costs, 30.0, coverage))
+        assert curve.savings_percent[10] == pytest.approx(
+            curve.net_savings[10] / sum(hourly_costs) * 100
+        )
+
+    def test_to_dict_returns_plain_lists(self):
+        curve = CostProfile([1.0, 2.0, 3.0]).curve(0.7, 1.0, 3.0, num_points=4)
+
+        data = curve.to_dict()
+
+        assert set(data) == {"coverage", "net_savings", "savings_percent"}
+        assert data["coverage"] == [1.0, 1.5, 2.0, 2.5, 3.0]
+
+    def test_knee_point_with_shared_profile(self):
+        hourly_costs = _random_costs(5, 168)
+        profile = CostProfile(hourly_costs)
+        maximum = calculate_optimal_coverage(hourly_costs, 30.0, profile=profile)["coverage_hourly"]
+
+        shared_profile = calculate_knee_point(
+            hourly_costs, 30.0, min(hourly_costs), maximum, profile
+        )
+
+        assert shared_profile == calculate_knee_point(
+            hourly_costs, 30.0, min(hourly_costs), maximum
+        )
+        assert min(hourly_costs) <= shared_profile <= maximum
+
+
+class TestResultCache:
+    def test_repeated_strategies_are_computed_once(self):
+        hourly_costs = _random_costs(1, 168)
+
+        with patch.object(
+            optimal_coverage, "CostProfile", wraps=optimal_coverage.CostProfile
+        ) as profile:
+            first = calculate_strategies(hourly_costs, 30.0)
+            second = calculate_strategies(list(hourly_costs), 30.0)
+
+        assert profile.call_count == 1
+        assert first == second
+
+    def test_different_inputs_miss(self):
+        hourly_costs = _random_costs(2, 168)
+
+        with patch.object(
+            optimal_coverage, "_grid_optimum", wraps=optimal_coverage._grid_optimum
+        ) as grid:
+            calculate_optimal_coverage(hourly_costs, 30.0)
+            calculate_optimal_coverage(hourly_costs, 35.0)
+            calculate_optimal_coverage([*hourly_costs[:-1], hourly_costs[-1] + 0.01], 30.0)
+            calculate_optimal_coverage(hourly_costs, 30.0)
+
+        assert grid.call_count == 3
+
+    def test_callers_get_independent_copies(self):
+        hourly_costs = _random_costs(3, 168)
+
+        first = calculate_optimal_coverage(hourly_costs, 30.0)
+        first["coverage_hourly"] = -1.0
+
+        assert calculate_optimal_coverage(hourly_costs, 30.0)["coverage_hourly"] > 0
+
+    def test_clear_forgets_results(self):
+        hourly_costs = _random_costs(4, 168)
+        calculate_strategies(hourly_costs, 30.0)
+
+        clear_strategy_cache()
+
+        with patch.object(
+            optimal_coverage, "CostProfile", wraps=optimal_coverage.CostProfile
+        ) as profile:
+            calculate_strategies(hourly_costs, 30.0)
+
+        assert profile.call_count == 1
+
+    def test_errors_are_not_cached(self):
+        with pytest.raises(ValueError):
+            calculate_optimal_coverage([], 30.0)
+        with pytest.raises(ValueError):
+            calculate_optimal_coverage([], 30.0)
+
+
+class TestStrategySweep:
+    @pytest.mark.parametrize("method", ["grid", "exact"])
+    @pytest.mark.parametrize("seed", range(5))
+    def test_rows_match_calculate_strategies(self, seed, method):
+        hourly_costs = _random_costs(seed, 168)
+        # Discounts where N * (1 - discount) is not an integer: no flat optimum
+        savings_percentages = [12.3, 27.3, 31.7, 44.1]
+
+        rows = calculate_strategy_sweep(hourly_costs, savings_percentages, method=method)
+
+        assert [row["savings_percentage"] for row in rows] == savings_percentages
+        for row in rows:
+            expected = calculate_strategies(hourly_costs, row["savings_percentage"], method=method)
+            for key, value in expected.items():
+                assert row[key] == pytest.approx(value)
+
+    def test_maximum_matches_strategies_on_flat_optimum(self):
+        hourly_costs = _random_costs(8, 100)
+        # N * (1 - discount) is an integer: the savings curve has flat stretches
+        savings_percentages = [20, 30, 40, 50]
+
+        rows = calculate_strategy_sweep(hourly_costs, savings_percentages)
+
+        for row in rows:
+            expected = calculate_strategies(hourly_costs, row["savings_percentage"])
+            assert row["maximum"] == expected["maximum"]
+
+    def test_levels_rise_with_discount(self):
+        rows = calculate_strategy_sweep(_random_costs(7, 336))
+
+        maximums = [row["maximum"] for row in rows]
+        assert maximums == sorted(maximums)
+        assert len({row["min_hourly"] for row in rows}) == 1
+
+    def test_flat_costs(self):
+        rows = calculate_strategy_sweep([5.0] * 24, [20, 40])
+
+        assert [row["maximum"] for row in rows] == [5.0, 5.0]
+        assert [row["optimal"] for row in rows] == [5.0, 5.0]
+
+    def test_empty_costs(self):
+        rows = calculate_strategy_sweep([], [30])
+
+        assert rows == [
+            {
+                "savings_percentage": 30,
+                "prudent": 0.0,
+                "min_hourly": 0.0,
+                "optimal": 0.0,
+                "maximum": 0.0,
+            }
+        ]
+
+    def test_invalid_discount_rejected(self):
+        with pytest.raises(ValueError, match="savings_percentage"):
+            calculate_strategy_sweep([1.0, 2.0], [30, 120])
@@ -0,0 +1,175 @@
+"""Unit tests for shared.parameter_sweep."""
+
+import math
+import random
+from array import array
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from shared.hourly_history import HourlyHistoryStore, HourlySeries
+from shared.parameter_sweep import (
+    DEFAULT_GRID,
+    build_parameter_grid,
+    pareto_front,
+    run_parameter_sweep,
+    spend_from_history,
+)
+from shared.storage_adapter import StorageAdapter
+
+
+START = datetime(2026, 1, 5, tzinfo=UTC)
+START_HOUR = int(START.timestamp()) // 3600
+
+SMALL_GRID = {
+    "dynamic_risk_level": ("min_hourly", "optimal"),
+    "split_strategy_type": ("one_shot", "gap_split"),
+    "gap_split_divider": (2.0, 4.0),
+}
+
+
+def _config(**overrides):
+    config = {
+        "target_strategy_type": "dynamic",
+        "split_strategy_type": "one_shot",
+        "dynamic_risk_level": "min_hourly",
+        "prudent_percentage": 85.0,
+        "savings_percentage": 30.0,
+        "fixed_step_percent": 10.0,
+        "gap_split_divider": 2.0,
+        "min_purchase_percent": 1.0,
+        "max_purchase_percent": None,
+        "min_commitment_per_plan": 0.001,
+        "renewal_window_days": 7,
+        "purchase_cooldown_days": 7,
+        "lookback_hours": 336,
+        "enable_compute_sp": True,
+        "enable_database_sp": False,
+        "enable_sagemaker_sp": False,
+        "compute_sp_term": "ONE_YEAR",
+        "compute_sp_payment_option": "NO_UPFRONT",
+        "database_sp_payment_option": "NO_UPFRONT",
+        "sagemaker_sp_payment_option": "NO_UPFRONT",
+    }
+    config.update(overrides)
+    return config
+
+
+def _spend(hours, seed=0):
+    rng = random.Random(seed)
+    return [
+        (30.0 if (h // 24) % 7 < 5 and 8 <= h % 24 < 18 else 10.0) * rng.uniform(0.8, 1.2)
+        for h in range(hours)
+    ]
+
+
+def _row(net_savings, peak):
+    return {"params": {}, "net_savings": net_savings, "peak_unused_commitment": peak}
+
+
+class TestParameterGrid:
+    def test_default_grid_skips_irrelevant_combinations(self):
+        combos = build_parameter_grid()
+
+        # (3 prudent percentages + 2 other risk levels) x (one_shot + 3 steps + 4 dividers)
+        assert len(combos) == 5 * 8
+        assert len({tuple(params.items()) for params in combos}) == len(combos)
+        for params in combos:
+            assert ("prudent_percentage" in params) == (params["dynamic_risk_level"] == "prudent")
+            assert ("fixed_step_percent" in params) == (
+                params["split_strategy_type"] == "fixed_step"
+            )
+            assert ("gap_split_divider" in params) == (params["split_strategy_type"] == "gap_split")
+
+    def test_dependent_parameter_without_its_parent_is_kept(self):
+        combos = build_parameter_grid({"gap_split_divider": (2.0, 3.0)})
+
+        assert combos == [{"gap_split_divider": 2.0}, {"gap_split_divider": 3.0}]
+
+
+class TestParetoFront:
+    def test_keeps_only_non_dominated_results(self):
+        results = [
+            _row(100.0, 5.0),
+            _row(80.0, 2.0),
+            _row(90.0, 6.0),  # dominated by (100, 5)
+            _row(80.0, 3.0),  # dominated by (80, 2)
+            _row(120.0, 9.0),
+            _row(10.0, 0.0),
+        ]
+
+        front = pareto_front(results)
+
+        assert [(row["net_savings"], row["peak_unused_commitment"]) for row in front] == [
+            (10.0, 0.0),
+            (80.0, 2.0),
+            (100.0, 5.0),
+            (120.0, 9.0),
+        ]
+
+
+class TestRunParameterSweep:
+    def test_serial_and_parallel_sweeps_agree(self):
+        spend = {"compute": _spend(336 + 24 * 90)}
+
+        serial = run_parameter_sweep(spend, _config(), SMALL_GRID, workers=1)
+        parallel = run_parameter_sweep(spend, _config(), SMALL_GRID, workers=2)
+
+        assert serial["evaluated"] == 6
+        assert parallel["results"] == serial["results"]
+        assert parallel["pareto_front"] == serial["pareto_front"]
+
+    def test_front_is_drawn_from_results(self):
+        spend = {"compute": _spend(336 + 24 * 90, seed=1)}
+
+        sweep = run_parameter_sweep(spend, _config(target_strategy_type="budget"), workers=1)
+
+        assert sweep["evaluated"] == len(build_parameter_grid(DEFAULT_GRID))
+        assert sweep["grid"]["gap_split_divider"] == list(DEFAULT_GRID["gap_split_divider"])
+        assert sweep["pareto_front"]
+        for row in sweep["pareto_front"]:
+            assert row in sweep["results"]
+            assert not any(
+                other["net_savings"] > row["net_savings"]
+                and other["peak_unused_commitment"] <= row["peak_unused_commitment"]
+                for other in sweep["results"]
+            )
+
+    def test_short_history_raises(self):
+        with pytest.raises(ValueError, match="lookback window"):
+            run_parameter_sweep({"compute": [1.0] * 100}, _config(), SMALL_GRID, workers=1)
+
+
+class TestSpendFromHistory:
+    @pytest.fixture
+    def store(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("LOCAL_MODE", "true")
+        monkeypatch.setenv("LOCAL_DATA_DIR", str(tmp_path))
+        return HourlyHistoryStore(StorageAdapter())
+
+    def _save(self, store, sp_type, offset, totals):
+        series = HourlySeries(
+            START_HOUR + offset, array("d", totals), array("d", [0.0] * len(totals))
+        )
+        store.save(sp_type, series)
+
+    def test_aligns_enabled_types_on_common_hours(self, store):
+        self._save(store, "Compute", 0, [1.0, 2.0, math.nan, 4.0, 5.0])
+        self._save(store, "Database", 2, [7.0, 8.0, 9.0, 10.0])
+        self._save(store, "SageMaker", 0, [3.0] * 5)
+
+        spend, start = spend_from_history(store, _config(enable_database_sp=True))
+
+        assert spend == {"compute": [0.0, 4.0, 5.0], "database": [7.0, 8.0, 9.0]}
+        assert start == START + timedelta(hours=2)
+
+    def test_days_keeps_recent_hours(self, store):
+        self._save(store, "Compute", 0, [float(h) for h in range(24 * 3)])
+
+        spend, start = spend_from_history(store, _config(), days=1)
+
+        assert spend["compute"] == [float(h) for h in range(48, 72)]
+        assert start == START + timedelta(days=2)
+
+    def test_no_history(self, store):
+        assert spend_from_history(store, _config()) == ({}, None)
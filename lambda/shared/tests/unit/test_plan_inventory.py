@@ -0,0 +1,93 @@
+"""Unit tests for shared.plan_inventory."""
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from shared.follow_static_strategy import _get_current_commitments
+from shared.plan_inventory import (
+    PlanInventory,
+    get_plan_inventory,
+    reset_plan_inventories,
+)
+from shared.savings_plans_metrics import get_active_savings_plans
+
+
+def _plan(plan_id, plan_type="Compute", commitment="1.0", end="2027-01-01T00:00:00Z"):
+    return {
+        "savingsPlanId": plan_id,
+        "savingsPlanArn": f"arn:aws:savingsplans::123:savingsplan/{plan_id}",
+        "savingsPlanType": plan_type,
+        "commitment": commitment,
+        "start": "2024-01-01T00:00:00Z",
+        "end": end,
+    }
+
+
+def _paged_client(pages):
+    client = MagicMock()
+    responses = []
+    for i, plans in enumerate(pages):
+        response = {"savingsPlans": plans}
+        if i < len(pages) - 1:
+            response["nextToken"] = f"token-{i + 1}"
+        responses.append(response)
+    client.describe_savings_plans.side_effect = responses
+    return client
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    reset_plan_inventories()
+    yield
+    reset_plan_inventories()
+
+
+class TestPlanInventory:
+    def test_fetch_follows_next_token(self):
+        client = _paged_client([[_plan("a")], [_plan("b")], [_plan("c")]])
+
+        inventory = PlanInventory.fetch(client)
+
+        assert [p["savingsPlanId"] for p in inventory.plans] == ["a", "b", "c"]
+        calls = client.describe_savings_plans.call_args_list
+        assert "nextToken" not in calls[0].kwargs
+        assert calls[2].kwargs["nextToken"] == "token-2"
+        assert all(c.kwargs["states"] == ["active"] for c in calls)
+
+    def test_indexes_by_type_arn_and_end_date(self):
+        inventory = PlanInventory(
+            [
+                _plan("late", end="2028-01-01T00:00:00Z"),
+                _plan("db", plan_type="Database", commitment="0.5", end="2026-02-01T00:00:00Z"),
+                _plan("soon", commitment="2.0", end="2026-01-15T00:00:00Z"),
+                _plan("undated", end=""),
+            ]
+        )
+
+        assert set(inventory.by_type) == {"Compute", "Database"}
+        assert inventory.by_arn["arn:aws:savingsplans::123:savingsplan/db"]["savingsPlanId"] == "db"
+        expiring = inventory.ladder.expiring_before(datetime(2026, 2, 1, tzinfo=UTC))
+        assert [p["savingsPlanId"] for p in expiring] == ["soon", "db"]
+        assert inventory.commitment_by_type() == {"Compute": 4.0, "Database": 0.5}
+
+    def test_callers_share_one_listing_per_run(self):
+        client = MagicMock()
+        client.describe_savings_plans.return_value = {"savingsPlans": [_plan("a")]}
+
+        get_active_savings_plans(client)
+        _get_current_commitments(client)
+
+        assert client.describe_savings_plans.call_count == 1
+        assert get_plan_inventory(client) is get_plan_inventory(client)
+
+    def test_reset_lists_plans_again(self):
+        client = MagicMock()
+        client.describe_savings_plans.return_value = {"savingsPlans": []}
+        get_plan_inventory(client)
+
+        reset_plan_inventories()
+        get_plan_inventory(client)
+
+        assert client.describe_savings_plans.call_count == 2
@@ -0,0 +1,174 @@
+"""Unit tests for shared.plan_ladder."""
+
+import random
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from shared.plan_ladder import PlanLadder, parse_plan_date
+
+
+NOW = datetime(2026, 4, 1, tzinfo=UTC)
+TYPES = ("Compute", "Database", "SageMaker")
+
+
+def _plan(plan_id, plan_type="Compute", commitment=1.0, start=None, end=None):
+    return {
+        "savingsPlanId": plan_id,
+        "savingsPlanType": plan_type,
+        "commitment": str(commitment),
+        "start": start.isoformat() if isinstance(start, datetime) else start,
+        "end": end.isoformat() if isinstance(end, datetime) else end,
+    }
+
+
+def _random_plans(count, seed=0):
+    rng = random.Random(seed)
+    plans = []
+    for i in range(count):
+        start = NOW - timedelta(days=rng.randint(0, 3 * 365))
+        term = rng.choice((365, 3 * 365))
+        plans.append(
+            _plan(
+                f"sp-{i}",
+                rng.choice(TYPES),
+                round(rng.uniform(0.1, 5.0), 3),
+                start,
+                start + timedelta(days=term),
+            )
+        )
+    return plans
+
+
+class TestParsePlanDate:
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("2026-06-01T00:00:00Z", datetime(2026, 6, 1, tzinfo=UTC)),
+            ("2026-06-01T00:00:00.377+00:00", datetime(2026, 6, 1, 0, 0, 0, 377000, tzinfo=UTC)),
+            ("2026-06-01", datetime(2026, 6, 1, tzinfo=UTC)),
+            (
+                datetime(2026, 6, 1, tzinfo=UTC).replace(tzinfo=None),
+                datetime(2026, 6, 1, tzinfo=UTC),
+            ),
+            ("Unknown", None),
+            ("", None),
+            (None, None),
+        ],
+    )
+    def test_formats(self, value, expected):
+        assert parse_plan_date(value) == expected
+
+
+class TestPlanLadder:
+    def test_expiring_queries_by_type(self):
+        ladder = PlanLadder(
+            [
+                _plan("late", end=NOW + timedelta(days=400)),
+                _plan("db", "Database", 0.5, end=NOW + timedelta(days=20)),
+                _plan("soon", commitment=2.0, end=NOW + timedelta(days=5)),
+                _plan("gone", end=NOW - timedelta(days=1)),
+                _plan("undated", end="Unknown"),
+            ]
+        )
+
+        assert [p["savingsPlanId"] for p in ladder.expiring_within(30, NOW)] == ["soon", "db"]
+        assert [p["savingsPlanId"] for p in ladder.expiring_within(30, NOW, "Compute")] == ["soon"]
+        assert ladder.expiring_within(30, NOW, "EC2Instance") == []
+        assert [p["savingsPlanId"] for p in ladder.expiring_before(NOW)] == ["gone"]
+        assert ladder.expiring_commitment(NOW, NOW + timedelta(days=30)) == pytest.approx(2.5)
+        end, plan = ladder.next_expiring("Compute")
+        assert (end, plan["savingsPlanId"]) == (NOW - timedelta(days=1), "gone")
+        assert ladder.next_expiring("Database")[1]["savingsPlanId"] == "db"
+        assert ladder.next_expiring("SageMaker") is None
+
+    def test_purchased_within(self):
+        ladder = PlanLadder(
+            [
+                _plan("old", start=NOW - timedelta(days=30)),
+                _plan("new", "SageMaker", start=NOW - timedelta(days=2)),
+                _plan("edge", start=NOW - timedelta(days=7)),
+                _plan("unknown", start="Unknown"),
+            ]
+        )
+
+        assert [p["savingsPlanId"] for p in ladder.purchased_within(7, NOW)] == ["edge", "new"]
+        assert [p["savingsPlanId"] for p in ladder.purchased_within(7, NOW, "SageMaker")] == ["new"]
+
+    def test_commitment_at(self):
+        ladder = PlanLadder(
+            [
+                _plan("a", commitment=1.0, start=NOW, end=NOW + timedelta(days=10)),
+                _plan("b", commitment=2.0, start=NOW + timedelta(days=5)),
+                _plan("c", commitment=4.0, end=NOW + timedelta(days=1)),
+            ]
+        )
+
+        assert ladder.commitment_at(NOW - timedelta(days=1)) == pytest.approx(4.0)
+        assert ladder.commitment_at(NOW) == pytest.approx(5.0)
+        assert ladder.commitment_at(NOW + timedelta(days=1)) == pytest.approx(1.0)
+        assert ladder.commitment_at(NOW + timedelta(days=5)) == pytest.approx(3.0)
+        assert ladder.commitment_at(NOW + timedelta(days=10)) == pytest.approx(2.0)
+
+    def test_plan_details_fields(self):
+        ladder = PlanLadder.from_plan_details(
+            [
+                {
+                    "plan_id": "x",
+                    "plan_type": "Compute",
+                    "hourly_commitment": 1.5,
+                    "start_date": "2026-03-30T00:00:00Z",
+                    "end_date": "2026-05-01",
+                }
+            ]
+        )
+
+        assert ladder.plan_types == ["Compute"]
+        assert ladder.next_expiring()[0] == datetime(2026, 5, 1, tzinfo=UTC)
+        assert ladder.commitment_at(NOW, "Compute") == pytest.approx(1.5)
+        assert len(ladder.purchased_within(7, NOW)) == 1
+
+    def test_naive_plan_dates_are_utc(self):
+        ladder = PlanLadder(
+            [
+                _plan(
+                    "naive",
+                    commitment=2.0,
+                    start=(NOW - timedelta(days=10)).replace(tzinfo=None),
+                    end=(NOW + timedelta(days=3)).replace(tzinfo=None),
+                )
+            ]
+        )
+
+        assert ladder.commitment_at(NOW) == pytest.approx(2.0)
+        assert ladder.expiring_commitment(NOW, NOW + timedelta(days=7)) == pytest.approx(2.0)
+
+    def test_matches_brute_force(self):
+        plans = _random_plans(3000)
+        ladder = PlanLadder(plans)
+
+        for offset in (-400, -30, 0, 7, 90, 800):
+            moment = NOW + timedelta(days=offset)
+            horizon = moment + timedelta(days=30)
+            for plan_type in TYPES:
+                typed = [p for p in plans if p["savingsPlanType"] == plan_type]
+                expiring = sorted(
+                    (p for p in typed if moment < parse_plan_date(p["end"]) <= horizon),
+                    key=lambda p: parse_plan_date(p["end"]),
+                )
+                assert ladder.expiring_between(moment, horizon, plan_type) == expiring
+                recent = {
+                    p["savingsPlanId"] for p in typed if parse_plan_date(p["start"]) >= moment
+                }
+                assert {p["savingsPlanId"] for p in ladder.purchased_since(moment, plan_type)} == (
+                    recent
+                )
+                active = sum(
+                    float(p["commitment"])
+                    for p in typed
+                    if parse_plan_date(p["start"]) <= moment < parse_plan_date(p["end"])
+                )
+                assert ladder.commitment_at(moment, plan_type) == pytest.approx(active)
+                assert ladder.expiring_commitment(moment, horizon, plan_type) == pytest.approx(
+                    sum(float(p["commitment"]) for p in expiring)
+                )
@@ -0,0 +1,100 @@
+"""Unit tests for shared.plan_lifecycle."""
+
+import pytest
+
+from shared.plan_lifecycle import (
+    DAYS_PER_YEAR,
+    monthly_purchase_days,
+    simulate_gap_split_lifecycle,
+)
+
+
+def _daily_reference(purchase_days, term_days, divider, min_purchase_pct, renewal_window_days):
+    """Day-by-day simulation that re-sums every active plan (the former chart loop)."""
+    runs = set(purchase_days)
+    plans = []
+    active = []
+    coverages = {}
+    for day in range(min(runs), max(runs) + term_days + 1):
+        active = [p for p in active if p[2] > day]
+        if day in runs:
+            effective = sum(p[0] for p in active if p[2] > day + renewal_window_days)
+            gap = 100.0 - effective
+            if gap > 0.001:
+                purchase = max(gap / divider, min_purchase_pct)
+                if gap < min_purchase_pct:
+                    purchase = gap
+                plan = (purchase, day, day + term_days)
+                active.append(plan)
+                plans.append(plan)
+        coverages[day] = sum(p[0] for p in active)
+    return plans, coverages
+
+
+class TestSimulateGapSplitLifecycle:
+    @pytest.mark.parametrize(
+        ("divider", "term_years", "min_purchase_pct", "renewal_window_days"),
+        [(2.0, 1, 100.0 / 12, 7), (3.0, 3, 1.0, 7), (1.5, 1, 0.5, 0), (4.0, 1, 5.0, 45)],
+    )
+    def test_matches_daily_simulation(
+        self, divider, term_years, min_purchase_pct, renewal_window_days
+    ):
+        purchase_days = monthly_purchase_days(4)
+        term_days = term_years * DAYS_PER_YEAR
+
+        lifecycle = simulate_gap_split_lifecycle(
+            purchase_days,
+            term_days=term_days,
+            divider=divider,
+            min_purchase_pct=min_purchase_pct,
+            renewal_window_days=renewal_window_days,
+        )
+        plans, coverages = _daily_reference(
+            purchase_days, term_days, divider, min_purchase_pct, renewal_window_days
+        )
+
+        assert len(lifecycle.plans) == len(plans)
+        for plan, (coverage_pct, start_day, end_day) in zip(lifecycle.plans, plans, strict=True):
+            assert (plan.start_day, plan.end_day) == (start_day, end_day)
+            assert plan.coverage_pct == pytest.approx(coverage_pct)
+        sampled = lifecycle.sample(sorted(coverages))["coverage"]
+        assert sampled == pytest.approx([coverages[day] for day in sorted(coverages)])
+
+    def test_first_run_buys_gap_over_divider_and_coverage_returns_to_zero(self):
+        lifecycle = simulate_gap_split_lifecycle([0, 30], term_days=365, divider=2.0)
+
+        assert [plan.coverage_pct for plan in lifecycle.plans] == [50.0, 25.0]
+        assert lifecycle.coverage_at(-1) == 0.0
+        assert lifecycle.coverage_at(0) == 50.0
+        assert lifecycle.coverage_at(364) == 75.0
+        assert lifecycle.coverage_at(365) == 25.0
+        assert lifecycle.coverage_at(395) == 0.0
+
+    def test_max_purchase_caps_each_plan(self):
+        lifecycle = simulate_gap_split_lifecycle(
+            monthly_purchase_days(1), term_days=365, divider=1.0, max_purchase_pct=20.0
+        )
+
+        assert max(plan.coverage_pct for plan in lifecycle.plans) == 20.0
+        assert lifecycle.coverage_at(120) == pytest.approx(100.0)
+
+    def test_sample_series(self):
+        lifecycle = simulate_gap_split_lifecycle([0, 10], term_days=100, divider=2.0)
+
+        series = lifecycle.sample([0, 10, 99, 100, 110])
+
+        assert series["active_plans"] == [1, 2, 2, 1, 0]
+        assert series["largest_plan"] == [50.0, 50.0, 50.0, 25.0, 0.0]
+        assert series["days_to_next_expiry"] == [100, 90, 1, 10, 0]
+
+    def test_daily_runs_over_a_long_horizon(self):
+        purchase_days = list(range(50 * DAYS_PER_YEAR))
+
+        lifecycle = simulate_gap_split_lifecycle(
+            purchase_days, term_days=3 * DAYS_PER_YEAR, divider=2.0, min_purchase_pct=0.01
+        )
+        series = lifecycle.sample(purchase_days)
+
+        assert len(lifecycle.plans) > 500
+        # Renewals bought inside the window keep coverage at or above target
+        assert min(series["coverage"][30:]) >= 99.9
@@ -0,0 +1,82 @@
+"""Unit tests for shared.quantile_sketch."""
+
+import random
+from bisect import bisect_left
+
+import pytest
+
+from shared.quantile_sketch import QuantileSketch
+
+
+def _rank(sorted_values, value):
+    return bisect_left(sorted_values, value) / len(sorted_values)
+
+
+def _lognormal(seed, count):
+    rng = random.Random(seed)
+    return [rng.lognormvariate(3, 0.6) for _ in range(count)]
+
+
+class TestQuantileSketch:
+    def test_exact_below_k(self):
+        values = _lognormal(0, 336)
+        ordered = sorted(values)
+
+        sketch = QuantileSketch.from_values(values)
+
+        for q in (0.0, 0.5, 0.75, 0.9, 0.95):
+            assert sketch.quantile(q) == ordered[int(len(ordered) * q)]
+        assert sketch.min == ordered[0]
+        assert sketch.max == ordered[-1]
+        assert sketch.quantile(1.0) == ordered[-1]
+
+    def test_long_streams_stay_small_and_accurate(self):
+        values = _lognormal(1, 50_000)
+        ordered = sorted(values)
+
+        sketch = QuantileSketch.from_values(values, k=200, seed=7)
+
+        assert sum(len(level) for level in sketch._levels) < 3 * 200
+        assert sketch.count == 50_000
+        assert sketch.min == ordered[0]
+        for q in (0.1, 0.5, 0.9, 0.95):
+            assert _rank(ordered, sketch.quantile(q)) == pytest.approx(q, abs=0.02)
+
+    def test_merge_matches_pooled_stream(self):
+        compute = _lognormal(2, 20_000)
+        database = [v / 4 for v in _lognormal(3, 20_000)]
+        pooled = sorted(compute + database)
+
+        merged = QuantileSketch.from_values(compute, k=200, seed=1)
+        other = QuantileSketch.from_values(database, k=200, seed=2)
+        merged.merge(other)
+
+        assert merged.count == len(pooled)
+        assert merged.min == pooled[0]
+        assert merged.max == pooled[-1]
+        for q in (0.25, 0.5, 0.9):
+            assert _rank(pooled, merged.quantile(q)) == pytest.approx(q, abs=0.02)
+        assert other.count == 20_000
+
+    def test_dict_round_trip(self):
+        sketch = QuantileSketch.from_values(_lognormal(4, 5_000), k=64, seed=3)
+
+        restored = QuantileSketch.from_dict(sketch.to_dict())
+
+        assert restored.count == sketch.count
+        assert restored.quantiles((0.5, 0.9)) == sketch.quantiles((0.5, 0.9))
+
+    def test_empty_sketch(self):
+        sketch = QuantileSketch()
+
+        assert len(sketch) == 0
+        with pytest.raises(ValueError, match="empty"):
+            sketch.quantile(0.5)
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError, match="k must"):
+            QuantileSketch(k=2)
+        with pytest.raises(ValueError, match="cannot merge"):
+            QuantileSketch(k=16).merge(QuantileSketch(k=32))
+        with pytest.raises(ValueError, match="q must"):
+            QuantileSketch.from_values([1.0]).quantile(1.5)
@@ -0,0 +1,111 @@
+"""Unit tests for shared.risk_simulation."""
+
+import random
+
+import pytest
+
+from shared.risk_simulation import (
+    lookback_seed,
+    simulate_commitment_risk,
+    simulate_spending_risk,
+    simulate_strategy_risk,
+)
+
+
+def _office_hours(weeks, seed=0):
+    rng = random.Random(seed)
+    return [
+        (30.0 if (h // 24) % 7 < 5 and 8 <= h % 24 < 18 else 10.0) * rng.uniform(0.8, 1.2)
+        for h in range(weeks * 168)
+    ]
+
+
+class TestCommitmentRisk:
+    def test_level_below_every_hour_never_loses(self):
+        costs = _office_hours(2)
+
+        result = simulate_commitment_risk(costs, {"safe": 5.0}, 30.0, paths=200, seed=1)
+
+        safe = result["safe"]
+        assert safe["probability_of_loss"] == 0.0
+        assert safe["expected_utilization"] == pytest.approx(1.0)
+        assert safe["expected_savings"] == pytest.approx(5.0 * 0.3)
+
+    def test_level_above_every_hour_always_loses(self):
+        costs = _office_hours(2)
+
+        result = simulate_commitment_risk(costs, {"oversized": 100.0}, 30.0, paths=200, seed=1)
+
+        assert result["oversized"]["probability_of_loss"] == 1.0
+        assert result["oversized"]["savings_p95"] < 0
+
+    def test_distribution_is_ordered(self):
+        costs = _office_hours(4)
+
+        result = simulate_commitment_risk(costs, {"mid": 20.0}, 30.0, paths=300, seed=2)
+
+        mid = result["mid"]
+        assert mid["savings_p5"] <= mid["savings_p50"] <= mid["savings_p95"]
+        assert 0 < mid["expected_utilization"] < 1
+
+    def test_process_pool_matches_serial(self):
+        costs = _office_hours(3)
+        levels = {"low": 9.0, "high": 25.0}
+
+        serial = simulate_commitment_risk(costs, levels, 30.0, paths=600, seed=3, workers=1)
+        pooled = simulate_commitment_risk(costs, levels, 30.0, paths=600, seed=3, workers=2)
+
+        assert pooled == serial
+
+    def test_short_history_uses_whole_series(self):
+        result = simulate_commitment_risk([1.0, 2.0, 3.0], {"one": 1.0}, 30.0, paths=10, seed=0)
+
+        assert result["one"]["probability_of_loss"] == 0.0
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError, match="without hourly costs"):
+            simulate_commitment_risk([], {"a": 1.0}, 30.0)
+        with pytest.raises(ValueError, match="must be positive"):
+            simulate_commitment_risk([1.0], {"a": 1.0}, 30.0, paths=0)
+
+
+class TestStrategyRisk:
+    def test_higher_levels_carry_more_risk(self):
+        costs = _office_hours(2)
+
+        result = simulate_strategy_risk(costs, 30.0, paths=300, seed=4)
+
+        losses = [result[name]["probability_of_loss"] for name in result]
+        assert list(result) == ["prudent", "min_hourly", "optimal", "maximum"]
+        assert losses == sorted(losses)
+        assert result["prudent"]["probability_of_loss"] == 0.0
+
+    def test_spending_risk_skips_types_without_usage(self):
+        spending = {
+            "compute": {"timeseries": [{"total": cost} for cost in _office_hours(2)]},
+            "database": {"timeseries": [{"total": 0.0}] * 48},
+        }
+        config = {"savings_percentage": 30.0, "compute_savings_percentage": 40.0}
+
+        risk = simulate_spending_risk(spending, config, paths=50, seed=5)
+
+        assert list(risk) == ["compute"]
+        assert simulate_spending_risk(None, config) == {}
+        assert simulate_spending_risk(spending, config, []) == {}
+
+    def test_lookback_seed_follows_lookback_end(self):
+        def spending(last_hour):
+            return {
+                "compute": {
+                    "timeseries": [
+                        {"timestamp": "2026-01-20T00:00:00Z", "total": 1.0},
+                        {"timestamp": last_hour, "total": 1.0},
+                    ]
+                }
+            }
+
+        seed = lookback_seed(spending("2026-01-20T01:00:00Z"))
+
+        assert lookback_seed(spending("2026-01-20T01:00:00Z")) == seed
+        assert lookback_seed(spending("2026-01-21T01:00:00Z")) != seed
+        assert lookback_seed(None) == lookback_seed({})
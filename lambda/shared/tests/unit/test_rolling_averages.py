@@ -0,0 +1,97 @@
+"""Unit tests for shared.rolling_averages."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from shared.rolling_averages import RollingAverages
+from shared.spending_analyzer import SpendingAnalyzer
+
+
+END = datetime(2026, 3, 31, tzinfo=UTC)
+
+
+def _daily_item(day_end, total):
+    return {
+        "TimePeriod": {
+            "Start": (day_end - timedelta(days=1)).strftime("%Y-%m-%d"),
+            "End": day_end.strftime("%Y-%m-%d"),
+        },
+        "Coverage": {"SpendCoveredBySavingsPlans": "0", "TotalCost": str(total)},
+    }
+
+
+def _series(totals):
+    """Daily points ending at END, oldest first."""
+    count = len(totals)
+    return {
+        "compute": {
+            "timeseries": [
+                {
+                    "timestamp": (END - timedelta(days=count - 1 - i)).strftime("%Y-%m-%d"),
+                    "total": total,
+                }
+                for i, total in enumerate(totals)
+            ]
+        }
+    }
+
+
+class TestRollingAverages:
+    def test_window_averages_from_prefix_sums(self):
+        stats = RollingAverages(_series([1.0] * 76 + [3.0] * 14), 90, END)
+
+        result = stats.window_averages([90, 14, 1])
+
+        assert result[14]["compute"] == 3.0
+        assert result[1]["compute"] == 3.0
+        assert result[90]["compute"] == pytest.approx((76 + 42) / 90)
+
+    def test_missing_days_are_not_counted(self):
+        data = _series([2.0, 4.0])
+
+        assert RollingAverages(data, 30, END).average("compute", 30) == 3.0
+
+    def test_unknown_type_and_empty_window_are_zero(self):
+        stats = RollingAverages(_series([5.0]), 30, END + timedelta(days=10))
+
+        assert stats.average("compute", 5) == 0.0
+        assert stats.average("database", 5) == 0.0
+
+    def test_window_longer_than_series_is_rejected(self):
+        stats = RollingAverages(_series([1.0]), 14, END)
+
+        assert not stats.covers(90)
+        with pytest.raises(ValueError, match="exceeds"):
+            stats.average("compute", 90)
+
+    def test_matches_per_window_analyzer_summary(self):
+        now = datetime.now(UTC)
+        analyzer_end = (now - timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        items = [_daily_item(analyzer_end - timedelta(days=d), 10.0 + d % 7) for d in range(60)]
+        ce = MagicMock()
+
+        def coverage(**params):
+            start, end = params["TimePeriod"]["Start"], params["TimePeriod"]["End"]
+            return {
+                "SavingsPlansCoverages": [
+                    i for i in items if start <= i["TimePeriod"]["Start"] < end
+                ]
+            }
+
+        ce.get_savings_plans_coverage.side_effect = coverage
+        config = {
+            "enable_compute_sp": True,
+            "enable_database_sp": False,
+            "enable_sagemaker_sp": False,
+        }
+        analyzer = SpendingAnalyzer(MagicMock(), ce)
+
+        full = analyzer.analyze_daily_spending({**config, "lookback_days": 60})
+        stats = RollingAverages.from_daily_spending(full, 60, now)
+        direct = analyzer.analyze_daily_spending({**config, "lookback_days": 14})
+
+        assert stats.average("compute", 14) == pytest.approx(
+            direct["compute"]["summary"]["avg_hourly_total"]
+        )
@@ -0,0 +1,330 @@
+"""Unit tests for shared.spending_analyzer.
+
+Covers the paginated Cost Explorer fetch layer: every NextToken page must reach
+group_coverage_by_sp_type, for hourly, daily and service-validation calls, and
+concurrent per-SP-type and per-time-shard fetches must merge deterministically.
+"""
+
+import threading
+from datetime import UTC, datetime
+from itertools import pairwise
+from unittest.mock import MagicMock
+
+from shared.spending_analyzer import (
+    COMPUTE_SP_SERVICES,
+    DATABASE_SP_SERVICES,
+    SAGEMAKER_SP_SERVICES,
+    SpendingAnalyzer,
+    build_time_shards,
+    paginate_coverage,
+)
+
+
+CONFIG = {
+    "lookback_hours": 48,
+    "coverage_shard_days": 0,
+    "lookback_days": 30,
+    "enable_compute_sp": True,
+    "enable_database_sp": False,
+    "enable_sagemaker_sp": False,
+}
+
+
+def _item(end, total, covered=0.0, service=None):
+    item = {
+        "TimePeriod": {"Start": end, "End": end},
+        "Coverage": {
+            "SpendCoveredBySavingsPlans": str(covered),
+            "TotalCost": str(total),
+        },
+    }
+    if service:
+        item["Attributes"] = {"SERVICE": service}
+    return item
+
+
+def _paged_ce(pages):
+    """CE mock returning `pages` in order, chaining them with NextToken."""
+    responses = []
+    for i, items in enumerate(pages):
+        response = {"SavingsPlansCoverages": items}
+        if i < len(pages) - 1:
+            response["NextToken"] = f"token-{i + 1}"
+        responses.append(response)
+    ce = MagicMock()
+    ce.get_savings_plans_coverage.side_effect = responses
+    return ce
+
+
+class TestPaginateCoverage:
+    def test_follows_next_token_until_exhausted(self):
+        ce = _paged_ce([[_item("a", 1.0)], [_item("b", 2.0)], [_item("c", 3.0)]])
+
+        pages = list(paginate_coverage(ce, {"Granularity": "HOURLY"}))
+
+        assert [len(p) for p in pages] == [1, 1, 1]
+        calls = ce.get_savings_plans_coverage.call_args_list
+        assert "NextToken" not in calls[0].kwargs
+        assert calls[1].kwargs["NextToken"] == "token-1"
+        assert calls[2].kwargs["NextToken"] == "token-2"
+        assert all(c.kwargs["Granularity"] == "HOURLY" for c in calls)
+
+    def test_single_page_makes_one_call(self):
+        ce = _paged_ce([[_item("a", 1.0)]])
+
+        assert len(list(paginate_coverage(ce, {}))) == 1
+        assert ce.get_savings_plans_coverage.call_count == 1
+
+    def test_pages_are_fetched_lazily(self):
+        ce = _paged_ce([[_item("a", 1.0)], [_item("b", 2.0)]])
+
+        pages = paginate_coverage(ce, {})
+        next(pages)
+
+        assert ce.get_savings_plans_coverage.call_count == 1
+
+
+class TestAnalyzerPagination:
+    def test_hourly_series_includes_every_page(self):
+        ce = MagicMock()
+        ce.get_savings_plans_coverage.side_effect = [
+            # _validate_service_constants (single page)
+            {"SavingsPlansCoverages": []},
+            # _fetch_coverage_data (two pages)
+            {
+                "SavingsPlansCoverages": [_item("2026-01-01T01:00:00Z", 10.0, 5.0)],
+                "NextToken": "more",
+            },
+            {"SavingsPlansCoverages": [_item("2026-01-01T02:00:00Z", 20.0, 5.0)]},
+        ]
+
+        result = SpendingAnalyzer(MagicMock(), ce).analyze_current_spending(CONFIG)
+
+        timeseries = result["compute"]["timeseries"]
+        assert [p["total"] for p in timeseries] == [10.0, 20.0]
+        assert result["compute"]["summary"]["avg_hourly_total"] == 15.0
+
+    def test_daily_series_includes_every_page(self):
+        ce = _paged_ce([[_item("2026-01-01", 100.0)], [_item("2026-01-02", 300.0)]])
+
+        result = SpendingAnalyzer(MagicMock(), ce).analyze_daily_spending(CONFIG)
+
+        assert len(result["compute"]["timeseries"]) == 2
+        assert result["compute"]["summary"]["max_hourly_total"] == 300.0
+
+    def test_unknown_services_found_on_later_pages(self):
+        ce = MagicMock()
+        ce.get_savings_plans_coverage.side_effect = [
+            {
+                "SavingsPlansCoverages": [_item("t1", 1.0, service="AWS Lambda")],
+                "NextToken": "more",
+            },
+            {"SavingsPlansCoverages": [_item("t2", 1.0, service="Amazon Brand New Service")]},
+            {"SavingsPlansCoverages": []},
+        ]
+
+        result = SpendingAnalyzer(MagicMock(), ce).analyze_current_spending(CONFIG)
+
+        assert result["_unknown_services"] == ["Amazon Brand New Service"]
+
+
+ALL_TYPES_CONFIG = {
+    **CONFIG,
+    "enable_database_sp": True,
+    "enable_sagemaker_sp": True,
+}
+
+TOTALS_BY_SERVICES = {
+    tuple(COMPUTE_SP_SERVICES): 10.0,
+    tuple(DATABASE_SP_SERVICES): 20.0,
+    tuple(SAGEMAKER_SP_SERVICES): 30.0,
+}
+
+
+def _ce_by_filter(barrier=None):
+    """CE mock answering each service-filtered call with that type's totals.
+
+    Unfiltered calls (service validation) return an empty page. When a barrier
+    is given, filtered calls block on it, so the test only completes if all
+    per-type requests are in flight at the same time.
+    """
+
+    def respond(**params):
+        if "Filter" not in params:
+            return {"SavingsPlansCoverages": []}
+        if barrier is not None:
+            barrier.wait(timeout=5)
+        total = TOTALS_BY_SERVICES[tuple(params["Filter"]["Dimensions"]["Values"])]
+        return {"SavingsPlansCoverages": [_item("2026-01-01T01:00:00Z", total)]}
+
+    ce = MagicMock()
+    ce.get_savings_plans_coverage.side_effect = respond
+    return ce
+
+
+class TestConcurrentFetch:
+    def test_per_type_requests_run_concurrently(self):
+        ce = _ce_by_filter(barrier=threading.Barrier(3))
+
+        result = SpendingAnalyzer(MagicMock(), ce).analyze_current_spending(ALL_TYPES_CONFIG)
+
+        assert result["compute"]["summary"]["avg_hourly_total"] == 10.0
+        assert result["database"]["summary"]["avg_hourly_total"] == 20.0
+        assert result["sagemaker"]["summary"]["avg_hourly_total"] == 30.0
+
+    def test_daily_results_match_sequential_fetch(self):
+        parallel = SpendingAnalyzer(MagicMock(), _ce_by_filter()).analyze_daily_spending(
+            ALL_TYPES_CONFIG
+        )
+        sequential = SpendingAnalyzer(
+            MagicMock(), _ce_by_filter(), max_workers=1
+        ).analyze_daily_spending(ALL_TYPES_CONFIG)
+
+        assert parallel == sequential
+        assert list(parallel) == ["compute", "database", "sagemaker"]
+
+    def test_single_worker_issues_calls_in_type_order(self):
+        ce = _ce_by_filter()
+
+        SpendingAnalyzer(MagicMock(), ce, max_workers=1).analyze_daily_spending(ALL_TYPES_CONFIG)
+
+        filters = [
+            c.kwargs["Filter"]["Dimensions"]["Values"]
+            for c in ce.get_savings_plans_coverage.call_args_list
+        ]
+        assert filters == [COMPUTE_SP_SERVICES, DATABASE_SP_SERVICES, SAGEMAKER_SP_SERVICES]
+
+
+class TestBuildTimeShards:
+    def test_half_open_windows_cover_range(self):
+        start = datetime(2026, 1, 1, tzinfo=UTC)
+        end = datetime(2026, 1, 15, tzinfo=UTC)
+
+        shards = build_time_shards(start, end, 4)
+
+        assert shards[0][0] == start
+        assert shards[-1][1] == end
+        assert [(b - a).days for a, b in shards] == [4, 4, 4, 2]
+        assert all(prev[1] == cur[0] for prev, cur in pairwise(shards))
+
+    def test_zero_disables_sharding(self):
+        start = datetime(2026, 1, 1, tzinfo=UTC)
+        end = datetime(2026, 1, 15, tzinfo=UTC)
+
+        assert build_time_shards(start, end, 0) == [(start, end)]
+
+
+class TestShardedHourlyFetch:
+    def test_shards_are_stitched_into_one_timeseries(self):
+        def respond(**params):
+            if "Filter" not in params:
+                return {"SavingsPlansCoverages": []}
+            start = params["TimePeriod"]["Start"]
+            return {"SavingsPlansCoverages": [_item(start, float(start[8:10]))]}
+
+        ce = MagicMock()
+        ce.get_savings_plans_coverage.side_effect = respond
+        config = {**CONFIG, "lookback_hours": 96, "coverage_shard_days": 1}
+
+        result = SpendingAnalyzer(MagicMock(), ce).analyze_current_spending(config)
+
+        timeseries = result["compute"]["timeseries"]
+        assert len(timeseries) == 4
+        assert timeseries == sorted(timeseries, key=lambda p: p["timestamp"])
+        # 4 shard requests + 1 service validation request
+        assert ce.get_savings_plans_coverage.call_count == 5
+
+    def test_request_budget_caps_parallelism(self):
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def respond(**params):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            threading.Event().wait(0.01)
+            with lock:
+                in_flight -= 1
+            return {"SavingsPlansCoverages": []}
+
+        ce = MagicMock()
+        ce.get_savings_plans_coverage.side_effect = respond
+        config = {
+            **ALL_TYPES_CONFIG,
+            "lookback_hours": 48,
+            "coverage_shard_days": 1,
+            "ce_requests_per_second": 2,
+        }
+
+        SpendingAnalyzer(MagicMock(), ce).analyze_current_spending(config)
+
+        assert peak <= 2
+
+
+GROUPED_CONFIG = {**ALL_TYPES_CONFIG, "coverage_fetch_mode": "grouped"}
+
+
+class TestGroupedFetchMode:
+    def _grouped_ce(self):
+        return _paged_ce(
+            [
+                [
+                    _item("2026-01-01T01:00:00Z", 10.0, 4.0, COMPUTE_SP_SERVICES[0]),
+                    _item("2026-01-01T01:00:00Z", 5.0, 0.0, COMPUTE_SP_SERVICES[1]),
+                    _item("2026-01-01T01:00:00Z", 3.0, 1.0, DATABASE_SP_SERVICES[0]),
+                ],
+                [
+                    _item("2026-01-01T01:00:00Z", 2.0, 0.0, SAGEMAKER_SP_SERVICES[0]),
+                    _item("2026-01-01T01:00:00Z", 7.0, 0.0, "Amazon Brand New Service"),
+                ],
+            ]
+        )
+
+    def test_single_grouped_request_replaces_validation_and_per_type_calls(self):
+        ce = self._grouped_ce()
+
+        result = SpendingAnalyzer(MagicMock(), ce).analyze_current_spending(GROUPED_CONFIG)
+
+        calls = ce.get_savings_plans_coverage.call_args_list
+        assert len(calls) == 2  # one request, two pages
+        assert calls[0].kwargs["GroupBy"] == [{"Type": "DIMENSION", "Key": "SERVICE"}]
+        assert "Filter" not in calls[0].kwargs
+        assert result["compute"]["timeseries"][0]["total"] == 15.0
+        assert result["compute"]["timeseries"][0]["covered"] == 4.0
+        assert result["database"]["timeseries"][0]["total"] == 3.0
+        assert result["sagemaker"]["timeseries"][0]["total"] == 2.0
+        assert result["_unknown_services"] == ["Amazon Brand New Service"]
+
+    def test_disabled_types_are_dropped(self):
+        config = {**GROUPED_CONFIG, "enable_database_sp": False}
+
+        result = SpendingAnalyzer(MagicMock(), self._grouped_ce()).analyze_current_spending(config)
+
+        assert result["database"]["summary"]["avg_hourly_total"] == 0.0
+        assert result["compute"]["timeseries"][0]["total"] == 15.0
+
+    def test_matches_filtered_mode_totals(self):
+        grouped = SpendingAnalyzer(MagicMock(), self._grouped_ce()).analyze_current_spending(
+            GROUPED_CONFIG
+        )
+
+        def by_filter(**params):
+            services = set(params["Filter"]["Dimensions"]["Values"])
+            items = [
+                i
+                for page in self._grouped_ce().get_savings_plans_coverage.side_effect
+                for i in page["SavingsPlansCoverages"]
+                if i["Attributes"]["SERVICE"] in services
+            ]
+            return {"SavingsPlansCoverages": [{**i, "Attributes": {}} for i in items]}
+
+        ce = MagicMock()
+        ce.get_savings_plans_coverage.side_effect = lambda **p: (
+            {"SavingsPlansCoverages": []} if "GroupBy" in p else by_filter(**p)
+        )
+        filtered = SpendingAnalyzer(MagicMock(), ce).analyze_current_spending(ALL_TYPES_CONFIG)
+
+        for sp_type in ("compute", "database", "sagemaker"):
+            assert grouped[sp_type]["summary"] == filtered[sp_type]["summary"]
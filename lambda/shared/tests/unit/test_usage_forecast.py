@@ -0,0 +1,74 @@
+"""Unit tests for shared.usage_forecast."""
+
+import random
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from shared.usage_forecast import SeasonalForecast, forecast_hourly_costs
+
+
+START = datetime(2026, 1, 5, tzinfo=UTC)  # a Monday
+
+
+def _timeseries(values, start=START):
+    return [
+        {"timestamp": (start + timedelta(hours=i)).isoformat(), "total": value}
+        for i, value in enumerate(values)
+    ]
+
+
+def _business_hours(hour_of_week):
+    day, hour = divmod(hour_of_week, 24)
+    return 30.0 if day < 5 and 8 <= hour < 18 else 10.0
+
+
+class TestSeasonalForecast:
+    def test_recovers_weekly_season(self):
+        rng = random.Random(0)
+        values = [_business_hours(h % 168) + rng.uniform(-1, 1) for h in range(4 * 168)]
+
+        projected = forecast_hourly_costs(_timeseries(values), days=7)
+
+        assert len(projected) == 168
+        for h, cost in enumerate(projected):
+            assert cost == pytest.approx(_business_hours(h), abs=1.5)
+
+    def test_aligns_on_hour_of_week(self):
+        # History starts on a Wednesday noon: the projection still lands weekdays correctly
+        start = START + timedelta(days=2, hours=12)
+        offset = 2 * 24 + 12
+        values = [_business_hours((offset + h) % 168) for h in range(3 * 168)]
+
+        projected = forecast_hourly_costs(_timeseries(values, start), days=7)
+
+        assert projected == [_business_hours((offset + h) % 168) for h in range(168)]
+
+    def test_ignores_isolated_spikes(self):
+        values = [10.0] * (3 * 168)
+        values[200] = 500.0
+
+        forecast = SeasonalForecast.from_timeseries(_timeseries(values))
+
+        assert max(forecast.project(168)) == pytest.approx(10.0)
+
+    def test_recent_level_is_clamped(self):
+        values = [10.0] * (3 * 168) + [100.0] * 168
+
+        forecast = SeasonalForecast.from_timeseries(_timeseries(values))
+
+        assert forecast.level_factor == pytest.approx(2.0)
+
+    def test_short_histories(self):
+        assert forecast_hourly_costs([]) == []
+
+        daily = SeasonalForecast([float(h % 24) for h in range(48)])
+        assert daily.period == 24
+        assert daily.project(24) == [float(h) for h in range(24)]
+
+        flat = SeasonalForecast([4.0, 5.0, 6.0])
+        assert flat.period == 1
+        assert flat.project(3) == [5.0, 5.0, 5.0]
+
+        with pytest.raises(ValueError, match="empty"):
+            SeasonalForecast([])
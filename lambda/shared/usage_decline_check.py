@@ -8,6 +8,10 @@ Prevents over-committing to Savings Plans based on temporarily elevated usage
 Two checks:
 - Scheduling: blocks if recent (14d) avg is abnormally high vs long-term (90d) avg
 - Purchasing: blocks if usage dropped since scheduling (confirming the spike was temporary)
+
+Both windows are answered from a single daily series (see rolling_averages); the
+reporter passes the 365-day series it already fetched so the guard costs no
+extra Cost Explorer calls.
 """
 
 from __future__ import annotations
@@ -15,6 +19,7 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from shared.rolling_averages import RollingAverages
 from shared.spending_analyzer import SpendingAnalyzer
 
 
@@ -102,11 +107,11 @@ def check_usage_drop(
     return results
 
 
-def fetch_averages(
+def fetch_rolling_averages(
     analyzer: SpendingAnalyzer, lookback_days: int, config: dict[str, Any]
-) -> dict[str, float]:
+) -> RollingAverages:
     """
-    Fetch average hourly totals per SP type using SpendingAnalyzer.
+    Fetch one daily series covering lookback_days and index it for window averages.
 
     Always uses DAILY granularity since lookback may exceed 14 days (HOURLY limit).
     """
@@ -117,15 +122,46 @@ def fetch_averages(
     spending_data = analyzer.analyze_daily_spending(guard_config)
     spending_data.pop("_unknown_services", None)
 
-    return {sp_type: data["summary"]["avg_hourly_total"] for sp_type, data in spending_data.items()}
+    return RollingAverages.from_daily_spending(spending_data, lookback_days)
+
+
+def fetch_window_averages(
+    analyzer: SpendingAnalyzer,
+    windows: list[int],
+    config: dict[str, Any],
+    series: RollingAverages | None = None,
+) -> dict[int, dict[str, float]]:
+    """
+    Average hourly totals per SP type for each lookback window (in days).
+
+    Uses series when it covers the longest window, otherwise fetches a single
+    daily series for the longest window.
+
+    Returns:
+        {days: {sp_type: avg_hourly_total}}
+    """
+    longest = max(windows)
+    if series is None or not series.covers(longest):
+        series = fetch_rolling_averages(analyzer, longest, config)
+    return series.window_averages(windows)
+
+
+def fetch_averages(
+    analyzer: SpendingAnalyzer, lookback_days: int, config: dict[str, Any]
+) -> dict[str, float]:
+    """Fetch average hourly totals per SP type for a single lookback window."""
+    return fetch_window_averages(analyzer, [lookback_days], config)[lookback_days]
 
 
 def run_scheduling_spike_guard(
-    analyzer: SpendingAnalyzer, config: dict[str, Any]
+    analyzer: SpendingAnalyzer, config: dict[str, Any], series: RollingAverages | None = None
 ) -> tuple[dict[str, float], dict[str, dict[str, Any]]]:
     """
     Run spike guard at scheduling time: detect if recent usage is spiking vs baseline.
 
+    Both windows come from one daily series: series if it is long enough,
+    otherwise a single fetch covering the long window.
+
     Returns:
         (short_term_averages, guard_results) — short_term_averages is embedded in SQS messages
     """
@@ -138,8 +174,9 @@ def run_scheduling_spike_guard(
         f"threshold={threshold}%"
     )
 
-    long_term_avgs = fetch_averages(analyzer, long_days, config)
-    short_term_avgs = fetch_averages(analyzer, short_days, config)
+    averages = fetch_window_averages(analyzer, [long_days, short_days], config, series)
+    long_term_avgs = averages[long_days]
+    short_term_avgs = averages[short_days]
 
     guard_results = check_usage_spike(long_term_avgs, short_term_avgs, threshold)
 
@@ -66,11 +66,12 @@ def run_js_optimal_coverage(hourly_costs: list[float], savings_percentage: float
     const fs = require('fs');
     const jsCode = fs.readFileSync('{js_file}', 'utf-8');
 
-    // Execute the code to define functions
-    eval(jsCode);
+    // Functions live inside the CostCalculator module (IIFE); evaluate the file
+    // and take the module object as the completion value
+    const CostCalculator = eval(jsCode + '\\n;CostCalculator');
 
     // Call the function
-    const result = calculateOptimalCoverage(
+    const result = CostCalculator.calculateOptimalCoverage(
         {json.dumps(hourly_costs)},
         {savings_percentage}
     );
@@ -220,6 +221,28 @@ class TestOptimalCoverageParity:
         assert abs(python_result["max_net_savings"] - js_result["maxNetSavings"]) < self.TOLERANCE
 
 
+EXACT_SOLVER_CASES = [
+    ([45.2, 52.1, 48.7, 60.3, 55.8, 42.0, 38.5, 50.0, 65.2, 70.1] * 7, 34.8),
+    ([10.0, 100.0, 15.0, 95.0, 20.0, 90.0, 25.0, 85.0] * 10, 40.0),
+    ([50.0, 60.0, 55.0, 70.0, 65.0, 45.0] * 12, 10.0),
+    ([0.01, 0.02, 0.015, 0.025] * 24, 30.0),
+]
+
+
+class TestExactSolverAgainstJs:
+    """The exact solver must never lose to the JS grid, and stay within its discretization."""
+
+    @pytest.mark.parametrize(("hourly_costs", "savings_percentage"), EXACT_SOLVER_CASES)
+    def test_exact_within_grid_tolerance(self, hourly_costs, savings_percentage):
+        exact = calculate_optimal_coverage(hourly_costs, savings_percentage, method="exact")
+        js_result = run_js_optimal_coverage(hourly_costs, savings_percentage)
+
+        # Grid step is (max - min) / 100 and the savings slope is at most N per $/h
+        tolerance = len(hourly_costs) * (max(hourly_costs) - min(hourly_costs)) / 100
+        assert exact["max_net_savings"] >= js_result["maxNetSavings"] - 1e-9
+        assert exact["max_net_savings"] - js_result["maxNetSavings"] <= tolerance
+
+
 def test_node_availability():
     """Verify Node.js is available for cross-platform tests."""
     if not is_node_available():
@@ -0,0 +1,147 @@
+"""
+Numeric backend parity tests.
+
+Verifies that the NumPy kernels in shared/numeric_backend.py produce the same
+results as the pure-Python fallback, and that the optimizers built on them
+(optimal coverage, strategies, sweeps) agree across backends.
+
+NumPy is optional: comparisons are skipped when it is not installed; the
+pure-Python kernels are still checked against brute force.
+"""
+
+import random
+
+import pytest
+
+from shared import numeric_backend
+from shared.optimal_coverage import (
+    CostProfile,
+    calculate_optimal_coverage,
+    calculate_strategies,
+    calculate_strategy_sweep,
+    clear_strategy_cache,
+)
+
+
+requires_numpy = pytest.mark.skipif(
+    not numeric_backend.numpy_available(),
+    reason="NumPy not installed - backend parity tests require NumPy",
+)
+
+
+def _costs(seed: int, hours: int) -> list[float]:
+    rng = random.Random(seed)
+    return [
+        round((60.0 if 8 <= h % 24 < 18 else 25.0) * rng.uniform(0.7, 1.3), 4) for h in range(hours)
+    ]
+
+
+def _run_with(backend: str, compute):
+    previous = numeric_backend.get_backend()
+    numeric_backend.set_backend(backend)
+    clear_strategy_cache()
+    try:
+        return compute()
+    finally:
+        numeric_backend.set_backend(previous)
+        clear_strategy_cache()
+
+
+class TestPythonKernels:
+    """The fallback kernels against straightforward definitions."""
+
+    def test_sorted_with_suffix(self):
+        values = _costs(0, 100)
+
+        ordered, suffix = _run_with("python", lambda: numeric_backend.sorted_with_suffix(values))
+
+        assert ordered == sorted(values)
+        assert len(suffix) == len(values) + 1
+        assert suffix[-1] == 0.0
+        for i in (0, 17, 99):
+            assert suffix[i] == pytest.approx(sum(ordered[i:]))
+
+    def test_net_savings_match_definition(self):
+        costs = _costs(1, 168)
+        levels = [20.0, 35.5, 60.0, 90.0]
+        discount_factor = 0.7
+
+        def compute():
+            ordered, suffix = numeric_backend.sorted_with_suffix(costs)
+            return numeric_backend.net_savings_at(ordered, suffix, levels, discount_factor)
+
+        net_savings = _run_with("python", compute)
+
+        for level, net in zip(levels, net_savings, strict=True):
+            expected_spill = sum(max(0.0, c - level) for c in costs)
+            expected_net = sum(costs) - (level * discount_factor * len(costs) + expected_spill)
+            assert net == pytest.approx(expected_net)
+
+    def test_unknown_backend_rejected(self):
+        with pytest.raises(ValueError, match="backend must be one of"):
+            numeric_backend.set_backend("fortran")
+
+    @pytest.mark.skipif(numeric_backend.numpy_available(), reason="NumPy is installed")
+    def test_numpy_backend_requires_numpy(self):
+        assert numeric_backend.get_backend() == "python"
+        with pytest.raises(ValueError, match="not installed"):
+            numeric_backend.set_backend("numpy")
+
+
+@requires_numpy
+class TestBackendParity:
+    """NumPy and pure-Python backends give the same answers."""
+
+    # Tolerance for floating point comparison (0.01 = 1 cent)
+    TOLERANCE = 0.01
+
+    @pytest.mark.parametrize("hours", [24, 168, 2160])
+    def test_profile_is_identical(self, hours):
+        costs = _costs(hours, hours)
+
+        python = _run_with("python", lambda: CostProfile(costs))
+        vectorized = _run_with("numpy", lambda: CostProfile(costs))
+
+        assert vectorized.sorted_costs == python.sorted_costs
+        assert vectorized.suffix == python.suffix
+
+    def test_curve_is_identical(self):
+        costs = _costs(2, 720)
+
+        def compute():
+            profile = CostProfile(costs)
+            return profile.curve(0.72, 20.0, 80.0).to_dict()
+
+        assert _run_with("numpy", compute) == _run_with("python", compute)
+
+    @pytest.mark.parametrize("savings_percentage", [20.0, 27.5, 30.0, 45.0])
+    @pytest.mark.parametrize("method", ["grid", "exact"])
+    def test_optimal_coverage(self, savings_percentage, method):
+        costs = _costs(3, 2160)
+
+        def compute():
+            return calculate_optimal_coverage(costs, savings_percentage, method)
+
+        python = _run_with("python", compute)
+        vectorized = _run_with("numpy", compute)
+
+        increment = (max(costs) - min(costs)) / 100
+        assert abs(vectorized["coverage_hourly"] - python["coverage_hourly"]) <= increment
+        assert vectorized["max_net_savings"] == pytest.approx(python["max_net_savings"], rel=1e-9)
+        assert vectorized["percentiles"] == python["percentiles"]
+
+    def test_strategies_and_sweep(self):
+        costs = _costs(4, 720)
+
+        def compute():
+            return (
+                calculate_strategies(costs, 31.0),
+                calculate_strategy_sweep(costs, (15.5, 31.0, 47.5)),
+            )
+
+        python_strategies, python_sweep = _run_with("python", compute)
+        numpy_strategies, numpy_sweep = _run_with("numpy", compute)
+
+        for key, value in python_strategies.items():
+            assert abs(numpy_strategies[key] - value) < self.TOLERANCE
+        assert numpy_sweep == python_sweep
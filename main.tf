@@ -87,6 +87,7 @@ locals {
   target_strategy_type = (
     var.purchase_strategy.target.aws != null ? "aws" :
     var.purchase_strategy.target.static != null ? "static" :
+    var.purchase_strategy.target.budget != null ? "budget" :
     "dynamic"
   )
 
@@ -113,6 +114,13 @@ locals {
     85
   )
 
+  # Forecast horizon in days (dynamic risk_level = "forecast")
+  forecast_days = (
+    local.target_strategy_type == "dynamic" ?
+    var.purchase_strategy.target.dynamic.forecast_days :
+    7
+  )
+
   # Static commitment target ($/h)
   static_commitment = (
     local.target_strategy_type == "static" ?
@@ -120,6 +128,13 @@ locals {
     0
   )
 
+  # Budget: max new commitment per run across SP types ($/h)
+  budget_commitment = (
+    local.target_strategy_type == "budget" ?
+    var.purchase_strategy.target.budget.commitment :
+    0
+  )
+
   # Split strategy params
   fixed_step_percent = (
     local.split_strategy_type == "fixed_step" ?
@@ -159,6 +174,8 @@ locals {
   report_format      = try(var.reporting.format, "html")
   email_reports      = try(var.reporting.email_reports, false)
   include_debug_data = try(var.reporting.include_debug_data, false)
+  coverage_cache     = try(var.reporting.coverage_cache, false)
+  history_days       = try(var.reporting.history_days, 0)
 
   s3_lifecycle_transition_ia_days         = try(var.reporting.s3_lifecycle.transition_ia_days, 90)
   s3_lifecycle_transition_glacier_days    = try(var.reporting.s3_lifecycle.transition_glacier_days, 180)
@@ -182,14 +199,17 @@ locals {
   lambda_scheduler_memory_size     = try(var.lambda_config.scheduler.memory_mb, 128)
   lambda_scheduler_timeout         = try(var.lambda_config.scheduler.timeout, 300)
   lambda_scheduler_assume_role_arn = try(var.lambda_config.scheduler.assume_role_arn, null)
+  lambda_scheduler_layers          = try(var.lambda_config.scheduler.layers, [])
 
   lambda_purchaser_memory_size     = try(var.lambda_config.purchaser.memory_mb, 128)
   lambda_purchaser_timeout         = try(var.lambda_config.purchaser.timeout, 300)
   lambda_purchaser_assume_role_arn = try(var.lambda_config.purchaser.assume_role_arn, null)
+  lambda_purchaser_layers          = try(var.lambda_config.purchaser.layers, [])
 
   lambda_reporter_memory_size     = try(var.lambda_config.reporter.memory_mb, 128)
   lambda_reporter_timeout         = try(var.lambda_config.reporter.timeout, 300)
   lambda_reporter_assume_role_arn = try(var.lambda_config.reporter.assume_role_arn, null)
+  lambda_reporter_layers          = try(var.lambda_config.reporter.layers, [])
 
   # Purchase Strategy Settings (extract from nested object)
 
@@ -226,6 +246,7 @@ locals {
     SPIKE_GUARD_LONG_LOOKBACK_DAYS  = tostring(local.spike_guard_long_lookback_days)
     SPIKE_GUARD_SHORT_LOOKBACK_DAYS = tostring(local.spike_guard_short_lookback_days)
     SPIKE_GUARD_THRESHOLD_PERCENT   = tostring(local.spike_guard_threshold_percent)
+    COVERAGE_CACHE_BUCKET           = local.coverage_cache ? aws_s3_bucket.reports.id : ""
   }
 
   strategy_lambda_env = {
@@ -233,7 +254,9 @@ locals {
     SPLIT_STRATEGY_TYPE         = local.split_strategy_type
     DYNAMIC_RISK_LEVEL          = local.dynamic_risk_level
     PRUDENT_PERCENTAGE          = tostring(local.prudent_percentage)
+    FORECAST_DAYS               = tostring(local.forecast_days)
     STATIC_COMMITMENT           = tostring(local.static_commitment)
+    BUDGET_COMMITMENT           = tostring(local.budget_commitment)
     FIXED_STEP_PERCENT          = tostring(local.fixed_step_percent)
     MAX_PURCHASE_PERCENT        = tostring(local.max_purchase_percent)
     MIN_PURCHASE_PERCENT        = local.min_purchase_percent != null ? tostring(local.min_purchase_percent) : ""
@@ -243,5 +266,6 @@ locals {
     DATABASE_SP_PAYMENT_OPTION  = local.database_sp_payment_option
     SAGEMAKER_SP_TERM           = local.sagemaker_term
     SAGEMAKER_SP_PAYMENT_OPTION = local.sagemaker_payment_option
+    HISTORY_LOOKBACK_DAYS       = tostring(local.history_days)
   }
 }
@@ -116,6 +116,11 @@ resource "aws_s3_bucket_lifecycle_configuration" "reports" {
     id     = "cleanup-old-reports"
     status = "Enabled"
 
+    # Reports only: the coverage cache must stay readable (see rule below)
+    filter {
+      prefix = "savings-plans-report_"
+    }
+
     # Transition to cheaper storage after configured days
     transition {
       days          = local.s3_lifecycle_transition_ia_days
@@ -138,4 +143,20 @@ resource "aws_s3_bucket_lifecycle_configuration" "reports" {
       noncurrent_days = local.s3_lifecycle_noncurrent_expiration_days
     }
   }
+
+  # Coverage cache entries are read back on every run (lookbacks up to 400 days),
+  # so they never transition to Glacier, where reads fail with InvalidObjectState
+  rule {
+    id     = "coverage-cache"
+    status = "Enabled"
+
+    filter {
+      prefix = "coverage-cache/"
+    }
+
+    # The hourly history store is rewritten each run; drop superseded versions
+    noncurrent_version_expiration {
+      noncurrent_days = 1
+    }
+  }
 }
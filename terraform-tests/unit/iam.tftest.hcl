@@ -732,3 +732,44 @@ run "test_reporter_assume_role_policy_created" {
     error_message = "Reporter assume role policy should reference correct management account role ARN"
   }
 }
+
+# Test: Coverage cache policies not created by default
+run "test_coverage_cache_policies_not_created_by_default" {
+  command = plan
+
+  assert {
+    condition     = length(aws_iam_role_policy.scheduler_coverage_cache) == 0
+    error_message = "Scheduler coverage cache policy should not be created unless reporting.coverage_cache is true"
+  }
+
+  assert {
+    condition     = length(aws_iam_role_policy.purchaser_coverage_cache) == 0
+    error_message = "Purchaser coverage cache policy should not be created unless reporting.coverage_cache is true"
+  }
+}
+
+# Test: Coverage cache policies scoped to the coverage-cache/ prefix when enabled
+run "test_coverage_cache_policies_created" {
+  command = plan
+
+  variables {
+    reporting = {
+      coverage_cache = true
+    }
+  }
+
+  assert {
+    condition     = length(aws_iam_role_policy.scheduler_coverage_cache) == 1
+    error_message = "Scheduler coverage cache policy should be created when reporting.coverage_cache is true"
+  }
+
+  assert {
+    condition     = length(aws_iam_role_policy.purchaser_coverage_cache) == 1
+    error_message = "Purchaser coverage cache policy should be created when reporting.coverage_cache is true"
+  }
+
+  assert {
+    condition     = endswith(jsondecode(aws_iam_role_policy.scheduler_coverage_cache[0].policy).Statement[0].Resource, "/coverage-cache/*")
+    error_message = "Scheduler coverage cache policy should be limited to the coverage-cache/ prefix"
+  }
+}
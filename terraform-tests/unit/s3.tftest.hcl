@@ -207,6 +207,31 @@ run "test_s3_lifecycle_noncurrent_expiration" {
   }
 }
 
+# Test: S3 bucket lifecycle configuration - coverage cache never goes to Glacier
+run "test_s3_lifecycle_coverage_cache_rule" {
+  command = plan
+
+  assert {
+    condition     = aws_s3_bucket_lifecycle_configuration.reports.rule[0].filter[0].prefix == "savings-plans-report_"
+    error_message = "Report lifecycle rule should only apply to report objects"
+  }
+
+  assert {
+    condition     = aws_s3_bucket_lifecycle_configuration.reports.rule[1].id == "coverage-cache"
+    error_message = "S3 lifecycle should have a 'coverage-cache' rule"
+  }
+
+  assert {
+    condition     = aws_s3_bucket_lifecycle_configuration.reports.rule[1].filter[0].prefix == "coverage-cache/"
+    error_message = "Coverage cache rule should be filtered to the coverage-cache/ prefix"
+  }
+
+  assert {
+    condition     = length(aws_s3_bucket_lifecycle_configuration.reports.rule[1].transition) == 0
+    error_message = "Coverage cache entries should never transition storage class"
+  }
+}
+
 # Test: S3 bucket tags include common tags
 run "test_s3_bucket_tags" {
   command = plan
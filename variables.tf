@@ -9,24 +9,27 @@ variable "lambda_config" {
       enabled         = optional(bool, true)
       memory_mb       = optional(number, 128)
       timeout         = optional(number, 300)
-      assume_role_arn = optional(string)     # Role to assume for Cost Explorer and Savings Plans APIs (AWS Orgs)
-      error_alarm     = optional(bool, true) # Enable CloudWatch error alarm for this Lambda
+      assume_role_arn = optional(string)           # Role to assume for Cost Explorer and Savings Plans APIs (AWS Orgs)
+      error_alarm     = optional(bool, true)       # Enable CloudWatch error alarm for this Lambda
+      layers          = optional(list(string), []) # Lambda layer ARNs (e.g. NumPy to speed up coverage optimization)
     }), {})
 
     purchaser = optional(object({
       enabled         = optional(bool, true)
       memory_mb       = optional(number, 128)
       timeout         = optional(number, 300)
-      assume_role_arn = optional(string)     # Role to assume for Savings Plans purchase APIs (AWS Orgs)
-      error_alarm     = optional(bool, true) # Enable CloudWatch error alarm for this Lambda
+      assume_role_arn = optional(string)           # Role to assume for Savings Plans purchase APIs (AWS Orgs)
+      error_alarm     = optional(bool, true)       # Enable CloudWatch error alarm for this Lambda
+      layers          = optional(list(string), []) # Lambda layer ARNs (e.g. NumPy to speed up coverage optimization)
     }), {})
 
     reporter = optional(object({
       enabled         = optional(bool, true)
       memory_mb       = optional(number, 128)
       timeout         = optional(number, 300)
-      assume_role_arn = optional(string)     # Role to assume for Cost Explorer and Savings Plans APIs (AWS Orgs)
-      error_alarm     = optional(bool, true) # Enable CloudWatch error alarm for this Lambda
+      assume_role_arn = optional(string)           # Role to assume for Cost Explorer and Savings Plans APIs (AWS Orgs)
+      error_alarm     = optional(bool, true)       # Enable CloudWatch error alarm for this Lambda
+      layers          = optional(list(string), []) # Lambda layer ARNs (e.g. NumPy to speed up coverage optimization)
     }), {})
   })
   default = {}
@@ -46,10 +49,14 @@ variable "purchase_strategy" {
       dynamic = optional(object({
         risk_level         = string
         prudent_percentage = optional(number, 85)
+        forecast_days      = optional(number, 7) # Projection horizon for risk_level = "forecast"
       }))
       static = optional(object({
         commitment = number # Target hourly commitment in $/h
       }))
+      budget = optional(object({
+        commitment = number # Max new hourly commitment per run in $/h, shared across SP types
+      }))
     })
 
     split = object({
@@ -83,9 +90,9 @@ variable "purchase_strategy" {
   # Exactly one target must be defined
   validation {
     condition = (
-      length([for k in ["aws", "dynamic", "static"] : k if lookup(var.purchase_strategy.target, k, null) != null]) == 1
+      length([for k in ["aws", "dynamic", "static", "budget"] : k if lookup(var.purchase_strategy.target, k, null) != null]) == 1
     )
-    error_message = "Exactly one target strategy (aws, dynamic, or static) must be defined."
+    error_message = "Exactly one target strategy (aws, dynamic, static, or budget) must be defined."
   }
 
   # Exactly one split must be defined
@@ -108,6 +115,16 @@ variable "purchase_strategy" {
     error_message = "dynamic.prudent_percentage must be between 1 and 100."
   }
 
+  # dynamic.forecast_days validation
+  validation {
+    condition = (
+      var.purchase_strategy.target.dynamic != null ?
+      var.purchase_strategy.target.dynamic.forecast_days >= 1 && var.purchase_strategy.target.dynamic.forecast_days <= 90 :
+      true
+    )
+    error_message = "dynamic.forecast_days must be between 1 and 90."
+  }
+
   # static.commitment validation
   validation {
     condition = (
@@ -118,14 +135,24 @@ variable "purchase_strategy" {
     error_message = "static.commitment must be greater than 0."
   }
 
+  # budget.commitment validation
+  validation {
+    condition = (
+      var.purchase_strategy.target.budget != null ?
+      var.purchase_strategy.target.budget.commitment > 0 :
+      true
+    )
+    error_message = "budget.commitment must be greater than 0."
+  }
+
   # dynamic.risk_level validation
   validation {
     condition = (
       var.purchase_strategy.target.dynamic != null ?
-      contains(["prudent", "min_hourly", "optimal", "maximum"], var.purchase_strategy.target.dynamic.risk_level) :
+      contains(["prudent", "min_hourly", "optimal", "maximum", "forecast"], var.purchase_strategy.target.dynamic.risk_level) :
       true
     )
-    error_message = "dynamic.risk_level must be one of: prudent, min_hourly, optimal, maximum."
+    error_message = "dynamic.risk_level must be one of: prudent, min_hourly, optimal, maximum, forecast."
   }
 
   # fixed_step.step_percent validation
@@ -319,6 +346,8 @@ variable "reporting" {
     format             = optional(string, "html")
     email_reports      = optional(bool, false)
     include_debug_data = optional(bool, false)
+    coverage_cache     = optional(bool, false) # Cache finalized Cost Explorer coverage days in the reports bucket
+    history_days       = optional(number, 0)   # Hourly history served from the cache beyond the 14-day CE limit (requires coverage_cache)
 
     s3_lifecycle = optional(object({
       transition_ia_days         = optional(number, 90)
@@ -329,6 +358,15 @@ variable "reporting" {
   })
   default = {}
 
+  validation {
+    condition = (
+      try(var.reporting.history_days, 0) >= 0 &&
+      try(var.reporting.history_days, 0) <= 400 &&
+      (try(var.reporting.history_days, 0) == 0 || try(var.reporting.coverage_cache, false))
+    )
+    error_message = "history_days must be between 0 and 400 and requires coverage_cache = true."
+  }
+
   validation {
     condition     = contains(["html", "pdf", "json"], try(var.reporting.format, "html"))
     error_message = "report_format must be one of: html, pdf, json."